@@ -1,7 +1,104 @@
-"""DAG Resolver for feature dependencies using Python's graphlib."""
+"""DAG Resolver for feature dependencies.
 
+graphlib's TopologicalSorter.prepare() detects cycles and yields the
+execution waves once per feature set; that plan is shared through a bounded
+cache keyed by the resolver signature. Transitive closures are computed as
+integer bitsets over a CSR (compressed sparse row) adjacency, walked in
+wave order.
+"""
+
+from array import array
+from functools import lru_cache
 from graphlib import TopologicalSorter, CycleError
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, FrozenSet, Any, Optional, NamedTuple, Tuple
+
+
+# Ensemble de dépendances vide, partagé par toutes les features sans dépendance
+EMPTY_DEPS: FrozenSet[str] = frozenset()
+
+
+class _Plan(NamedTuple):
+    """Résultat immuable du tri topologique et de la validation d'un graphe.
+
+    Attributes:
+        waves: Vagues d'exécution (None si le graphe contient un cycle)
+        cycle_args: Arguments du CycleError (None si acyclique) ; jamais
+                    l'exception elle-même, qui accumulerait les frames de
+                    chaque raise
+        errors: Erreurs de validation
+    """
+    waves: Optional[Tuple[Tuple[str, ...], ...]]
+    cycle_args: Optional[tuple]
+    errors: Tuple[str, ...]
+
+
+@lru_cache(maxsize=32)
+def _plan_for(signature: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> _Plan:
+    """Prépare le tri topologique et valide le graphe décrit par une signature.
+
+    prepare() est l'étape coûteuse de graphlib (détection de cycles). Le
+    plan, immuable, est partagé par les resolvers de même signature ; le
+    cache est borné (les plans les moins récemment utilisés sont oubliés).
+
+    Args:
+        signature: Empreinte DAGResolver.signature ((id, dépendances), ...)
+
+    Returns:
+        Plan (vagues, arguments du cycle, erreurs)
+    """
+    graph = {fid: frozenset(deps) for fid, deps in signature}
+
+    # Même rang que DAGResolver._order : ordre de déclaration, puis les
+    # dépendances inexistantes par ordre alphabétique
+    order = {fid: i for i, fid in enumerate(graph)}
+    missing = sorted(set().union(*graph.values()) - order.keys())
+    for dep in missing:
+        order[dep] = len(order)
+
+    errors = []
+    for fid, deps in graph.items():
+        invalid = deps - graph.keys()
+        if invalid:
+            invalid_list = ", ".join(sorted(invalid))
+            errors.append(
+                f"Feature '{fid}' dépend de features inexistantes: {invalid_list}"
+            )
+
+    sorter = TopologicalSorter(graph)
+    try:
+        sorter.prepare()
+    except CycleError as e:
+        # Cycle signalé seulement si toutes les références sont valides
+        if not errors:
+            # CycleError contient le cycle dans args[1]
+            cycle_info = e.args[1] if len(e.args) > 1 else "cycle détecté"
+            errors.append(f"Cycle de dépendances détecté: {cycle_info}")
+        return _Plan(None, e.args, tuple(errors))
+
+    waves = []
+    while sorter.is_active():
+        # get_ready() retourne les nodes dont toutes les dépendances
+        # ont été marquées comme "done"
+        ready = list(sorter.get_ready())
+        if ready:
+            # Ordre de déclaration (comparaison d'entiers, pas de chaînes)
+            waves.append(tuple(sorted(ready, key=order.__getitem__)))
+            for node in ready:
+                sorter.done(node)
+    return _Plan(tuple(waves), None, tuple(errors))
+
+
+class FeatureView(NamedTuple):
+    """Vue compacte d'une feature, précalculée pour l'affichage.
+
+    Attributes:
+        name: Nom de la feature (son ID si absent)
+        depends_on: IDs des dépendances directes
+        estimated_tokens: Estimation de tokens (0 si absente)
+    """
+    name: str
+    depends_on: Tuple[str, ...]
+    estimated_tokens: int
 
 
 class DAGResolver:
@@ -15,7 +112,10 @@ class DAGResolver:
 
     Attributes:
         features (Dict[str, Dict]): Dictionnaire des features indexées par ID
-        graph (Dict[str, Set[str]]): Graphe de dépendances (feature_id -> set de dépendances)
+        graph (Dict[str, FrozenSet[str]]): Graphe de dépendances (feature_id -> dépendances)
+        feature_view (Dict[str, FeatureView]): Champs d'affichage précalculés par feature
+        signature (tuple): Empreinte (id, dépendances) des features, dans l'ordre
+        total_estimated_tokens (int): Somme des estimated_tokens des features
 
     Example:
         >>> features = [
@@ -43,17 +143,108 @@ class DAGResolver:
         self.features = {f["id"]: f for f in features}
         self.graph = self._build_graph()
 
-    def _build_graph(self) -> Dict[str, Set[str]]:
+        # Vues d'affichage et total des tokens estimés, en une seule passe
+        self.feature_view: Dict[str, FeatureView] = {}
+        self.total_estimated_tokens = 0
+        for fid, f in self.features.items():
+            view = FeatureView(
+                f.get("name", fid),
+                tuple(f.get("depends_on", [])),
+                f.get("estimated_tokens", 0)
+            )
+            self.feature_view[fid] = view
+            self.total_estimated_tokens += view.estimated_tokens
+
+        # Rang de déclaration de chaque feature, pour ordonner les vagues.
+        # Les dépendances inexistantes sont rangées après, par ordre alphabétique.
+        self._order: Dict[str, int] = {fid: i for i, fid in enumerate(self.features)}
+        for dep in sorted(set(self._reverse) - set(self._order)):
+            self._order[dep] = len(self._order)
+
+        # Ce rang sert aussi d'identifiant entier pour la forme compacte (CSR)
+        self._ids: List[str] = list(self._order)
+        self._adj_starts, self._adj_targets = self._build_csr()
+
+        # Tri topologique préparé une seule fois (voir _prepare), et partagé
+        # avec les autres resolvers de même signature
+        self.signature = tuple(
+            (fid, tuple(f.get("depends_on", ()))) for fid, f in self.features.items()
+        )
+        self._cycle_args: Optional[tuple] = None
+        self._waves: Optional[Tuple[Tuple[str, ...], ...]] = None
+        self._validation_errors: Tuple[str, ...] = ()
+        self._prepared = False
+
+        # Fermetures transitives déjà calculées (feature_id -> dépendances)
+        self._closure_cache: Dict[str, FrozenSet[str]] = {}
+        self._closure_bits: Optional[List[int]] = None
+        self._all_closures_done = False
+
+    def _build_graph(self) -> Dict[str, FrozenSet[str]]:
         """Construit le graphe de dépendances.
 
+        Les ensembles de dépendances identiques (typiquement l'ensemble vide)
+        sont internés : les features concernées partagent le même frozenset.
+        Construit aussi l'index inverse utilisé par get_dependents().
+
         Returns:
             Dictionnaire où chaque clé est un feature_id et la valeur
             est un ensemble des IDs de features dont il dépend.
         """
-        return {
-            f["id"]: set(f.get("depends_on", []))
-            for f in self.features.values()
-        }
+        interned: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        graph = {}
+        for fid, f in self.features.items():
+            deps = frozenset(f.get("depends_on", ()))
+            graph[fid] = interned.setdefault(deps, deps)
+
+        # Index inverse (dépendance -> features qui en dépendent)
+        self._reverse: Dict[str, Set[str]] = {fid: set() for fid in graph}
+        for fid, deps in graph.items():
+            for dep in deps:
+                self._reverse.setdefault(dep, set()).add(fid)
+
+        return graph
+
+    def _build_csr(self) -> Tuple[array, array]:
+        """Compile le graphe en tableaux d'entiers (format CSR).
+
+        Les dépendances du node d'indice u sont
+        targets[starts[u]:starts[u + 1]], chaque dépendance étant elle-même
+        un indice de self._ids. Les parcours internes (fermetures) se font
+        ainsi sur des entiers contigus plutôt que sur des sets de chaînes.
+
+        Returns:
+            Tuple (starts, targets)
+        """
+        starts = array("l", [0])
+        targets = array("l")
+        for fid in self._ids:
+            for dep in self.graph.get(fid, ()):
+                targets.append(self._order[dep])
+            starts.append(len(targets))
+        return starts, targets
+
+    def _prepare(self) -> None:
+        """Récupère le plan (vagues, cycle, erreurs) une seule fois.
+
+        Le plan est calculé par _plan_for(), qui le met en cache pour tous
+        les resolvers de même signature : validate() et
+        get_execution_waves() ne paient prepare() qu'une fois.
+        """
+        if self._prepared:
+            return
+        self._prepared = True
+        self._waves, self._cycle_args, self._validation_errors = _plan_for(self.signature)
+
+    def _raise_if_cyclic(self) -> None:
+        """Lève un CycleError neuf si le graphe contient un cycle.
+
+        Raises:
+            CycleError: Si le graphe contient un cycle
+        """
+        self._prepare()
+        if self._cycle_args is not None:
+            raise CycleError(*self._cycle_args)
 
     def validate(self) -> List[str]:
         """Valide le graphe de dépendances.
@@ -62,39 +253,25 @@ class DAGResolver:
         1. Que toutes les dépendances référencées existent
         2. Qu'il n'y a pas de cycles dans le graphe
 
+        Le résultat est mis en cache : les appels suivants ne refont ni la
+        vérification des références ni la détection de cycles.
+
         Returns:
             Liste des erreurs trouvées. Liste vide si tout est valide.
         """
-        errors = []
-
-        # Vérifier les références invalides
-        all_ids = set(self.features.keys())
-        for fid, deps in self.graph.items():
-            invalid = deps - all_ids
-            if invalid:
-                invalid_list = ", ".join(sorted(invalid))
-                errors.append(
-                    f"Feature '{fid}' dépend de features inexistantes: {invalid_list}"
-                )
-
-        # Vérifier les cycles (seulement si pas de références invalides)
-        if not errors:
-            try:
-                sorter = TopologicalSorter(self.graph)
-                sorter.prepare()
-            except CycleError as e:
-                # CycleError contient le cycle dans args[1]
-                cycle_info = e.args[1] if len(e.args) > 1 else "cycle détecté"
-                errors.append(f"Cycle de dépendances détecté: {cycle_info}")
-
-        return errors
+        self._prepare()
+        return list(self._validation_errors)
 
     def get_execution_waves(self) -> List[List[str]]:
         """Calcule les vagues d'exécution parallèles.
 
         Utilise TopologicalSorter.get_ready() pour identifier à chaque
         étape quelles features peuvent s'exécuter en parallèle (celles
-        dont toutes les dépendances sont satisfaites).
+        dont toutes les dépendances sont satisfaites). Le tri n'est
+        préparé qu'une fois : les appels suivants réutilisent le cache.
+
+        Dans chaque vague, les features sont listées dans leur ordre de
+        déclaration.
 
         Returns:
             Liste de vagues, où chaque vague est une liste de feature IDs
@@ -107,20 +284,26 @@ class DAGResolver:
             Pour le graphe: A → [], B → [A], C → [A], D → [B, C]
             Retourne: [["A"], ["B", "C"], ["D"]]
         """
-        sorter = TopologicalSorter(self.graph)
-        sorter.prepare()
+        self._raise_if_cyclic()
+
+        # Copie défensive : l'appelant peut modifier les listes retournées
+        return [list(wave) for wave in self._waves]
 
-        waves = []
-        while sorter.is_active():
-            # get_ready() retourne les nodes dont toutes les dépendances
-            # ont été marquées comme "done"
-            ready = list(sorter.get_ready())
-            if ready:
-                waves.append(sorted(ready))  # Tri pour cohérence
-                for node in ready:
-                    sorter.done(node)
+    @property
+    def waves(self) -> Tuple[Tuple[str, ...], ...]:
+        """Vagues d'exécution en cache, sans copie (lecture seule).
 
-        return waves
+        Raises:
+            CycleError: Si le graphe contient un cycle
+        """
+        self._raise_if_cyclic()
+        return self._waves
+
+    @property
+    def errors(self) -> Tuple[str, ...]:
+        """Erreurs de validation en cache, sans copie (lecture seule)."""
+        self._prepare()
+        return self._validation_errors
 
     def get_feature(self, feature_id: str) -> Dict[str, Any]:
         """Récupère une feature par son ID.
@@ -133,16 +316,17 @@ class DAGResolver:
         """
         return self.features.get(feature_id)
 
-    def get_dependencies(self, feature_id: str) -> Set[str]:
+    def get_dependencies(self, feature_id: str) -> FrozenSet[str]:
         """Récupère les dépendances directes d'une feature.
 
         Args:
             feature_id: L'identifiant de la feature
 
         Returns:
-            Ensemble des IDs des features dont dépend cette feature
+            Ensemble (immuable, potentiellement partagé) des IDs des
+            features dont dépend cette feature
         """
-        return self.graph.get(feature_id, set())
+        return self.graph.get(feature_id, EMPTY_DEPS)
 
     def get_dependents(self, feature_id: str) -> Set[str]:
         """Récupère les features qui dépendent de cette feature.
@@ -153,15 +337,93 @@ class DAGResolver:
         Returns:
             Ensemble des IDs des features qui dépendent de cette feature
         """
-        dependents = set()
-        for fid, deps in self.graph.items():
-            if feature_id in deps:
-                dependents.add(fid)
-        return dependents
+        return set(self._reverse.get(feature_id, ()))
+
+    def _closure_bitsets(self) -> List[int]:
+        """Calcule la fermeture transitive de chaque node sous forme de bitset.
+
+        Parcourt les nodes dans l'ordre topologique (les vagues) : quand un
+        node est traité, la fermeture de chacune de ses dépendances est déjà
+        connue, il suffit donc de les unir. Chaque arête de la forme CSR
+        n'est visitée qu'une fois, et chaque union est un OR d'entiers
+        (bit i = self._ids[i]). Le résultat est mis en cache.
+
+        Returns:
+            Liste des bitsets, indexée comme self._ids
+
+        Raises:
+            CycleError: Si le graphe contient un cycle
+        """
+        if self._closure_bits is None:
+            self._raise_if_cyclic()
+
+            order = self._order
+            starts = self._adj_starts
+            targets = self._adj_targets
+            bits = [0] * len(self._ids)
+
+            for wave in self._waves:
+                for fid in wave:
+                    u = order[fid]
+                    closure = 0
+                    for k in range(starts[u], starts[u + 1]):
+                        v = targets[k]
+                        closure |= bits[v] | (1 << v)
+                    bits[u] = closure
+
+            self._closure_bits = bits
+
+        return self._closure_bits
+
+    def _decode_closure(self, closure: int) -> FrozenSet[str]:
+        """Convertit un bitset de fermeture en ensemble d'IDs.
+
+        Args:
+            closure: Bitset produit par _closure_bitsets()
+
+        Returns:
+            frozenset des IDs dont le bit est positionné
+        """
+        ids = self._ids
+        members = []
+        while closure:
+            low = closure & -closure
+            members.append(ids[low.bit_length() - 1])
+            closure ^= low
+        return frozenset(members)
+
+    def compute_all_closures(self) -> Dict[str, FrozenSet[str]]:
+        """Calcule les dépendances transitives de toutes les features en un passage.
+
+        Voir _closure_bitsets() pour l'algorithme.
+
+        Returns:
+            Dictionnaire feature_id -> frozenset de toutes ses dépendances,
+            pour les seules features déclarées (pas les dépendances inexistantes)
+
+        Raises:
+            CycleError: Si le graphe contient un cycle
+        """
+        # Les features déclarées occupent les premiers indices de self._ids
+        declared = self._ids[:len(self.features)]
+        if not self._all_closures_done:
+            bits = self._closure_bitsets()
+            for fid, closure in zip(declared, bits):
+                if fid not in self._closure_cache:
+                    self._closure_cache[fid] = self._decode_closure(closure)
+            self._all_closures_done = True
+
+        return {fid: self._closure_cache[fid] for fid in declared}
 
     def get_all_dependencies(self, feature_id: str) -> Set[str]:
         """Récupère toutes les dépendances (directes et transitives) d'une feature.
 
+        Sur un graphe acyclique, les bitsets de toutes les fermetures sont
+        calculés au premier appel, et seule la fermeture demandée est
+        convertie en ensemble d'IDs. Sinon, les fermetures sont mémorisées
+        au fil des appels : une dépendance dont la fermeture est déjà connue
+        n'est pas re-parcourue, sa fermeture est réutilisée.
+
         Args:
             feature_id: L'identifiant de la feature
 
@@ -169,13 +431,36 @@ class DAGResolver:
             Ensemble de tous les IDs des features dont dépend cette feature,
             directement ou indirectement
         """
-        all_deps = set()
-        to_process = list(self.get_dependencies(feature_id))
-
-        while to_process:
-            dep = to_process.pop()
-            if dep not in all_deps:
-                all_deps.add(dep)
-                to_process.extend(self.get_dependencies(dep))
-
-        return all_deps
+        cached = self._closure_cache.get(feature_id)
+        if cached is None:
+            self._prepare()
+            index = self._order.get(feature_id)
+
+            if self._cycle_args is None and index is not None:
+                closure = self._closure_bitsets()[index]
+                cached = self._decode_closure(closure)
+            else:
+                # Graphe cyclique ou feature inconnue : parcours explicite.
+                # Un node n'est empilé qu'à sa découverte (jamais deux fois).
+                all_deps = set(self.get_dependencies(feature_id))
+                to_process = list(all_deps)
+
+                while to_process:
+                    dep = to_process.pop()
+                    known = self._closure_cache.get(dep)
+                    if known is not None:
+                        # Fermeture déjà complète : inutile de la parcourir
+                        all_deps |= known
+                        continue
+                    new_deps = self.get_dependencies(dep) - all_deps
+                    all_deps |= new_deps
+                    to_process.extend(new_deps)
+
+                cached = frozenset(all_deps)
+
+            # Seules les features déclarées sont mémorisées
+            if feature_id in self.features:
+                self._closure_cache[feature_id] = cached
+
+        # Copie : l'appelant peut modifier l'ensemble retourné
+        return set(cached)
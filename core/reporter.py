@@ -1,18 +1,66 @@
 """Reporter pour affichage de progression et génération de rapports."""
 
 import json
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, IO, List, Dict, Any, Union
 from datetime import datetime
 from pathlib import Path
 
-from core.runner import ClaudeResult
+from core.dag import FeatureView
 
+if TYPE_CHECKING:  # annotations seulement : évite d'importer asyncio via runner
+    from core.runner import ClaudeResult
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : repli sur json (stdlib)
+    orjson = None
+
+
+def _json_default(obj: Any) -> str:
+    """Encode les datetime en ISO 8601 pour json (stdlib)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(data: Any, target: Union[Path, IO[bytes]]):
+    """Écrit des données JSON indentées (UTF-8) dans un fichier.
+
+    Utilise orjson (extension C) s'il est installé, sinon json de la stdlib.
+    Dans les deux cas le document est sérialisé en un seul buffer puis
+    écrit en une fois (json.dump écrirait fragment par fragment).
+
+    Les datetime peuvent être passés tels quels : orjson les encode
+    nativement (même format que isoformat() pour des datetime naïfs),
+    json via _json_default.
+
+    Args:
+        data: Données sérialisables en JSON (datetime acceptés)
+        target: Chemin du fichier de sortie, ou flux binaire ouvert
+                (par exemple io.BytesIO) dans lequel écrire
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(
+            data, indent=2, ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+
+    if hasattr(target, "write"):
+        target.write(payload)
+    else:
+        Path(target).write_bytes(payload)
+
+
+@dataclass(frozen=True)
 class ExecutionReport:
     """Rapport d'exécution complet.
 
+    Immuable et sans __dict__ (__slots__).
+
     Attributes:
         project_name: Nom du projet
         started_at: Date/heure de début
@@ -22,10 +70,18 @@ class ExecutionReport:
         failed: Nombre de features échouées
         total_cost_usd: Coût total en USD
         total_duration_ms: Durée totale en millisecondes
-        waves: Structure des vagues d'exécution
+        waves: Structure des vagues d'exécution (numéro, features, durée
+               de la feature la plus lente en ms)
         branches_created: Liste des branches créées avec succès
         errors: Liste des erreurs rencontrées
     """
+    # __slots__ explicite : dataclass(slots=True) demande Python 3.10+
+    __slots__ = (
+        "project_name", "started_at", "finished_at", "total_features",
+        "successful", "failed", "total_cost_usd", "total_duration_ms",
+        "waves", "branches_created", "errors",
+    )
+
     project_name: str
     started_at: datetime
     finished_at: datetime
@@ -38,12 +94,28 @@ class ExecutionReport:
     branches_created: List[str]
     errors: List[Dict[str, str]]
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convertit en dictionnaire pour sérialisation JSON."""
-        data = asdict(self)
-        data["started_at"] = self.started_at.isoformat()
-        data["finished_at"] = self.finished_at.isoformat()
-        return data
+    def to_dict(self, iso_dates: bool = True) -> Dict[str, Any]:
+        """Convertit en dictionnaire pour sérialisation JSON.
+
+        Les listes sont copiées superficiellement (pas de deepcopy via asdict).
+
+        Args:
+            iso_dates: Si False, les datetime sont laissés tels quels (pour un
+                       sérialiseur qui les encode nativement, comme orjson)
+        """
+        return {
+            "project_name": self.project_name,
+            "started_at": self.started_at.isoformat() if iso_dates else self.started_at,
+            "finished_at": self.finished_at.isoformat() if iso_dates else self.finished_at,
+            "total_features": self.total_features,
+            "successful": self.successful,
+            "failed": self.failed,
+            "total_cost_usd": self.total_cost_usd,
+            "total_duration_ms": self.total_duration_ms,
+            "waves": list(self.waves),
+            "branches_created": list(self.branches_created),
+            "errors": list(self.errors),
+        }
 
 
 class Reporter:
@@ -54,6 +126,18 @@ class Reporter:
         results: Liste des résultats accumulés
     """
 
+    PROGRESS_ICONS = {
+        "started": "🚀",
+        "completed": "✅",
+        "failed": "❌"
+    }
+
+    # Lignes de progression pré-formatées (horodatage, feature_id)
+    _PROGRESS_TEMPLATES = {
+        status: f"  [{{}}] {icon} {{}}: {status}\n"
+        for status, icon in PROGRESS_ICONS.items()
+    }
+
     def __init__(self, verbose: bool = True):
         """Initialise le reporter.
 
@@ -61,42 +145,47 @@ class Reporter:
             verbose: Active l'affichage détaillé
         """
         self.verbose = verbose
-        self.results: List[ClaudeResult] = []
+        self.results: List["ClaudeResult"] = []
 
-    def display_dag(self, waves: List[List[str]], features: Dict[str, Dict]):
+    def display_dag(self, waves: List[List[str]], features: Dict[str, FeatureView]):
         """Affiche le DAG avant exécution.
 
         Args:
             waves: Vagues d'exécution calculées
-            features: Dictionnaire des features (id -> feature dict)
+            features: Vues des features (DAGResolver.feature_view)
         """
-        print("\n" + "═" * 60)
-        print("  PLAN D'EXÉCUTION")
-        print("═" * 60)
+        # Construire toute la sortie puis l'écrire en une fois
+        lines = [
+            "\n" + "═" * 60,
+            "  PLAN D'EXÉCUTION",
+            "═" * 60,
+        ]
 
         total_features = sum(len(wave) for wave in waves)
-        print(f"\n  📊 {total_features} features en {len(waves)} vagues")
+        lines.append(f"\n  📊 {total_features} features en {len(waves)} vagues")
 
         for i, wave in enumerate(waves, 1):
             parallel_marker = " [PARALLÈLE]" if len(wave) > 1 else ""
-            print(f"\n  VAGUE {i}{parallel_marker}")
-            print("  " + "─" * 40)
+            lines.append(f"\n  VAGUE {i}{parallel_marker}")
+            lines.append("  " + "─" * 40)
 
             for fid in wave:
-                feature = features.get(fid, {})
-                deps = feature.get("depends_on", [])
-                name = feature.get("name", fid)
+                view = features.get(fid)
+                if view is None:
+                    name, deps, estimated = fid, (), 0
+                else:
+                    name, deps, estimated = view
 
-                deps_str = f"← attend {deps}" if deps else "← aucune dépendance"
+                deps_str = f"← attend {list(deps)}" if deps else "← aucune dépendance"
 
-                print(f"  │ {fid}: {name}")
+                lines.append(f"  │ {fid}: {name}")
                 if self.verbose:
-                    print(f"  │   {deps_str}")
-                    estimated = feature.get("estimated_tokens", 0)
+                    lines.append(f"  │   {deps_str}")
                     if estimated:
-                        print(f"  │   ~{estimated:,} tokens")
+                        lines.append(f"  │   ~{estimated:,} tokens")
 
-        print("\n" + "═" * 60)
+        lines.append("\n" + "═" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_progress(self, feature_id: str, status: str):
         """Affiche la progression en temps réel.
@@ -105,18 +194,19 @@ class Reporter:
             feature_id: ID de la feature
             status: Statut ("started", "completed", "failed")
         """
-        icons = {
-            "started": "🚀",
-            "completed": "✅",
-            "failed": "❌"
-        }
-        icon = icons.get(status, "⏳")
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Message masqué : ne pas calculer l'horodatage pour rien
+        if not self.verbose and status == "started":
+            return
 
-        if self.verbose or status != "started":
-            print(f"  [{timestamp}] {icon} {feature_id}: {status}")
+        ts = time.strftime("%H:%M:%S")
+        template = self._PROGRESS_TEMPLATES.get(status)
+        if template is None:
+            # Statut libre : jamais interprété comme un format
+            sys.stdout.write(f"  [{ts}] ⏳ {feature_id}: {status}\n")
+            return
+        sys.stdout.write(template.format(ts, feature_id))
 
-    def add_result(self, result: ClaudeResult):
+    def add_result(self, result: "ClaudeResult"):
         """Ajoute un résultat à la liste.
 
         Args:
@@ -124,7 +214,7 @@ class Reporter:
         """
         self.results.append(result)
 
-    def add_results(self, results: List[ClaudeResult]):
+    def add_results(self, results: List["ClaudeResult"]):
         """Ajoute plusieurs résultats.
 
         Args:
@@ -145,31 +235,75 @@ class Reporter:
 
         Returns:
             ExecutionReport complet
+
+        Raises:
+            ValueError: Si aucun résultat (ou aucun horodatage) n'est disponible
         """
         if not self.results:
             raise ValueError("Aucun résultat à reporter")
 
-        successful = sum(1 for r in self.results if r.success)
-        failed = len(self.results) - successful
-        total_cost = sum(r.cost_usd for r in self.results)
-        total_duration = sum(r.duration_ms for r in self.results)
+        # Branches des features réussies, construites d'un bloc hors de la
+        # boucle d'agrégation
+        branches = [f"feature/{r.feature_id}" for r in self.results if r.success]
+        successful = len(branches)
+
+        # Agrégation en un seul passage sur les résultats ; la méthode
+        # appelée à chaque échec est liée une fois hors de la boucle
+        durations: Dict[str, int] = {}
+        total_cost = 0.0
+        total_duration = 0
+        errors = []
+        add_error = errors.append
+        first = None  # Résultat démarré le plus tôt (horloge monotone)
+        last = None   # Résultat terminé le plus tard (horloge monotone)
+        missing_ns = False
+
+        for r in self.results:
+            if not r.success:
+                add_error(
+                    {"feature_id": r.feature_id, "error": r.error or "Unknown error"}
+                )
+
+            total_cost += r.cost_usd
+            total_duration += r.duration_ms
+            durations[r.feature_id] = r.duration_ms
+
+            # Timestamps : comparaison d'entiers monotones quand disponibles
+            if r.started_ns is None or r.finished_ns is None:
+                missing_ns = True
+            elif not missing_ns:
+                if first is None or r.started_ns < first.started_ns:
+                    first = r
+                if last is None or r.finished_ns > last.finished_ns:
+                    last = r
+
+        if missing_ns:
+            # Résultats construits hors run_single() : repli sur les datetime
+            started_at = min(
+                (r.started_at for r in self.results if r.started_at), default=None
+            )
+            finished_at = max(
+                (r.finished_at for r in self.results if r.finished_at), default=None
+            )
+        else:
+            started_at = first.started_at
+            finished_at = last.finished_at
+
+        if started_at is None or finished_at is None:
+            raise ValueError("Aucun horodatage dans les résultats")
 
-        branches = [
-            f"feature/{r.feature_id}"
-            for r in self.results
-            if r.success
-        ]
+        failed = len(self.results) - successful
 
-        errors = [
-            {"feature_id": r.feature_id, "error": r.error or "Unknown error"}
-            for r in self.results
-            if not r.success
+        # Durée de chaque vague = sa feature la plus lente (chemin critique)
+        wave_entries = [
+            {
+                "wave": i,
+                "features": w,
+                "duration_ms": max((durations.get(fid, 0) for fid in w), default=0)
+            }
+            for i, w in enumerate(waves, 1)
         ]
 
-        # Timestamps
-        started_at = min(r.started_at for r in self.results if r.started_at)
-        finished_at = max(r.finished_at for r in self.results if r.finished_at)
-
         return ExecutionReport(
             project_name=project_name,
             started_at=started_at,
@@ -179,7 +313,7 @@ class Reporter:
             failed=failed,
             total_cost_usd=total_cost,
             total_duration_ms=total_duration,
-            waves=[{"wave": i, "features": w} for i, w in enumerate(waves, 1)],
+            waves=wave_entries,
             branches_created=branches,
             errors=errors
         )
@@ -190,14 +324,15 @@ class Reporter:
         Args:
             report: Rapport d'exécution
         """
-        print("\n" + "═" * 60)
-        print("  RAPPORT D'EXÉCUTION")
-        print("═" * 60)
-
+        # Construire toute la sortie puis l'écrire en une fois
         duration_min = report.total_duration_ms / 60000
         wall_time = (report.finished_at - report.started_at).total_seconds() / 60
 
-        print(f"""
+        lines = [
+            "\n" + "═" * 60,
+            "  RAPPORT D'EXÉCUTION",
+            "═" * 60,
+            f"""
   Projet         : {report.project_name}
   Durée totale   : {duration_min:.1f} minutes (temps CPU)
   Durée réelle   : {wall_time:.1f} minutes (wall time)
@@ -207,56 +342,54 @@ class Reporter:
     ✅ Succès     : {report.successful}
     ❌ Échecs     : {report.failed}
 
-  Vagues         : {len(report.waves)}""")
+  Vagues         : {len(report.waves)}""",
+        ]
 
         if report.branches_created:
-            print("\n  Branches créées :")
-            for branch in report.branches_created:
-                print(f"    • {branch}")
+            lines.append("\n  Branches créées :")
+            lines.extend(f"    • {branch}" for branch in report.branches_created)
 
         if report.errors:
-            print("\n  ❌ Erreurs :")
+            lines.append("\n  ❌ Erreurs :")
             for err in report.errors:
                 error_msg = err["error"]
                 # Tronquer si trop long
                 if len(error_msg) > 60:
                     error_msg = error_msg[:57] + "..."
-                print(f"    • {err['feature_id']}: {error_msg}")
-
-        # Speedup calculation
-        if len(report.waves) > 1:
-            sequential_time = report.total_features
-            parallel_time = len(report.waves)
-            speedup = sequential_time / parallel_time
-            print(f"\n  ⚡ Speedup théorique: {speedup:.1f}x")
-
-        print("\n" + "═" * 60)
-
-    def save_report(self, report: ExecutionReport, path: Path):
+                lines.append(f"    • {err['feature_id']}: {error_msg}")
+
+        # Speedup : somme des durées / chemin critique (max de chaque vague)
+        critical_path_ms = sum(w.get("duration_ms", 0) for w in report.waves)
+        if critical_path_ms > 0 and report.total_features > 1:
+            speedup = report.total_duration_ms / critical_path_ms
+            lines.append(f"\n  ⚡ Speedup théorique: {speedup:.1f}x")
+        elif len(report.waves) > 1:
+            # Durées inconnues : approximation à coût égal par feature
+            speedup = report.total_features / len(report.waves)
+            lines.append(f"\n  ⚡ Speedup théorique: {speedup:.1f}x")
+
+        lines.append("\n" + "═" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def save_report(self, report: ExecutionReport, path: Union[Path, IO[bytes]]):
         """Sauvegarde le rapport au format JSON.
 
         Args:
             report: Rapport d'exécution
-            path: Chemin du fichier de sortie
+            path: Chemin du fichier de sortie, ou flux binaire ouvert
 
         Raises:
             IOError: Si l'écriture échoue
         """
-        data = report.to_dict()
+        _write_json(report.to_dict(iso_dates=False), path)
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    def save_results(self, path: Path):
+    def save_results(self, path: Union[Path, IO[bytes]]):
         """Sauvegarde tous les résultats bruts au format JSON.
 
         Args:
-            path: Chemin du fichier de sortie
+            path: Chemin du fichier de sortie, ou flux binaire ouvert
         """
-        data = [r.to_dict() for r in self.results]
-
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_json([r.to_dict(iso_dates=False) for r in self.results], path)
 
     def display_summary(self):
         """Affiche un résumé rapide des résultats actuels."""
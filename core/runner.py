@@ -2,17 +2,206 @@
 
 import asyncio
 import json
+import shutil
 import subprocess
+import time
 from pathlib import Path
-from typing import Optional, List, Callable, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, List, Callable, Dict, Any, Tuple, AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : repli sur json (stdlib)
+    orjson = None
 
-@dataclass
+
+# Parseur JSON de la sortie Claude : accepte directement les bytes du pipe.
+# orjson.JSONDecodeError et json.JSONDecodeError dérivent de ValueError.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Taille des blocs lus sur les pipes du processus Claude
+READ_CHUNK_SIZE = 64 * 1024
+
+# Seul le début de stderr est conservé (utilisé pour les messages d'erreur)
+STDERR_LIMIT = 64 * 1024
+
+# Nombre d'octets de stdout repris dans ClaudeResult.result en cas d'erreur
+OUTPUT_HEAD_SIZE = 500
+
+
+async def _read_stream(
+    stream: asyncio.StreamReader,
+    limit: Optional[int] = None
+) -> bytes:
+    """Lit un flux par blocs jusqu'à EOF.
+
+    Args:
+        stream: Flux à lire (stdout ou stderr du processus)
+        limit: Nombre max d'octets conservés (None = tout).
+               Le reste est lu puis ignoré pour ne pas bloquer le processus.
+
+    Returns:
+        Les octets lus (tronqués à limit si fourni)
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        if limit is None:
+            buffer += chunk
+        elif len(buffer) < limit:
+            buffer += chunk[:limit - len(buffer)]
+    return bytes(buffer)
+
+
+async def _iter_lines(stream: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Itère sur les lignes d'un flux lu par blocs (sans le saut de ligne final).
+
+    Contrairement à StreamReader.readline(), aucune limite de longueur de
+    ligne ; seule la ligne en cours est gardée en mémoire.
+
+    Args:
+        stream: Flux à lire
+
+    Yields:
+        Chaque ligne du flux
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        # Ne chercher le séparateur que dans les octets nouvellement reçus
+        newline = chunk.find(b"\n")
+        if newline < 0:
+            buffer += chunk
+            continue
+        newline += len(buffer)
+        buffer += chunk
+        start = 0
+        while newline >= 0:
+            yield bytes(buffer[start:newline])
+            start = newline + 1
+            newline = buffer.find(b"\n", start)
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _read_result_event(
+    stream: asyncio.StreamReader
+) -> Tuple[Optional[Dict[str, Any]], bytes]:
+    """Lit une sortie stream-json (NDJSON) et en extrait l'événement final.
+
+    Chaque ligne est parsée dès sa réception ; seul le dernier événement
+    {"type": "result", ...} est conservé.
+
+    Args:
+        stream: stdout du processus Claude
+
+    Returns:
+        Tuple (événement result ou None, début brut de la sortie pour
+        les messages d'erreur)
+    """
+    result = None
+    head = bytearray()
+    async for line in _iter_lines(stream):
+        if len(head) < OUTPUT_HEAD_SIZE:
+            head += line[:OUTPUT_HEAD_SIZE - len(head)]
+        if not line.strip():
+            continue
+        try:
+            event = _json_loads(line)
+        except ValueError:
+            continue  # Ligne non JSON : ignorée
+        if isinstance(event, dict) and event.get("type") == "result":
+            result = event
+    return result, bytes(head)
+
+
+async def _collect_stream_output(
+    process: asyncio.subprocess.Process
+) -> Tuple[Optional[Dict[str, Any]], bytes, bytes]:
+    """Variante de _collect_output pour --output-format stream-json.
+
+    Args:
+        process: Processus lancé avec stdout/stderr en PIPE
+
+    Returns:
+        Tuple (événement result ou None, début de stdout, stderr)
+    """
+    (result, head), stderr = await asyncio.gather(
+        _read_result_event(process.stdout),
+        _read_stream(process.stderr, STDERR_LIMIT)
+    )
+    await process.wait()
+    return result, head, stderr
+
+
+async def _collect_output(process: asyncio.subprocess.Process) -> Tuple[bytes, bytes]:
+    """Lit stdout et stderr en parallèle puis attend la fin du processus.
+
+    Contrairement à communicate(), stderr est borné à STDERR_LIMIT octets.
+
+    Args:
+        process: Processus lancé avec stdout/stderr en PIPE
+
+    Returns:
+        Tuple (stdout, stderr)
+    """
+    stdout, stderr = await asyncio.gather(
+        _read_stream(process.stdout),
+        _read_stream(process.stderr, STDERR_LIMIT)
+    )
+    await process.wait()
+    return stdout, stderr
+
+
+# Probes réussis, par binaire. Les échecs (binaire absent, timeout, code
+# de retour non nul) ne sont pas mémorisés : ils peuvent être passagers
+_PROBE_CACHE: Dict[str, Tuple[bool, Optional[str]]] = {}
+
+
+def _probe_binary(claude_binary: str) -> Tuple[bool, Optional[str]]:
+    """Lance `<claude_binary> --version` (succès mémorisé par binaire).
+
+    Partagé par toutes les instances de ClaudeRunner : le binaire ne change
+    pas en cours de run. Un échec est retenté au prochain appel.
+
+    Args:
+        claude_binary: Nom ou chemin du binaire Claude
+
+    Returns:
+        Tuple (disponible, version ou None)
+    """
+    cached = _PROBE_CACHE.get(claude_binary)
+    if cached is not None:
+        return cached
+
+    try:
+        result = subprocess.run(
+            [claude_binary, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False, None
+
+    if result.returncode != 0:
+        return False, None
+    probe = _PROBE_CACHE[claude_binary] = (True, result.stdout.strip() or None)
+    return probe
+
+
+@dataclass(frozen=True, init=False)
 class ClaudeResult:
     """Résultat d'une exécution Claude.
 
+    Immuable et sans __dict__ (__slots__).
+
     Attributes:
         feature_id: Identifiant de la feature
         success: True si l'exécution a réussi
@@ -24,27 +213,98 @@ class ClaudeResult:
         started_at: Date/heure de début
         finished_at: Date/heure de fin
         num_turns: Nombre de tours de conversation
+        started_ns: Début en horloge monotone (time.monotonic_ns), non sérialisé
+        finished_ns: Fin en horloge monotone (time.monotonic_ns), non sérialisé
+
+    started_ns et finished_ns ne sont pas des champs de la dataclass : un
+    slot ne peut pas porter de field(repr=False, compare=False), ils sont
+    donc de simples slots sans annotation. Ils sont absents de repr(), de
+    == et de dataclasses.fields() ; dataclasses.replace() ne les recopie
+    pas (le résultat les a à None). Ils ne servent qu'à l'agrégation des
+    durées du Reporter, sur les résultats tels que produits par le runner.
     """
+    # __slots__ explicite : dataclass(slots=True) demande Python 3.10+. Un
+    # slot ne peut pas avoir de valeur par défaut (ni de field()) au niveau
+    # de la classe : les défauts sont portés par __init__ (init=False)
+    __slots__ = (
+        "feature_id", "success", "result", "cost_usd", "duration_ms",
+        "session_id", "error", "started_at", "finished_at", "num_turns",
+        "started_ns", "finished_ns",
+    )
+
     feature_id: str
     success: bool
     result: str
     cost_usd: float
     duration_ms: int
     session_id: str
-    error: Optional[str] = None
-    started_at: Optional[datetime] = None
-    finished_at: Optional[datetime] = None
-    num_turns: int = 0
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convertit en dictionnaire (pour sérialisation JSON)."""
-        data = asdict(self)
-        # Convertir les datetime en ISO format
-        if self.started_at:
-            data["started_at"] = self.started_at.isoformat()
-        if self.finished_at:
-            data["finished_at"] = self.finished_at.isoformat()
-        return data
+    error: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    num_turns: int
+    # started_ns / finished_ns : slots sans annotation (voir la docstring) ;
+    # __slots__, les annotations et __init__ sont tenus synchronisés par
+    # test_result_slots_match_init
+
+    def __init__(
+        self,
+        feature_id: str,
+        success: bool,
+        result: str,
+        cost_usd: float,
+        duration_ms: int,
+        session_id: str,
+        error: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        num_turns: int = 0,
+        started_ns: Optional[int] = None,
+        finished_ns: Optional[int] = None,
+    ):
+        # frozen=True : affectation directe interdite, comme dans le
+        # __init__ que génère dataclass
+        set_attr = object.__setattr__
+        set_attr(self, "feature_id", feature_id)
+        set_attr(self, "success", success)
+        set_attr(self, "result", result)
+        set_attr(self, "cost_usd", cost_usd)
+        set_attr(self, "duration_ms", duration_ms)
+        set_attr(self, "session_id", session_id)
+        set_attr(self, "error", error)
+        set_attr(self, "started_at", started_at)
+        set_attr(self, "finished_at", finished_at)
+        set_attr(self, "num_turns", num_turns)
+        set_attr(self, "started_ns", started_ns)
+        set_attr(self, "finished_ns", finished_ns)
+
+    def to_dict(self, iso_dates: bool = True) -> Dict[str, Any]:
+        """Convertit en dictionnaire (pour sérialisation JSON).
+
+        Construit le dictionnaire champ par champ plutôt que via asdict(),
+        qui copie récursivement chaque valeur.
+
+        Args:
+            iso_dates: Si False, les datetime sont laissés tels quels (pour un
+                       sérialiseur qui les encode nativement, comme orjson)
+        """
+        if not iso_dates:
+            started_at, finished_at = self.started_at, self.finished_at
+        else:
+            started_at = self.started_at.isoformat() if self.started_at else None
+            finished_at = self.finished_at.isoformat() if self.finished_at else None
+
+        return {
+            "feature_id": self.feature_id,
+            "success": self.success,
+            "result": self.result,
+            "cost_usd": self.cost_usd,
+            "duration_ms": self.duration_ms,
+            "session_id": self.session_id,
+            "error": self.error,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "num_turns": self.num_turns,
+        }
 
 
 class ClaudeRunner:
@@ -59,6 +319,8 @@ class ClaudeRunner:
         allowed_tools: Liste des outils autorisés
         timeout_seconds: Timeout par exécution
         semaphore: Semaphore asyncio pour limiter le parallélisme
+        fail_fast: Si True, le premier échec d'une vague annule les autres features
+        output_format: Format de sortie demandé à Claude ("json" ou "stream-json")
 
     Example:
         >>> runner = ClaudeRunner(max_parallel=3)
@@ -76,13 +338,20 @@ class ClaudeRunner:
         "Bash(pytest)", "Bash(python -m pytest)"
     ]
 
+    # "json" : un seul document en fin d'exécution, parsé d'un bloc.
+    # "stream-json" : un événement JSON par ligne, parsé au fil de l'eau ;
+    # la mémoire reste bornée par la plus longue ligne.
+    OUTPUT_FORMATS = ("json", "stream-json")
+
     def __init__(
         self,
         max_parallel: int = 3,
         permission_mode: str = "acceptEdits",
         allowed_tools: Optional[List[str]] = None,
         timeout_seconds: int = 1800,  # 30 min par défaut
-        claude_binary: str = "claude"
+        claude_binary: str = "claude",
+        fail_fast: bool = False,
+        output_format: str = "json"
     ):
         """Initialise le runner.
 
@@ -92,13 +361,39 @@ class ClaudeRunner:
             allowed_tools: Liste des outils autorisés (None = défaut)
             timeout_seconds: Timeout par feature en secondes
             claude_binary: Chemin vers le binaire claude (défaut: "claude" dans PATH)
+            fail_fast: Annule les features restantes d'une vague dès le premier échec
+            output_format: "json" (défaut) ou "stream-json"
+
+        Raises:
+            ValueError: Si output_format est inconnu
         """
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format '{output_format}' "
+                f"(expected one of {', '.join(self.OUTPUT_FORMATS)})"
+            )
+
         self.max_parallel = max_parallel
         self.permission_mode = permission_mode
         self.allowed_tools = allowed_tools or self.DEFAULT_ALLOWED_TOOLS
         self.timeout_seconds = timeout_seconds
+        # Le timeout ne change pas après construction : message et durée
+        # rapportée en cas de dépassement calculés une fois
+        self._timeout_error = f"Timeout après {timeout_seconds}s"
+        self._timeout_ms = timeout_seconds * 1000
         self.claude_binary = claude_binary
         self.semaphore = asyncio.Semaphore(max_parallel)
+        self.fail_fast = fail_fast
+        self.output_format = output_format
+
+        # Options invariantes de la ligne de commande, calculées une fois
+        # en tuple immuable (en mode -p, stream-json exige --verbose)
+        self._cmd_options = (
+            "--output-format", output_format,
+            *(("--verbose",) if output_format == "stream-json" else ()),
+            "--permission-mode", self.permission_mode,
+            "--allowedTools", ",".join(self.allowed_tools)
+        )
 
     async def run_single(
         self,
@@ -121,38 +416,42 @@ class ClaudeRunner:
             ClaudeResult avec le résultat de l'exécution
         """
         started_at = datetime.now()
+        started_ns = time.monotonic_ns()
 
-        # Construire la commande
-        cmd = [
-            self.claude_binary,
-            "-p", prompt,
-            "--output-format", "json",
-            "--permission-mode", self.permission_mode,
-            "--allowedTools", ",".join(self.allowed_tools)
-        ]
-
+        # Options propres à l'appel ; le reste de la commande est précalculé
+        extra_options = ()
         if session_id:
-            cmd.extend(["--resume", session_id])
-
+            extra_options += ("--resume", session_id)
         if append_system_prompt:
-            cmd.extend(["--append-system-prompt", append_system_prompt])
+            extra_options += ("--append-system-prompt", append_system_prompt)
 
+        process = None
         try:
             # Lancer le processus de manière asynchrone
             process = await asyncio.create_subprocess_exec(
-                *cmd,
+                self.claude_binary, "-p", prompt,
+                *self._cmd_options, *extra_options,
                 cwd=worktree_path,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
 
-            # Attendre la fin avec timeout
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout_seconds
-            )
+            # Lire la sortie par blocs et attendre la fin avec timeout
+            # (stream-json : événements parsés au fil de la lecture)
+            result_json = None
+            if self.output_format == "stream-json":
+                result_json, stdout, stderr = await asyncio.wait_for(
+                    _collect_stream_output(process),
+                    timeout=self.timeout_seconds
+                )
+            else:
+                stdout, stderr = await asyncio.wait_for(
+                    _collect_output(process),
+                    timeout=self.timeout_seconds
+                )
 
             finished_at = datetime.now()
+            finished_ns = time.monotonic_ns()
 
             # Gérer les erreurs de processus
             if process.returncode != 0:
@@ -163,25 +462,33 @@ class ClaudeRunner:
                     cost_usd=0.0,
                     duration_ms=0,
                     session_id="",
-                    error=stderr.decode().strip() or "Process returned non-zero exit code",
+                    error=stderr.decode(errors="replace").strip() or "Process returned non-zero exit code",
                     started_at=started_at,
-                    finished_at=finished_at
+                    finished_at=finished_at,
+                    started_ns=started_ns,
+                    finished_ns=finished_ns
                 )
 
-            # Parser le JSON output
+            # Parser le JSON output (déjà fait en stream-json)
             try:
-                result_json = json.loads(stdout.decode())
-            except json.JSONDecodeError as e:
+                if self.output_format == "stream-json":
+                    if result_json is None:
+                        raise ValueError("no result event in stream-json output")
+                else:
+                    result_json = _json_loads(stdout)
+            except ValueError as e:
                 return ClaudeResult(
                     feature_id=feature_id,
                     success=False,
-                    result=stdout.decode()[:500],  # Premiers 500 chars
+                    result=stdout.decode(errors="replace")[:OUTPUT_HEAD_SIZE],
                     cost_usd=0.0,
                     duration_ms=0,
                     session_id="",
                     error=f"JSON parse error: {e}",
                     started_at=started_at,
-                    finished_at=finished_at
+                    finished_at=finished_at,
+                    started_ns=started_ns,
+                    finished_ns=finished_ns
                 )
 
             # Construire le résultat
@@ -194,25 +501,37 @@ class ClaudeRunner:
                 session_id=result_json.get("session_id", ""),
                 started_at=started_at,
                 finished_at=finished_at,
+                started_ns=started_ns,
+                finished_ns=finished_ns,
                 num_turns=result_json.get("num_turns", 0)
             )
 
+        except asyncio.CancelledError:
+            # Annulation (fail_fast) : ne pas laisser tourner le processus Claude
+            if process is not None and process.returncode is None:
+                process.kill()
+            raise
+
         except asyncio.TimeoutError:
             finished_at = datetime.now()
+            finished_ns = time.monotonic_ns()
             return ClaudeResult(
                 feature_id=feature_id,
                 success=False,
                 result="",
                 cost_usd=0.0,
-                duration_ms=self.timeout_seconds * 1000,
+                duration_ms=self._timeout_ms,
                 session_id="",
-                error=f"Timeout après {self.timeout_seconds}s",
+                error=self._timeout_error,
                 started_at=started_at,
-                finished_at=finished_at
+                finished_at=finished_at,
+                started_ns=started_ns,
+                finished_ns=finished_ns
             )
 
         except FileNotFoundError:
             finished_at = datetime.now()
+            finished_ns = time.monotonic_ns()
             return ClaudeResult(
                 feature_id=feature_id,
                 success=False,
@@ -222,11 +541,14 @@ class ClaudeRunner:
                 session_id="",
                 error=f"Claude binary '{self.claude_binary}' not found in PATH",
                 started_at=started_at,
-                finished_at=finished_at
+                finished_at=finished_at,
+                started_ns=started_ns,
+                finished_ns=finished_ns
             )
 
         except Exception as e:
             finished_at = datetime.now()
+            finished_ns = time.monotonic_ns()
             return ClaudeResult(
                 feature_id=feature_id,
                 success=False,
@@ -236,9 +558,151 @@ class ClaudeRunner:
                 session_id="",
                 error=f"Unexpected error: {type(e).__name__}: {e}",
                 started_at=started_at,
-                finished_at=finished_at
+                finished_at=finished_at,
+                started_ns=started_ns,
+                finished_ns=finished_ns
             )
 
+    async def run_one(
+        self,
+        worktree_path: Path,
+        prompt: str,
+        feature_id: str,
+        on_progress: Optional[Callable[[str, str], None]] = None
+    ) -> ClaudeResult:
+        """Exécute une feature en respectant la limite de parallélisme.
+
+        Permet de lancer chaque feature dès que son worktree est prêt,
+        sans attendre le reste de la vague.
+
+        Args:
+            worktree_path: Chemin vers le worktree
+            prompt: Prompt à envoyer à Claude
+            feature_id: Identifiant de la feature
+            on_progress: Callback optionnel pour suivi de progression
+
+        Returns:
+            ClaudeResult avec les informations d'exécution
+        """
+        async with self.semaphore:
+            if on_progress:
+                on_progress(feature_id, "started")
+
+            result = await self.run_single(worktree_path, prompt, feature_id)
+
+            if on_progress:
+                status = "completed" if result.success else "failed"
+                on_progress(feature_id, status)
+
+            return result
+
+    async def _iter_wave(
+        self,
+        tasks: List[tuple],
+        on_progress: Optional[Callable[[str, str], None]] = None
+    ) -> AsyncIterator[Tuple[int, ClaudeResult]]:
+        """Exécute les tasks et produit (index, résultat) dès qu'une finit.
+
+        Un pool de min(max_parallel, len(tasks)) workers se partage la liste
+        des tasks : le nombre de tasks asyncio reste borné par max_parallel,
+        quelle que soit la taille de la vague. Les résultats remontent par
+        une asyncio.Queue, dans l'ordre de fin d'exécution.
+
+        Les workers encore actifs sont annulés si l'itération est interrompue.
+        En mode fail_fast, le premier échec annule aussi les tasks restantes
+        (en cours ou non démarrées), qui reçoivent un résultat d'échec
+        synthétique.
+
+        Args:
+            tasks: Liste de tuples (worktree_path, prompt, feature_id)
+            on_progress: Callback optionnel pour suivi de progression
+        """
+        todo = iter(enumerate(tasks))  # partagé : chaque task n'est prise qu'une fois
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            """Exécute les tasks suivantes jusqu'à épuisement de la liste."""
+            for index, (worktree_path, prompt, feature_id) in todo:
+                try:
+                    result = await self.run_one(worktree_path, prompt, feature_id, on_progress)
+                except Exception as e:
+                    # Remonté au consommateur (sinon il attendrait indéfiniment)
+                    result = e
+                finished.put_nowait((index, result))
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(self.max_parallel, len(tasks)))
+        ]
+
+        yielded = set()
+        aborted = False
+        try:
+            for _ in range(len(tasks)):
+                index, result = await finished.get()
+                if isinstance(result, Exception):
+                    raise result
+                yielded.add(index)
+                yield index, result
+
+                if self.fail_fast and not result.success:
+                    aborted = True
+                    break
+        finally:
+            for task in workers:
+                if not task.done():
+                    task.cancel()
+
+        if aborted:
+            # Attendre la fin des annulations (libère le semaphore)
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            # Terminées entre-temps : garder leur vrai résultat
+            while not finished.empty():
+                index, result = finished.get_nowait()
+                if not isinstance(result, Exception):
+                    yielded.add(index)
+                    yield index, result
+
+            for index, (_, _, feature_id) in enumerate(tasks):
+                if index in yielded:
+                    continue
+                if on_progress:
+                    on_progress(feature_id, "failed")
+                yield index, ClaudeResult(
+                    feature_id=feature_id,
+                    success=False,
+                    result="",
+                    cost_usd=0.0,
+                    duration_ms=0,
+                    session_id="",
+                    error="Annulé suite à l'échec d'une autre feature de la vague"
+                )
+
+    async def run_wave_iter(
+        self,
+        tasks: List[tuple],  # (worktree_path, prompt, feature_id)
+        on_progress: Optional[Callable[[str, str], None]] = None
+    ) -> AsyncIterator[ClaudeResult]:
+        """Exécute une vague en parallèle et produit les résultats au fil de l'eau.
+
+        Contrairement à run_wave(), chaque résultat est disponible dès que
+        sa feature termine, sans attendre les plus lentes.
+
+        Args:
+            tasks: Liste de tuples (worktree_path, prompt, feature_id)
+            on_progress: Callback optionnel pour suivi de progression
+
+        Yields:
+            ClaudeResult dans l'ordre de fin d'exécution
+
+        Example:
+            >>> async for result in runner.run_wave_iter(tasks):
+            ...     reporter.add_result(result)
+        """
+        async for _, result in self._iter_wave(tasks, on_progress):
+            yield result
+
     async def run_wave(
         self,
         tasks: List[tuple],  # (worktree_path, prompt, feature_id)
@@ -246,7 +710,7 @@ class ClaudeRunner:
     ) -> List[ClaudeResult]:
         """Exécute une vague de features en parallèle.
 
-        Utilise un semaphore pour limiter le nombre d'exécutions simultanées.
+        Au plus max_parallel exécutions simultanées (pool de workers).
 
         Args:
             tasks: Liste de tuples (worktree_path, prompt, feature_id)
@@ -255,7 +719,7 @@ class ClaudeRunner:
                         Status: "started", "completed", "failed"
 
         Returns:
-            Liste des ClaudeResult pour chaque task
+            Liste des ClaudeResult pour chaque task, dans l'ordre des tasks
 
         Example:
             >>> tasks = [
@@ -264,29 +728,10 @@ class ClaudeRunner:
             ... ]
             >>> results = await runner.run_wave(tasks)
         """
-
-        async def run_with_semaphore(worktree_path, prompt, feature_id):
-            """Exécute une task avec le semaphore."""
-            async with self.semaphore:
-                if on_progress:
-                    on_progress(feature_id, "started")
-
-                result = await self.run_single(worktree_path, prompt, feature_id)
-
-                if on_progress:
-                    status = "completed" if result.success else "failed"
-                    on_progress(feature_id, status)
-
-                return result
-
-        # Créer les coroutines pour toutes les tasks
-        coroutines = [
-            run_with_semaphore(wt, prompt, fid)
-            for wt, prompt, fid in tasks
-        ]
-
-        # Exécuter en parallèle avec gather
-        return await asyncio.gather(*coroutines)
+        results: List[Optional[ClaudeResult]] = [None] * len(tasks)
+        async for index, result in self._iter_wave(tasks, on_progress):
+            results[index] = result
+        return results
 
     async def run_sequential(
         self,
@@ -320,37 +765,56 @@ class ClaudeRunner:
 
         return results
 
+    def probe(self) -> Tuple[bool, Optional[str]]:
+        """Vérifie la disponibilité de Claude et récupère sa version.
+
+        Un seul appel à `claude --version` sert les deux informations ;
+        un succès est mis en cache par binaire, pour tout le processus
+        (voir clear_probe_cache()). Un échec est retenté à l'appel suivant.
+
+        Returns:
+            Tuple (disponible, version ou None)
+        """
+        return _probe_binary(self.claude_binary)
+
+    def is_installed(self) -> bool:
+        """Vérifie que le binaire Claude est trouvable et exécutable.
+
+        Simple recherche dans le PATH (shutil.which), sans lancer de
+        processus : `claude --version` n'est exécuté que si la version
+        est demandée (probe()), et le premier run_single suffit à
+        détecter un binaire défaillant.
+
+        Returns:
+            True si le binaire est dans le PATH (ou le chemin est exécutable)
+        """
+        return shutil.which(self.claude_binary) is not None
+
     def check_claude_available(self) -> bool:
         """Vérifie que le binaire Claude est disponible.
 
+        Le résultat est mis en cache (voir probe()).
+
         Returns:
             True si Claude est dans le PATH et exécutable
         """
-        try:
-            result = subprocess.run(
-                [self.claude_binary, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return self.probe()[0]
 
     def get_claude_version(self) -> Optional[str]:
         """Récupère la version de Claude Code installée.
 
+        Le résultat est mis en cache (voir probe()).
+
         Returns:
             Version string ou None si indisponible
         """
-        try:
-            result = subprocess.run(
-                [self.claude_binary, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        return None
+        return self.probe()[1]
+
+    @classmethod
+    def clear_probe_cache(cls):
+        """Oublie les résultats mis en cache de `claude --version` (tous binaires).
+
+        Utile si le binaire Claude est installé ou mis à jour en cours de
+        route, ou si le PATH change.
+        """
+        _PROBE_CACHE.clear()
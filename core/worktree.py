@@ -1,15 +1,52 @@
 """Git Worktree Manager pour isolation des features."""
 
+import os
 import subprocess
 import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
-from dataclasses import dataclass
+from typing import Optional, Dict, Iterator, List, NamedTuple, Set, Tuple
 
 
-@dataclass
-class WorktreeInfo:
-    """Information sur un worktree actif.
+# Libellés de `git worktree list --porcelain` -> clés des dicts retournés
+_PORCELAIN_KEYS = {"worktree": "path", "branch": "branch", "HEAD": "head"}
+
+
+# CLAUDE.md simplifié écrit dans chaque worktree
+_CLAUDE_MD_TEMPLATE = """# CLAUDE.md - Worktree Feature
+
+## Current Feature
+
+**Feature ID:** {feature_id}
+**Branch:** feature/{feature_id}
+**Worktree:** {worktree_path}
+
+## Context
+
+This is an isolated worktree created by RoRchestrator for parallel development.
+
+**Your task:** Implement the feature as described in the prompt.
+
+**Focus:** Work only on this feature. Other features are being developed in parallel in separate worktrees.
+
+## Important
+
+- Create the files and code as specified in the prompt
+- Write tests for your implementation
+- Commit your changes when done
+- Do NOT work on other features
+- Do NOT modify files outside the scope of this feature
+
+## Project Structure
+
+See the main README.md for overall project structure and conventions.
+"""
+
+
+class WorktreeInfo(NamedTuple):
+    """Information sur un worktree actif (immuable et hashable).
 
     Attributes:
         feature_id: Identifiant de la feature
@@ -21,6 +58,21 @@ class WorktreeInfo:
     branch_name: str
 
 
+def _scan_dir_names(path: Path) -> Iterator[str]:
+    """Itère sur les noms des sous-répertoires de path (un seul os.scandir).
+
+    Le type vient de l'entrée de répertoire (d_type), sans stat par entrée.
+    Un répertoire absent est traité comme vide.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry.name
+    except FileNotFoundError:
+        return
+
+
 class WorktreeError(Exception):
     """Exception levée lors d'erreurs de gestion des worktrees."""
     pass
@@ -44,17 +96,33 @@ class WorktreeManager:
         >>> manager.remove("auth-gtin")
     """
 
-    def __init__(self, repo_path: Path, worktrees_base: Optional[Path] = None):
+    CHECKOUT_STRATEGIES = ("default", "parallel")
+
+    def __init__(
+        self,
+        repo_path: Path,
+        worktrees_base: Optional[Path] = None,
+        checkout_strategy: str = "default"
+    ):
         """Initialise le manager de worktrees.
 
         Args:
             repo_path: Chemin vers le repo Git principal
             worktrees_base: Répertoire de base pour les worktrees.
                           Par défaut: ../worktrees/ (sibling du repo)
+            checkout_strategy: "default" (checkout séquentiel de git) ou
+                          "parallel" (checkout.workers sur tous les cœurs)
 
         Raises:
             WorktreeError: Si repo_path n'est pas un repo Git valide
+            ValueError: Si checkout_strategy est inconnue
         """
+        if checkout_strategy not in self.CHECKOUT_STRATEGIES:
+            raise ValueError(
+                f"checkout_strategy inconnue: '{checkout_strategy}' "
+                f"(attendu: {', '.join(self.CHECKOUT_STRATEGIES)})"
+            )
+
         self.repo_path = Path(repo_path).resolve()
 
         # Vérifier que c'est un repo Git
@@ -64,12 +132,34 @@ class WorktreeManager:
         self.worktrees_base = worktrees_base or self.repo_path.parent / "worktrees"
         self.worktrees_base.mkdir(exist_ok=True)
         self.active_worktrees: Dict[str, WorktreeInfo] = {}
+        # Index inverse branche -> feature_id, tenu à jour avec active_worktrees
+        self._branch_to_fid: Dict[str, str] = {}
+        self._verified_branches: Set[str] = set()
+        # Processus `git cat-file --batch-check` persistant (lancé à la demande)
+        self._catfile_proc: Optional[subprocess.Popen] = None
+        self._catfile_lock = threading.Lock()
+
+        # `git worktree add` lit les fichiers d'administration des autres
+        # worktrees : deux ajouts simultanés peuvent se voir à moitié écrits.
+        # Les ajouts passent donc un par un (verrou libre hors concurrence).
+        self._add_lock = threading.Lock()
+
+        # Options de checkout : la config -c passée à `git worktree add` est
+        # héritée par le `git reset --hard` interne qui peuple le worktree
+        self._checkout_options: List[str] = []
+        if checkout_strategy == "parallel":
+            # checkout.workers < 1 = un worker par cœur logique
+            self._checkout_options = [
+                "-c", "checkout.workers=0",
+                "-c", "checkout.thresholdForParallelism=1",
+            ]
 
     def create(
         self,
         feature_id: str,
         base_branch: str = "main",
-        force: bool = False
+        force: bool = False,
+        concurrent: bool = False
     ) -> Path:
         """Crée un worktree isolé pour une feature.
 
@@ -77,6 +167,9 @@ class WorktreeManager:
             feature_id: Identifiant de la feature
             base_branch: Branche de base pour créer la nouvelle branche
             force: Si True, supprime le worktree existant avant de créer
+            concurrent: True si d'autres créations tournent en même temps
+                        (threads) : l'enregistrement est sérialisé et le
+                        checkout fait à part, en parallèle des autres
 
         Returns:
             Chemin absolu vers le worktree créé
@@ -87,59 +180,391 @@ class WorktreeManager:
         Example:
             >>> path = manager.create("auth-gtin", base_branch="develop")
         """
-        worktree_path = self.worktrees_base / feature_id
+        self._verify_base_branch(base_branch)
+        return self._create_from_verified_base(feature_id, base_branch, force, concurrent)
+
+    async def create_async(
+        self,
+        feature_id: str,
+        base_branch: str = "main",
+        force: bool = False
+    ) -> Path:
+        """Crée un worktree sans bloquer la boucle asyncio.
+
+        Les commandes git sont lancées via asyncio : d'autres coroutines
+        (par exemple l'exécution de Claude sur un worktree déjà prêt)
+        avancent pendant la création.
+
+        Args:
+            feature_id: Identifiant de la feature
+            base_branch: Branche de base pour créer la nouvelle branche
+            force: Si True, supprime le worktree existant avant de créer
+                   (suppression synchrone)
+
+        Returns:
+            Chemin absolu vers le worktree créé
+
+        Raises:
+            WorktreeError: Si la création échoue
+        """
+        import asyncio  # import différé : inutile aux commandes synchrones
+
+        self._verify_base_branch(base_branch)
+        worktree_path, branch_name = self._prepare_create(feature_id, force)
+
+        await self._acquire_add_lock()
+        try:
+            returncode, stderr = await self._run_git_async(
+                self._add_args(worktree_path, branch_name, base_branch, checkout=False)
+            )
+        finally:
+            self._add_lock.release()
+        if returncode != 0:
+            raise WorktreeError(f"Erreur création worktree: {stderr}")
+
+        returncode, stderr = await self._run_git_async(self._checkout_args(worktree_path))
+        if returncode != 0:
+            await asyncio.to_thread(self._rollback_create, worktree_path, branch_name)
+            raise WorktreeError(f"Erreur checkout worktree: {stderr}")
+
+        self._finish_create(feature_id, worktree_path, branch_name)
+        return worktree_path
+
+    def create_many(
+        self,
+        feature_ids: List[str],
+        base_branch: str = "main",
+        force: bool = False,
+        max_workers: int = 4
+    ) -> List[Path]:
+        """Crée plusieurs worktrees en parallèle (typiquement une vague).
+
+        La branche de base n'est vérifiée qu'une fois, puis chaque
+        création est lancée dans un pool de threads : les enregistrements
+        `git worktree add --no-checkout` passent un par un (voir _add_lock),
+        les checkouts (la partie coûteuse) en parallèle.
+
+        Args:
+            feature_ids: Identifiants des features
+            base_branch: Branche de base pour créer les nouvelles branches
+            force: Si True, supprime les worktrees existants avant de créer
+            max_workers: Nombre max de créations simultanées
+
+        Returns:
+            Chemins des worktrees créés, dans l'ordre de feature_ids
+
+        Raises:
+            WorktreeError: Si une création échoue (les autres sont menées à terme)
+
+        Example:
+            >>> paths = manager.create_many(["auth", "api"], base_branch="main")
+        """
+        if not feature_ids:
+            return []
+
+        self._verify_base_branch(base_branch)
+
+        workers = max(1, min(max_workers, len(feature_ids), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._create_from_verified_base, fid, base_branch, force, True
+                )
+                for fid in feature_ids
+            ]
+
+        # Attendre toutes les créations avant de signaler la première erreur
+        paths = []
+        for future in futures:
+            paths.append(future.result())
+        return paths
+
+    def create_from_commit(
+        self,
+        feature_id: str,
+        commit_sha: str,
+        force: bool = False
+    ) -> Path:
+        """Crée un worktree dont la branche part d'un commit précis.
+
+        Aucune vérification préalable n'est lancée : `git worktree add`
+        résout lui-même le commit et échoue s'il est introuvable.
+
+        Args:
+            feature_id: Identifiant de la feature
+            commit_sha: Commit de départ de la nouvelle branche
+            force: Si True, supprime le worktree existant avant de créer
+
+        Returns:
+            Chemin absolu vers le worktree créé
+
+        Raises:
+            WorktreeError: Si la création échoue
+        """
+        return self._create_from_verified_base(feature_id, commit_sha, force)
+
+    def invalidate_branch_cache(self, branch: Optional[str] = None):
+        """Oublie les branches de base déjà vérifiées.
+
+        À appeler si des branches sont supprimées en dehors de ce manager.
+
+        Args:
+            branch: Branche à oublier (None = toutes)
+        """
+        if branch is None:
+            self._verified_branches.clear()
+        else:
+            self._verified_branches.discard(branch)
+
+    def _verify_base_branch(self, base_branch: str):
+        """Vérifie que la branche de base existe.
+
+        Le résultat positif est mis en cache : créer N worktrees depuis la
+        même base n'interroge git qu'une fois, via le processus
+        `git cat-file --batch-check` persistant.
+
+        Args:
+            base_branch: Nom de la branche (ou révision) à vérifier
+
+        Raises:
+            WorktreeError: Si la branche est introuvable
+        """
+        if base_branch in self._verified_branches:
+            return
+
+        if not self._object_exists(base_branch):
+            raise WorktreeError(f"Branche de base '{base_branch}' introuvable")
+
+        self._verified_branches.add(base_branch)
+
+    def _object_exists(self, rev: str) -> bool:
+        """Teste l'existence d'une révision via `git cat-file --batch-check`.
+
+        Le processus git est lancé au premier appel puis réutilisé : chaque
+        vérification n'est qu'un aller-retour sur un pipe, sans fork.
+
+        Args:
+            rev: Révision à résoudre (branche, tag, SHA...)
+
+        Returns:
+            True si la révision désigne un objet existant
+        """
+        if "\n" in rev:
+            return False
+
+        with self._catfile_lock:
+            proc = self._catfile_proc
+            if proc is None or proc.poll() is not None:
+                proc = self._catfile_proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check"],
+                    cwd=self.repo_path,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True
+                )
+            proc.stdin.write(f"{rev}\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+
+        # "<oid> <type> <taille>" si trouvé, "<rev> missing" / "<rev> ambiguous" sinon
+        parts = line.split()
+        return len(parts) == 3 and parts[2].isdigit()
+
+    def close(self):
+        """Arrête le processus `git cat-file` persistant s'il est lancé."""
+        with self._catfile_lock:
+            proc, self._catfile_proc = self._catfile_proc, None
+
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def __del__(self):
+        # Filet de sécurité si close() n'a pas été appelé
+        if getattr(self, "_catfile_proc", None) is not None:
+            self.close()
+
+    def _create_from_verified_base(
+        self,
+        feature_id: str,
+        base_branch: str,
+        force: bool,
+        concurrent: bool = False
+    ) -> Path:
+        """Crée un worktree, la branche de base ayant déjà été vérifiée.
+
+        Voir create() pour les arguments et exceptions.
+
+        Args:
+            concurrent: Si True, d'autres créations tournent en parallèle :
+                        seul l'enregistrement (rapide) est pris sous verrou,
+                        le checkout se fait ensuite hors verrou
+        """
+        worktree_path, branch_name = self._prepare_create(feature_id, force)
+
+        if concurrent:
+            with self._add_lock:
+                result = self._run_git(
+                    self._add_args(worktree_path, branch_name, base_branch, checkout=False)
+                )
+            if result.returncode != 0:
+                raise WorktreeError(f"Erreur création worktree: {result.stderr}")
+
+            result = self._run_git(self._checkout_args(worktree_path))
+            if result.returncode != 0:
+                self._rollback_create(worktree_path, branch_name)
+                raise WorktreeError(f"Erreur checkout worktree: {result.stderr}")
+
+            self._finish_create(feature_id, worktree_path, branch_name)
+            return worktree_path
+
+        # Créer le worktree avec nouvelle branche : un seul `git worktree add`
+        # (checkout et hook post-checkout compris)
+        with self._add_lock:
+            result = self._run_git(self._add_args(worktree_path, branch_name, base_branch))
+
+        if result.returncode != 0:
+            raise WorktreeError(f"Erreur création worktree: {result.stderr}")
+
+        self._finish_create(feature_id, worktree_path, branch_name)
+        return worktree_path
+
+    def _add_args(
+        self,
+        worktree_path: Path,
+        branch_name: str,
+        base: str,
+        checkout: bool = True
+    ) -> List[str]:
+        """Arguments de `git worktree add`.
+
+        Args:
+            worktree_path: Chemin du worktree à créer
+            branch_name: Branche à créer
+            base: Branche ou commit de départ
+            checkout: Si False, enregistrement seul (--no-checkout) ; le
+                      worktree est ensuite peuplé par _checkout_args
+
+        Returns:
+            Arguments passés à git (sans "git")
+        """
+        if checkout:
+            return [
+                *self._checkout_options,
+                "worktree", "add", "-b", branch_name, str(worktree_path), base
+            ]
+        return [
+            "worktree", "add", "--no-checkout",
+            "-b", branch_name, str(worktree_path), base
+        ]
+
+    def _checkout_args(self, worktree_path: Path) -> List[str]:
+        """Arguments du `git reset --hard` qui peuple un worktree enregistré.
+
+        Même commande que celle lancée en interne par `git worktree add`.
+
+        Args:
+            worktree_path: Chemin du worktree
+
+        Returns:
+            Arguments passés à git (sans "git")
+        """
+        return [
+            "-C", str(worktree_path), *self._checkout_options,
+            "reset", "--hard", "--quiet", "--no-recurse-submodules"
+        ]
+
+    def _rollback_create(self, worktree_path: Path, branch_name: str):
+        """Défait un worktree enregistré dont le checkout a échoué.
+
+        Supprime le worktree et sa branche, comme le ferait un
+        `git worktree add` en échec. Sous verrou : la suppression touche
+        les fichiers d'administration lus par les enregistrements en cours.
+
+        Args:
+            worktree_path: Chemin du worktree enregistré
+            branch_name: Branche créée avec lui
+        """
+        with self._add_lock:
+            self._run_git(["worktree", "remove", "--force", str(worktree_path)])
+            self._run_git(["branch", "-D", branch_name])
+
+    async def _acquire_add_lock(self):
+        """Prend _add_lock sans bloquer la boucle asyncio.
+
+        Le verrou est partagé avec les créations lancées dans des threads :
+        s'il est pris, l'attente se fait dans un thread. Si la tâche est
+        annulée pendant l'attente, le verrou est relâché dès que ce thread
+        l'obtient.
+        """
+        if self._add_lock.acquire(blocking=False):
+            return
+
+        import asyncio  # import différé : inutile aux commandes synchrones
+
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self._add_lock.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(lambda _: self._add_lock.release())
+            raise
+
+    def _prepare_create(self, feature_id: str, force: bool) -> Tuple[Path, str]:
+        """Prépare la création d'un worktree (libère la place si force=True).
+
+        Args:
+            feature_id: Identifiant de la feature
+            force: Si True, supprime le worktree existant et sa branche
+
+        Returns:
+            Tuple (chemin du worktree, nom de la branche à créer)
+
+        Raises:
+            WorktreeError: Si le worktree existe déjà et force=False
+        """
+        worktree_path, exists = self._probe(feature_id)
         branch_name = f"feature/{feature_id}"
 
         # Supprimer si existe déjà et force=True
-        if worktree_path.exists():
+        if exists:
             if force:
-                self.remove(feature_id, force=True)
-                # Supprimer aussi la branche si elle existe
-                subprocess.run(
-                    ["git", "branch", "-D", branch_name],
-                    cwd=self.repo_path,
-                    capture_output=True
-                )
+                # Suppression sous _add_lock (pris par _remove_worktree), comme
+                # _rollback_create : des créations concurrentes peuvent être
+                # en train d'enregistrer leur worktree
+                self._remove_worktree(feature_id, worktree_path, force=True)
+                # Supprimer aussi la branche si elle existe (`git branch -D`
+                # lit les fichiers d'administration des worktrees)
+                with self._add_lock:
+                    self._run_git(["branch", "-D", branch_name])
+                self._verified_branches.discard(branch_name)
             else:
                 raise WorktreeError(
                     f"Worktree '{feature_id}' existe déjà. "
                     "Utilisez force=True pour le recréer."
                 )
 
-        # Vérifier que la branche de base existe
-        result = subprocess.run(
-            ["git", "rev-parse", "--verify", base_branch],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            raise WorktreeError(f"Branche de base '{base_branch}' introuvable")
-
-        # Créer le worktree avec nouvelle branche
-        result = subprocess.run(
-            ["git", "worktree", "add", "-b", branch_name, str(worktree_path), base_branch],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            raise WorktreeError(f"Erreur création worktree: {result.stderr}")
+        return worktree_path, branch_name
 
+    def _finish_create(self, feature_id: str, worktree_path: Path, branch_name: str):
+        """Enregistre un worktree fraîchement créé et écrit son CLAUDE.md."""
         # Enregistrer le worktree actif
         info = WorktreeInfo(
             feature_id=feature_id,
             path=worktree_path,
             branch_name=branch_name
         )
-        self.active_worktrees[feature_id] = info
+        self._register(info)
 
         # Configurer CLAUDE.md si présent
         self._setup_claude_md(worktree_path, feature_id)
 
-        return worktree_path
-
     def remove(self, feature_id: str, force: bool = False) -> bool:
         """Supprime un worktree.
 
@@ -153,39 +578,174 @@ class WorktreeManager:
         Raises:
             WorktreeError: Si la suppression échoue
         """
-        worktree_path = self.worktrees_base / feature_id
+        worktree_path, exists = self._probe(feature_id)
 
-        if not worktree_path.exists():
+        if not exists:
             # Retirer de la liste des actifs si présent
-            self.active_worktrees.pop(feature_id, None)
+            self._unregister(feature_id)
+            return False
+
+        self._remove_worktree(feature_id, worktree_path, force)
+        return True
+
+    def remove_fast(self, feature_id: str) -> bool:
+        """Supprime un worktree sans lancer git (équivalent de remove(force=True)).
+
+        Efface le répertoire du worktree puis son répertoire d'administration
+        (.git/worktrees/<nom>, lu depuis le fichier .git du worktree). Les
+        modifications non commitées sont perdues. Si l'emplacement des
+        fichiers d'administration n'est pas reconnu, délègue à
+        `git worktree remove --force`.
+
+        Args:
+            feature_id: Identifiant de la feature
+
+        Returns:
+            True si supprimé, False si n'existait pas
+
+        Raises:
+            WorktreeError: Si la suppression échoue
+        """
+        worktree_path, exists = self._probe(feature_id)
+
+        if not exists:
+            self._unregister(feature_id)
             return False
 
-        cmd = ["git", "worktree", "remove"]
+        admin_dir = self._admin_dir(worktree_path)
+        if admin_dir is None:
+            self._remove_worktree(feature_id, worktree_path, force=True)
+            return True
+
+        shutil.rmtree(worktree_path, ignore_errors=True)
+        if self._probe(feature_id)[1]:
+            raise WorktreeError(
+                f"Erreur suppression worktree '{feature_id}': "
+                f"'{worktree_path}' n'a pas pu être effacé"
+            )
+        shutil.rmtree(admin_dir, ignore_errors=True)
+
+        self._unregister(feature_id)
+        return True
+
+    def _admin_dir(self, worktree_path: Path) -> Optional[Path]:
+        """Retrouve le répertoire d'administration git d'un worktree.
+
+        Args:
+            worktree_path: Chemin du worktree
+
+        Returns:
+            Chemin .git/worktrees/<nom> du repo principal, ou None si le
+            fichier .git du worktree est absent ou pointe ailleurs
+        """
+        try:
+            content = (worktree_path / ".git").read_text()
+        except OSError:
+            return None
+
+        if not content.startswith("gitdir: "):
+            return None
+        admin_dir = Path(content[8:].strip())
+        if not admin_dir.is_absolute():
+            admin_dir = worktree_path / admin_dir
+
+        if admin_dir.parent.resolve() != (self.repo_path / ".git" / "worktrees").resolve():
+            return None
+        return admin_dir
+
+    def _remove_worktree(self, feature_id: str, worktree_path: Path, force: bool):
+        """Supprime un worktree dont l'existence est déjà connue.
+
+        Sous _add_lock : `git worktree remove` lit les fichiers
+        d'administration des autres worktrees, qu'un ajout ou une autre
+        suppression peut être en train d'écrire ou d'effacer.
+
+        Raises:
+            WorktreeError: Si la suppression échoue
+        """
+        args = ["worktree", "remove"]
         if force:
-            cmd.append("--force")
-        cmd.append(str(worktree_path))
+            args.append("--force")
+        args.append(str(worktree_path))
 
-        result = subprocess.run(
-            cmd,
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True
-        )
+        with self._add_lock:
+            result = self._run_git(args)
 
         if result.returncode != 0:
             raise WorktreeError(
                 f"Erreur suppression worktree '{feature_id}': {result.stderr}"
             )
 
-        self.active_worktrees.pop(feature_id, None)
-        return True
+        self._unregister(feature_id)
+
+    def force_recreate_many(
+        self,
+        feature_ids: List[str],
+        base_branch: str = "main",
+        max_workers: int = 4
+    ) -> List[Path]:
+        """Recrée plusieurs worktrees depuis zéro (ex: relance d'une vague).
+
+        Les worktrees existants sont supprimés en parallèle, leurs branches
+        effacées par un seul `git branch -D`, puis tout est recréé via
+        create_many().
+
+        Args:
+            feature_ids: Identifiants des features
+            base_branch: Branche de base pour les nouvelles branches
+            max_workers: Nombre max de créations simultanées
+
+        Returns:
+            Chemins des worktrees recréés, dans l'ordre de feature_ids
+
+        Raises:
+            WorktreeError: Si une suppression ou une création échoue
+        """
+        if not feature_ids:
+            return []
+
+        for future in self._remove_many(feature_ids):
+            future.result()
+
+        # Une seule commande pour toutes les branches (les absentes sont ignorées)
+        branch_names = [f"feature/{fid}" for fid in feature_ids]
+        self._run_git(["branch", "-D", *branch_names])
+        self._verified_branches.difference_update(branch_names)
+
+        return self.create_many(feature_ids, base_branch, max_workers=max_workers)
+
+    def _remove_many(self, feature_ids: List[str]) -> List[Future]:
+        """Lance remove_fast() en parallèle sur plusieurs features.
+
+        Chaque suppression ne touche que son worktree et ses propres
+        fichiers d'administration, elles sont donc indépendantes. Les
+        verrous `git worktree lock` sont ignorés : réservé aux appelants
+        qui l'acceptent explicitement (force_recreate_many).
+
+        Args:
+            feature_ids: Identifiants des features
+
+        Returns:
+            Futures terminées (une par feature, résultat de remove_fast())
+        """
+        if not feature_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(feature_ids))) as executor:
+            return [
+                executor.submit(self.remove_fast, feature_id)
+                for feature_id in feature_ids
+            ]
 
     def cleanup_all(self):
         """Supprime tous les worktrees actifs et nettoie les références.
 
-        Attention: Cette opération est destructive !
+        Attention: Cette opération est destructive ! Les worktrees
+        verrouillés (`git worktree lock`) sont toutefois conservés.
         """
-        # Supprimer tous les worktrees actifs
+        # Supprimer tous les worktrees actifs via git, pour respecter ses
+        # protections ; un par un, les `git worktree remove` simultanés se
+        # lisant mutuellement des fichiers d'administration en cours d'effacement
         for feature_id in list(self.active_worktrees.keys()):
             try:
                 self.remove(feature_id, force=True)
@@ -193,11 +753,7 @@ class WorktreeManager:
                 pass  # Continuer même si une suppression échoue
 
         # Nettoyer les références orphelines
-        subprocess.run(
-            ["git", "worktree", "prune"],
-            cwd=self.repo_path,
-            capture_output=True
-        )
+        self._run_git(["worktree", "prune"])
 
     def cleanup_merged(self, target_branch: str = "main") -> List[str]:
         """Supprime les worktrees dont la branche a été mergée.
@@ -213,39 +769,36 @@ class WorktreeManager:
             >>> print(f"Nettoyé: {cleaned}")
         """
         # Récupérer les branches mergées
-        result = subprocess.run(
-            ["git", "branch", "--merged", target_branch],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True
+        # --format donne un nom de branche brut par ligne, sans les marqueurs
+        # "* " (branche courante) et "+ " (branche d'un autre worktree)
+        result = self._run_git(
+            ["branch", "--merged", target_branch, "--format=%(refname:short)"],
+            capture=True
         )
 
         if result.returncode != 0:
             raise WorktreeError(f"Erreur lors de la vérification des branches mergées: {result.stderr}")
 
-        # Parser les branches mergées (retirer les espaces et *)
-        merged_branches = set(
-            line.strip().lstrip('*').strip()
-            for line in result.stdout.strip().split("\n")
-            if line.strip()
-        )
+        merged_branches = set(result.stdout.splitlines())
+        merged_branches.discard("")
 
         cleaned = []
-        for feature_id, info in list(self.active_worktrees.items()):
-            if info.branch_name in merged_branches:
-                try:
-                    self.remove(feature_id)
-
-                    # Supprimer aussi la branche
-                    subprocess.run(
-                        ["git", "branch", "-d", info.branch_name],
-                        cwd=self.repo_path,
-                        capture_output=True
-                    )
-
-                    cleaned.append(feature_id)
-                except WorktreeError:
-                    pass  # Continuer même si une suppression échoue
+        for branch_name in sorted(merged_branches & self._branch_to_fid.keys()):
+            feature_id = self._branch_to_fid[branch_name]
+            try:
+                self.remove(feature_id)
+
+                # Supprimer aussi la branche
+                self._run_git(["branch", "-d", branch_name])
+
+                cleaned.append(feature_id)
+                merged_branches.discard(branch_name)
+            except WorktreeError:
+                pass  # Continuer même si une suppression échoue
+
+        # Les branches restantes (et la cible) existent : inutile de les revérifier
+        self._verified_branches.update(merged_branches)
+        self._verified_branches.add(target_branch)
 
         return cleaned
 
@@ -257,6 +810,32 @@ class WorktreeManager:
         """
         return self.active_worktrees.copy()
 
+    def scan_active(self) -> Dict[str, WorktreeInfo]:
+        """Liste les worktrees présents sur disque, même créés par un autre processus.
+
+        Deux os.scandir suffisent (worktrees_base et .git/worktrees) : un
+        répertoire n'est retenu que si ce repo a un répertoire
+        d'administration du même nom. La branche suit la convention
+        feature/<id>, sans lecture de fichier ni appel à git.
+
+        Returns:
+            Dictionnaire des worktrees actifs (feature_id -> WorktreeInfo),
+            complété par ceux enregistrés dans ce manager
+        """
+        admin_names = set(_scan_dir_names(self.repo_path / ".git" / "worktrees"))
+
+        found = {
+            name: WorktreeInfo(
+                feature_id=name,
+                path=self.worktrees_base / name,
+                branch_name=f"feature/{name}"
+            )
+            for name in _scan_dir_names(self.worktrees_base)
+            if name in admin_names
+        }
+        found.update(self.active_worktrees)
+        return found
+
     def list_all_worktrees(self) -> List[Dict[str, str]]:
         """Liste TOUS les worktrees Git (même ceux non gérés par ce manager).
 
@@ -268,38 +847,66 @@ class WorktreeManager:
             >>> for wt in worktrees:
             ...     print(f"{wt['path']} -> {wt['branch']}")
         """
-        result = subprocess.run(
+        return list(self._iter_worktrees())
+
+    def list_by_prefix(self, prefix: str) -> List[Dict[str, str]]:
+        """Liste les worktrees Git dont le nom de répertoire commence par prefix.
+
+        Le filtre est appliqué pendant le parsing, en une seule passe.
+
+        Args:
+            prefix: Préfixe du nom de répertoire (ex: "demo-")
+
+        Returns:
+            Liste de dictionnaires avec les infos de chaque worktree retenu
+        """
+        return [
+            wt for wt in self._iter_worktrees()
+            if os.path.basename(wt.get("path", "")).startswith(prefix)
+        ]
+
+    def _iter_worktrees(self) -> Iterator[Dict[str, str]]:
+        """Parse `git worktree list --porcelain` au fil de la sortie.
+
+        Chaque enregistrement est produit dès que sa ligne vide de fin est
+        lue, sans charger toute la sortie en mémoire. stderr est redirigé
+        vers un fichier temporaire : un pipe non lu pendant la lecture de
+        stdout pourrait se remplir et bloquer git.
+
+        Yields:
+            Dictionnaire des infos d'un worktree (path, branch, head)
+
+        Raises:
+            WorktreeError: Si la commande git échoue
+        """
+        with tempfile.TemporaryFile(mode="w+") as err, subprocess.Popen(
             ["git", "worktree", "list", "--porcelain"],
             cwd=self.repo_path,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=err,
             text=True
-        )
-
-        if result.returncode != 0:
-            raise WorktreeError(f"Erreur listing worktrees: {result.stderr}")
+        ) as proc:
+            current = {}
 
-        worktrees = []
-        current = {}
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    if current:
+                        yield current
+                        current = {}
+                    continue
 
-        for line in result.stdout.split("\n"):
-            line = line.strip()
-            if not line:
-                if current:
-                    worktrees.append(current)
-                    current = {}
-                continue
+                label, _, value = line.partition(" ")
+                key = _PORCELAIN_KEYS.get(label)
+                if key is not None:
+                    current[key] = value
 
-            if line.startswith("worktree "):
-                current["path"] = line[9:]
-            elif line.startswith("branch "):
-                current["branch"] = line[7:]
-            elif line.startswith("HEAD "):
-                current["head"] = line[5:]
+            if proc.wait() != 0:
+                err.seek(0)
+                raise WorktreeError(f"Erreur listing worktrees: {err.read()}")
 
-        if current:
-            worktrees.append(current)
-
-        return worktrees
+            if current:
+                yield current
 
     def exists(self, feature_id: str) -> bool:
         """Vérifie si un worktree existe pour une feature.
@@ -310,8 +917,7 @@ class WorktreeManager:
         Returns:
             True si le worktree existe
         """
-        worktree_path = self.worktrees_base / feature_id
-        return worktree_path.exists()
+        return self._probe(feature_id)[1]
 
     def get_path(self, feature_id: str) -> Optional[Path]:
         """Récupère le chemin d'un worktree actif.
@@ -325,46 +931,116 @@ class WorktreeManager:
         info = self.active_worktrees.get(feature_id)
         return info.path if info else None
 
-    def _setup_claude_md(self, worktree_path: Path, feature_id: str):
-        """Configure CLAUDE.md pour le worktree.
+    def _probe(self, feature_id: str) -> Tuple[Path, bool]:
+        """Calcule le chemin d'un worktree et teste son existence.
 
-        Crée un CLAUDE.md simplifié spécifique au worktree,
-        sans le workflow de session qui pourrait interférer.
+        Un seul lstat, sans passer par Path.exists().
 
         Args:
-            worktree_path: Chemin du worktree
-            feature_id: ID de la feature
-        """
-        target_claude_md = worktree_path / "CLAUDE.md"
+            feature_id: Identifiant de la feature
 
-        # Créer un CLAUDE.md simplifié pour le worktree
-        content = f"""# CLAUDE.md - Worktree Feature
+        Returns:
+            Tuple (chemin du worktree, existe)
+        """
+        worktree_path = self.worktrees_base / feature_id
+        try:
+            os.lstat(worktree_path)
+        except OSError:
+            return worktree_path, False
+        return worktree_path, True
+
+    def _register(self, info: WorktreeInfo):
+        """Enregistre un worktree actif (et son index par branche)."""
+        self.active_worktrees[info.feature_id] = info
+        self._branch_to_fid[info.branch_name] = info.feature_id
+
+    def _unregister(self, feature_id: str):
+        """Retire un worktree des actifs (et de l'index par branche)."""
+        info = self.active_worktrees.pop(feature_id, None)
+        if info is not None:
+            self._branch_to_fid.pop(info.branch_name, None)
+
+    def _run_git(
+        self,
+        args: List[str],
+        capture: bool = False
+    ) -> subprocess.CompletedProcess:
+        """Exécute une commande git dans le repo principal.
 
-## Current Feature
+        Sans capture, stdout est envoyé vers /dev/null et seul stderr est
+        lu (en bytes), puis décodé uniquement si la commande échoue : la
+        plupart des appels n'ont besoin que du code retour.
 
-**Feature ID:** {feature_id}
-**Branch:** feature/{feature_id}
-**Worktree:** {worktree_path}
+        Args:
+            args: Arguments passés à git (sans "git")
+            capture: Si True, capture stdout et stderr en texte
 
-## Context
+        Returns:
+            Résultat de la commande (stderr en texte si returncode != 0)
+        """
+        cmd = ["git", *args]
+        if capture:
+            return subprocess.run(
+                cmd,
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True
+            )
 
-This is an isolated worktree created by RoRchestrator for parallel development.
+        result = subprocess.run(
+            cmd,
+            cwd=self.repo_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            result.stderr = result.stderr.decode(errors="replace")
+        return result
 
-**Your task:** Implement the feature as described in the prompt.
+    async def _run_git_async(self, args: List[str]) -> Tuple[int, str]:
+        """Équivalent asyncio de _run_git (sans capture de stdout).
 
-**Focus:** Work only on this feature. Other features are being developed in parallel in separate worktrees.
+        Args:
+            args: Arguments passés à git (sans "git")
 
-## Important
+        Returns:
+            Tuple (code retour, stderr décodé si la commande a échoué)
+        """
+        import asyncio  # import différé : inutile aux commandes synchrones
 
-- Create the files and code as specified in the prompt
-- Write tests for your implementation
-- Commit your changes when done
-- Do NOT work on other features
-- Do NOT modify files outside the scope of this feature
+        process = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=self.repo_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            return process.returncode, stderr.decode(errors="replace")
+        return process.returncode, ""
 
-## Project Structure
+    def _setup_claude_md(self, worktree_path: Path, feature_id: str):
+        """Configure CLAUDE.md pour le worktree.
 
-See the main README.md for overall project structure and conventions.
-"""
+        Crée un CLAUDE.md simplifié spécifique au worktree,
+        sans le workflow de session qui pourrait interférer.
 
-        target_claude_md.write_text(content)
+        Args:
+            worktree_path: Chemin du worktree
+            feature_id: ID de la feature
+        """
+        content = _CLAUDE_MD_TEMPLATE.format(
+            feature_id=feature_id,
+            worktree_path=worktree_path
+        ).encode("utf-8")
+
+        # Écriture directe sur le descripteur, sans couche TextIOWrapper
+        fd = os.open(
+            worktree_path / "CLAUDE.md",
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644
+        )
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
@@ -34,20 +34,20 @@ def setup_demo_repo() -> Path:
     repo_path = temp_dir / "demo_repo"
     repo_path.mkdir()
 
-    # Initialiser Git
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
+    # Initialiser Git directement sur master ; la config est un simple
+    # fichier INI, on y ajoute l'identité sans lancer `git config`
     subprocess.run(
-        ["git", "config", "user.email", "demo@rorchestrator.local"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "RoRchestrator Demo"],
+        ["git", "init", "--initial-branch=master"],
         cwd=repo_path,
         capture_output=True,
         check=True
     )
+    with open(repo_path / ".git" / "config", "a") as config:
+        config.write(
+            "[user]\n"
+            "\temail = demo@rorchestrator.local\n"
+            "\tname = RoRchestrator Demo\n"
+        )
 
     # Créer fichiers initiaux
     readme = repo_path / "README.md"
@@ -71,9 +71,6 @@ This is a demo project for RoRchestrator.
         check=True
     )
 
-    # Créer branche master
-    subprocess.run(["git", "checkout", "-b", "master"], cwd=repo_path, capture_output=True)
-
     return repo_path
 
 
@@ -160,8 +157,7 @@ async def main():
 
     # 5. Calculer les vagues
     waves = dag.get_execution_waves()
-    features_dict = {f["id"]: f for f in features}
-    reporter.display_dag(waves, features_dict)
+    reporter.display_dag(waves, dag.feature_view)
 
     # 6. Exécution des vagues
     print_section("Exécution des Features")
@@ -170,18 +166,21 @@ async def main():
         for wave_num, wave in enumerate(waves, 1):
             print(f"\n  ▶️  VAGUE {wave_num} - {len(wave)} feature(s)")
 
-            # Créer les worktrees pour cette vague
-            tasks = []
-            for feature_id in wave:
-                worktree_path = worktree_mgr.create(feature_id, base_branch="master")
-                prompt = f"Implement feature: {features_dict[feature_id]['name']}"
-                tasks.append((worktree_path, prompt, feature_id))
+            # Chaque feature démarre dès que son worktree est prêt
+            async def launch(feature_id):
+                worktree_path = await worktree_mgr.create_async(
+                    feature_id, base_branch="master"
+                )
+                prompt = f"Implement feature: {dag.features[feature_id]['name']}"
+                return await runner.run_one(
+                    worktree_path,
+                    prompt,
+                    feature_id,
+                    on_progress=reporter.display_progress
+                )
 
             # Exécuter en parallèle
-            results = await runner.run_wave(
-                tasks,
-                on_progress=reporter.display_progress
-            )
+            results = await asyncio.gather(*(launch(fid) for fid in wave))
 
             # Enregistrer les résultats
             reporter.add_results(results)
@@ -241,6 +240,7 @@ async def main():
 
     print("\n  🧹 Suppression des worktrees...")
     worktree_mgr.cleanup_all()
+    worktree_mgr.close()
     print("  ✅ Worktrees supprimés")
 
     print(f"\n  🗑️  Suppression du repo temporaire...")
@@ -5,6 +5,7 @@ Ce script crée un repo Git temporaire pour démontrer le WorktreeManager.
 Les worktrees sont créés puis nettoyés automatiquement.
 """
 
+import os
 import tempfile
 import shutil
 import subprocess
@@ -19,26 +20,42 @@ def print_section(title: str):
     print("=" * 60)
 
 
+def _dir_size(path) -> int:
+    """Calcule la taille totale des fichiers d'un répertoire (récursif).
+
+    Utilise os.scandir : le type et la taille de chaque entrée viennent
+    d'un seul appel système, sans objet Path intermédiaire.
+    """
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _dir_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 def setup_demo_repo() -> Path:
     """Crée un repo Git temporaire pour la démo."""
     temp_dir = Path(tempfile.mkdtemp(prefix="rorchestrator_demo_"))
     repo_path = temp_dir / "demo_repo"
     repo_path.mkdir()
 
-    # Initialiser Git
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
+    # Initialiser Git directement sur master ; la config est un simple
+    # fichier INI, on y ajoute l'identité sans lancer `git config`
     subprocess.run(
-        ["git", "config", "user.email", "demo@rorchestrator.local"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "RoRchestrator Demo"],
+        ["git", "init", "--initial-branch=master"],
         cwd=repo_path,
         capture_output=True,
         check=True
     )
+    with open(repo_path / ".git" / "config", "a") as config:
+        config.write(
+            "[user]\n"
+            "\temail = demo@rorchestrator.local\n"
+            "\tname = RoRchestrator Demo\n"
+        )
 
     # Créer un commit initial
     readme = repo_path / "README.md"
@@ -55,13 +72,6 @@ def setup_demo_repo() -> Path:
         check=True
     )
 
-    # Créer la branche master
-    subprocess.run(
-        ["git", "checkout", "-b", "master"],
-        cwd=repo_path,
-        capture_output=True
-    )
-
     return repo_path
 
 
@@ -137,11 +147,8 @@ def main():
     # Statistiques
     print_section("Statistiques")
 
-    demo_worktrees = [wt for wt in all_wts if "demo-" in wt.get("path", "")]
-    total_size = sum(
-        sum(f.stat().st_size for f in Path(wt["path"]).rglob("*") if f.is_file())
-        for wt in demo_worktrees
-    )
+    demo_worktrees = manager.list_by_prefix("demo-")
+    total_size = sum(_dir_size(wt["path"]) for wt in demo_worktrees)
 
     print(f"""
   Worktrees de démo créés : {len(demo_worktrees)}
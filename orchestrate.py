@@ -8,22 +8,130 @@ Usage:
     orchestrate.py status [--config CONFIG]
 """
 
-import argparse
-import asyncio
+import atexit
 import json
+import os
 import sys
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
 from core.dag import DAGResolver
 from core.worktree import WorktreeManager, WorktreeError
-from core.runner import ClaudeRunner
 from core.reporter import Reporter
 
+# asyncio et core.runner sont importés à la demande : plan, status et
+# cleanup n'ont pas à payer leur import au démarrage
+if TYPE_CHECKING:
+    import asyncio
+    from core.runner import ClaudeRunner, ClaudeResult
 
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : repli sur json (stdlib)
+    orjson = None
+
+
+# Boucle asyncio partagée par toutes les commandes du processus
+_EVENT_LOOP: Optional["asyncio.AbstractEventLoop"] = None
+
+
+def _close_event_loop() -> None:
+    """Ferme la boucle partagée à la sortie du processus, si elle existe.
+
+    Comme asyncio.run() : finalise les générateurs asynchrones et attend
+    les threads de l'executor par défaut (asyncio.to_thread) avant close().
+    """
+    loop = _EVENT_LOOP
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+atexit.register(_close_event_loop)
+
+
+def _run_async(coro):
+    """Exécute une coroutine sur la boucle partagée du processus.
+
+    La boucle (uvloop si installé) est créée au premier appel puis
+    réutilisée, au lieu d'en recréer une par appel comme asyncio.run().
+    Elle n'est pas installée comme boucle courante du thread.
+
+    Args:
+        coro: Coroutine à exécuter
+
+    Returns:
+        Résultat de la coroutine
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:  # uvloop est optionnel : repli sur la boucle asyncio standard
+        uvloop = None
+
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        _EVENT_LOOP = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+    return _EVENT_LOOP.run_until_complete(coro)
+
+
+# Dernière config construite pour chaque (répertoire courant, chemin) :
+# (mtime_ns, taille, config).
+# Les configs sont immuables (voir _freeze) : un hit ne demande aucune copie
+_CONFIG_CACHE: Dict[Tuple[str, str], Tuple[int, int, "OrchestratorConfig"]] = {}
+
+
+def _load_config_data(config_path: Path) -> dict:
+    """Lit et parse un fichier de config JSON.
+
+    Args:
+        config_path: Chemin vers le fichier JSON
+
+    Returns:
+        Données JSON parsées
+
+    Raises:
+        ValueError: Si le JSON est invalide
+    """
+    raw = config_path.read_bytes()
+    try:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as e:  # json/orjson.JSONDecodeError héritent de ValueError
+        raise ValueError(f"Invalid JSON in config file: {e}")
+
+
+def _freeze(value: Any) -> Any:
+    """Copie immuable d'une valeur JSON (dict -> MappingProxyType, list -> tuple).
+
+    Args:
+        value: Valeur issue du parsing JSON
+
+    Returns:
+        Valeur équivalente en lecture seule
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
 class OrchestratorConfig:
     """Configuration de l'orchestrateur chargée depuis feature_list.json.
 
+    Immuable et sans __dict__ (__slots__) ; se construit via from_path(),
+    qui fige aussi son contenu (features, prompt_paths, allowed_tools).
+
     Attributes:
         project_name: Nom du projet
         repo_path: Chemin vers le repo Git
@@ -32,49 +140,97 @@ class OrchestratorConfig:
         timeout_seconds: Timeout par feature
         permission_mode: Mode permissions Claude
         allowed_tools: Liste des outils autorisés
+        output_format: Format de sortie Claude ("json" ou "stream-json")
         features: Liste des features à exécuter
         prompts_dir: Répertoire des fichiers prompts
+        prompt_paths: Chemin (str) du prompt de chaque feature qui en déclare un
     """
+    # __slots__ explicite : dataclass(slots=True) demande Python 3.10+
+    __slots__ = (
+        "project_name", "repo_path", "base_branch", "max_parallel",
+        "timeout_seconds", "permission_mode", "allowed_tools", "output_format",
+        "features", "prompts_dir", "prompt_paths",
+    )
 
-    def __init__(self, config_path: Path):
+    project_name: str
+    repo_path: Path
+    base_branch: str
+    max_parallel: int
+    timeout_seconds: int
+    permission_mode: str
+    allowed_tools: Optional[Tuple[str, ...]]
+    output_format: str
+    features: Tuple[Mapping[str, Any], ...]
+    prompts_dir: Path
+    prompt_paths: Mapping[str, str]
+
+    @classmethod
+    def from_path(cls, config_path: Path) -> "OrchestratorConfig":
         """Charge la configuration depuis un fichier JSON.
 
+        La config construite est mémorisée : tant que le mtime et la taille
+        du fichier ne changent pas, le même objet (immuable) est retourné.
+
         Args:
             config_path: Chemin vers feature_list.json
 
+        Returns:
+            Configuration chargée
+
         Raises:
             FileNotFoundError: Si le fichier n'existe pas
             ValueError: Si le JSON est invalide
         """
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(config_path) as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in config file: {e}")
-
-        # Charger les paramètres du projet
-        project = data.get("project", {})
-        self.project_name = project.get("name", "UnnamedProject")
-        self.repo_path = Path(project.get("repo_path", Path.cwd()))
-        self.base_branch = project.get("base_branch", "main")
-        self.max_parallel = project.get("max_parallel", 3)
-        self.timeout_seconds = project.get("timeout_seconds", 1800)
+        # Chemin tel que donné : prompts_dir en dérive tel quel ; le
+        # répertoire courant sert de repo_path par défaut
+        key = (os.getcwd(), str(config_path))
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
 
-        # Charger les paramètres Claude
-        claude_config = data.get("claude", {})
-        self.permission_mode = claude_config.get("permission_mode", "acceptEdits")
-        self.allowed_tools = claude_config.get("allowed_tools", None)
+        data = _freeze(_load_config_data(config_path))
 
         # Charger les features
-        self.features = data.get("features", [])
-        if not self.features:
+        features = data.get("features", ())
+        if not features:
             raise ValueError("No features defined in config")
 
-        # Répertoire des prompts (relatif au fichier de config)
-        self.prompts_dir = config_path.parent.parent / "prompts"
+        # Répertoire des prompts (relatif au fichier de config) ; les chemins
+        # sont joints une fois ici, en chaînes (os.path.join), plutôt que
+        # reconstruits en Path à chaque chargement
+        prompts_dir = config_path.parent.parent / "prompts"
+        prompts_dir_str = str(prompts_dir)
+        prompt_paths = MappingProxyType({
+            f["id"]: os.path.join(prompts_dir_str, f["prompt_file"])
+            for f in features
+            if f.get("prompt_file")
+        })
+
+        project = data.get("project", {})
+        claude_config = data.get("claude", {})
+
+        config = cls(
+            # Paramètres du projet
+            project_name=project.get("name", "UnnamedProject"),
+            repo_path=Path(project.get("repo_path", Path.cwd())),
+            base_branch=project.get("base_branch", "main"),
+            max_parallel=project.get("max_parallel", 3),
+            timeout_seconds=project.get("timeout_seconds", 1800),
+            # Paramètres Claude
+            permission_mode=claude_config.get("permission_mode", "acceptEdits"),
+            allowed_tools=claude_config.get("allowed_tools", None),
+            output_format=claude_config.get("output_format", "json"),
+            features=features,
+            prompts_dir=prompts_dir,
+            prompt_paths=prompt_paths,
+        )
+        _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+        return config
 
 
 class Orchestrator:
@@ -89,13 +245,31 @@ class Orchestrator:
         self.config = config
         self.dag = DAGResolver(config.features)
         self.worktree_mgr = WorktreeManager(config.repo_path)
-        self.runner = ClaudeRunner(
-            max_parallel=config.max_parallel,
-            permission_mode=config.permission_mode,
-            allowed_tools=config.allowed_tools,
-            timeout_seconds=config.timeout_seconds
-        )
         self.reporter = Reporter(verbose=True)
+        self._prompt_cache: Dict[str, str] = {}
+
+    @cached_property
+    def runner(self) -> "ClaudeRunner":
+        """Runner Claude, créé (et son module importé) au premier accès."""
+        from core.runner import ClaudeRunner
+
+        return ClaudeRunner(
+            max_parallel=self.config.max_parallel,
+            permission_mode=self.config.permission_mode,
+            allowed_tools=self.config.allowed_tools,
+            timeout_seconds=self.config.timeout_seconds,
+            output_format=self.config.output_format
+        )
+
+    @cached_property
+    def validate_result(self) -> Tuple[bool, Tuple[str, ...]]:
+        """Résultat de validation du DAG, calculé une seule fois par instance.
+
+        Returns:
+            Tuple (True si valide, erreurs de validation)
+        """
+        errors = self.dag.errors
+        return not errors, errors
 
     def validate(self) -> bool:
         """Valide la configuration et le DAG.
@@ -106,18 +280,17 @@ class Orchestrator:
         Prints:
             Messages d'erreur sur stderr si invalide
         """
-        errors = self.dag.validate()
+        ok, errors = self.validate_result
 
-        if errors:
+        if not ok:
             print("❌ Erreurs de validation du DAG:\n", file=sys.stderr)
             for error in errors:
                 print(f"  • {error}", file=sys.stderr)
-            return False
 
-        return True
+        return ok
 
     def load_prompt(self, feature_id: str) -> str:
-        """Charge le prompt pour une feature.
+        """Charge le prompt pour une feature (mis en cache par chemin).
 
         Args:
             feature_id: ID de la feature
@@ -128,22 +301,78 @@ class Orchestrator:
         Raises:
             FileNotFoundError: Si le fichier prompt n'existe pas
         """
-        feature = self.dag.get_feature(feature_id)
-        if not feature:
+        prompt_path = self._prompt_path(feature_id)
+        prompt = self._prompt_cache.get(prompt_path)
+        if prompt is not None:
+            return prompt
+
+        # Lecture directe : pas de stat préalable via exists()
+        try:
+            with open(prompt_path) as f:
+                prompt = self._prompt_cache[prompt_path] = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
+        return prompt
+
+    def _prompt_path(self, feature_id: str) -> str:
+        """Retourne le chemin du fichier prompt d'une feature.
+
+        Raises:
+            ValueError: Si la feature est inconnue ou n'a pas de prompt_file
+        """
+        prompt_path = self.config.prompt_paths.get(feature_id)
+        if prompt_path is not None:
+            return prompt_path
+
+        if feature_id not in self.dag.features:
             raise ValueError(f"Feature '{feature_id}' not found")
+        raise ValueError(f"Feature '{feature_id}' has no prompt_file defined")
 
-        prompt_file = feature.get("prompt_file")
-        if not prompt_file:
-            raise ValueError(f"Feature '{feature_id}' has no prompt_file defined")
+    async def load_prompts(self, feature_ids: List[str]) -> List[Any]:
+        """Charge les prompts de plusieurs features en parallèle.
 
-        prompt_path = self.config.prompts_dir / prompt_file
-        if not prompt_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+        Seules les lectures disque (prompts absents du cache) passent par
+        un thread ; les prompts en cache et les erreurs de configuration
+        sont résolus directement, sans task ni thread.
 
-        return prompt_path.read_text()
+        Args:
+            feature_ids: IDs des features
+
+        Returns:
+            Pour chaque feature, son prompt ou l'exception levée au chargement
+        """
+        import asyncio
+
+        results: List[Any] = []
+        to_read = []  # (position dans results, feature_id)
+
+        for feature_id in feature_ids:
+            try:
+                prompt = self._prompt_cache.get(self._prompt_path(feature_id))
+            except ValueError as e:
+                prompt = e
+            if prompt is None:
+                to_read.append((len(results), feature_id))
+            results.append(prompt)
+
+        if to_read:
+            loaded = await asyncio.gather(
+                *(asyncio.to_thread(self.load_prompt, fid) for _, fid in to_read),
+                return_exceptions=True
+            )
+            for (index, _), prompt in zip(to_read, loaded):
+                results[index] = prompt
+
+        return results
 
     async def execute_waves(self, waves: List[List[str]]) -> bool:
-        """Exécute toutes les vagues de features.
+        """Exécute toutes les features en respectant leurs dépendances.
+
+        Les vagues ne servent plus de barrière : chaque feature démarre dès
+        que ses propres dépendances sont terminées (succès ou échec), dans la
+        limite de `max_parallel` exécutions Claude simultanées (semaphore du
+        runner). La durée totale suit le chemin critique du DAG au lieu de
+        la somme des features les plus lentes de chaque vague.
 
         Args:
             waves: Vagues d'exécution calculées par le DAG
@@ -151,43 +380,59 @@ class Orchestrator:
         Returns:
             True si toutes les features ont réussi
         """
-        all_success = True
-
-        for wave_num, wave in enumerate(waves, 1):
-            print(f"\n  ▶️  VAGUE {wave_num}/{len(waves)} - {len(wave)} feature(s)")
-
-            # Créer les worktrees et préparer les tasks
-            tasks = []
-            for feature_id in wave:
-                try:
-                    worktree_path = self.worktree_mgr.create(
-                        feature_id,
-                        base_branch=self.config.base_branch,
-                        force=True
-                    )
-
-                    prompt = self.load_prompt(feature_id)
-                    tasks.append((worktree_path, prompt, feature_id))
-
-                except Exception as e:
-                    print(f"  ❌ Erreur préparation '{feature_id}': {e}")
-                    all_success = False
-                    continue
-
-            # Exécuter la vague
-            if tasks:
-                results = await self.runner.run_wave(
-                    tasks,
+        # Rien à exécuter : pas de prompts à charger ni de tasks à créer
+        if not any(waves):
+            return True
+
+        import asyncio
+
+        feature_ids = [fid for wave in waves for fid in wave]
+        prompts = dict(zip(feature_ids, await self.load_prompts(feature_ids)))
+
+        loop = asyncio.get_running_loop()
+        done = {fid: loop.create_future() for fid in feature_ids}
+
+        async def run_feature(feature_id: str) -> Optional["ClaudeResult"]:
+            """Attend les dépendances, prépare le worktree puis lance Claude."""
+            try:
+                deps = self.dag.features[feature_id].get("depends_on", [])
+                await asyncio.gather(*(done[d] for d in deps if d in done))
+
+                prompt = prompts[feature_id]
+                if isinstance(prompt, Exception):
+                    raise prompt
+
+                # Créations simultanées dans plusieurs threads
+                worktree_path = await asyncio.to_thread(
+                    self.worktree_mgr.create,
+                    feature_id,
+                    base_branch=self.config.base_branch,
+                    force=True,
+                    concurrent=True
+                )
+            except Exception as e:
+                print(f"  ❌ Erreur préparation '{feature_id}': {e}")
+                # Débloquer les dépendants malgré l'échec
+                done[feature_id].set_result(None)
+                return None
+
+            try:
+                return await self.runner.run_one(
+                    worktree_path,
+                    prompt,
+                    feature_id,
                     on_progress=self.reporter.display_progress
                 )
-                self.reporter.add_results(results)
+            finally:
+                done[feature_id].set_result(None)
 
-                # Vérifier les échecs
-                for result in results:
-                    if not result.success:
-                        all_success = False
+        results = await asyncio.gather(*(run_feature(fid) for fid in feature_ids))
 
-        return all_success
+        # Résultats dans l'ordre du plan, quel que soit l'ordre de fin ;
+        # None = préparation échouée (déjà signalée)
+        finished = [r for r in results if r is not None]
+        self.reporter.add_results(finished)
+        return len(finished) == len(results) and all(r.success for r in finished)
 
 
 def cmd_plan(args):
@@ -195,22 +440,22 @@ def cmd_plan(args):
     config_path = Path(args.config)
 
     try:
-        config = OrchestratorConfig(config_path)
+        config = OrchestratorConfig.from_path(config_path)
         orchestrator = Orchestrator(config)
 
         if not orchestrator.validate():
             return 1
 
         waves = orchestrator.dag.get_execution_waves()
-        features_dict = {f["id"]: f for f in config.features}
 
-        orchestrator.reporter.display_dag(waves, features_dict)
+        orchestrator.reporter.display_dag(waves, orchestrator.dag.feature_view)
 
-        # Afficher les estimations
-        total_tokens = sum(f.get("estimated_tokens", 0) for f in config.features)
-        print(f"\n  💰 Tokens estimés: {total_tokens:,}")
-        print(f"  ⚡ Speedup théorique: {len(config.features) / len(waves):.1f}x")
-        print()
+        # Afficher les estimations (une seule écriture)
+        sys.stdout.write(
+            f"\n  💰 Tokens estimés: {orchestrator.dag.total_estimated_tokens:,}\n"
+            f"  ⚡ Speedup théorique: {len(config.features) / len(waves):.1f}x\n"
+            "\n"
+        )
 
         return 0
 
@@ -224,17 +469,16 @@ def cmd_run(args):
     config_path = Path(args.config)
 
     try:
-        config = OrchestratorConfig(config_path)
+        config = OrchestratorConfig.from_path(config_path)
         orchestrator = Orchestrator(config)
 
         if not orchestrator.validate():
             return 1
 
         waves = orchestrator.dag.get_execution_waves()
-        features_dict = {f["id"]: f for f in config.features}
 
         # Afficher le plan
-        orchestrator.reporter.display_dag(waves, features_dict)
+        orchestrator.reporter.display_dag(waves, orchestrator.dag.feature_view)
 
         # Demander confirmation si --yes n'est pas fourni
         if not args.yes:
@@ -243,8 +487,8 @@ def cmd_run(args):
                 print("  ⏹️  Exécution annulée.")
                 return 0
 
-        # Vérifier que Claude est disponible
-        if not orchestrator.runner.check_claude_available():
+        # Vérifier que Claude est installé (sans lancer `claude --version`)
+        if not orchestrator.runner.is_installed():
             print("\n❌ Claude CLI n'est pas disponible.", file=sys.stderr)
             print("   Vérifiez que 'claude' est dans votre PATH.", file=sys.stderr)
             return 1
@@ -254,7 +498,8 @@ def cmd_run(args):
         print("  🚀 DÉMARRAGE DE L'EXÉCUTION")
         print("═" * 60)
 
-        success = asyncio.run(orchestrator.execute_waves(waves))
+        # Pas de boucle asyncio (ni d'import) quand aucune feature n'est à lancer
+        success = _run_async(orchestrator.execute_waves(waves)) if any(waves) else True
 
         # Générer le rapport
         print("\n" + "═" * 60)
@@ -294,7 +539,7 @@ def cmd_cleanup(args):
     try:
         # Trouver le repo (soit depuis config, soit depuis cwd)
         if args.config:
-            config = OrchestratorConfig(Path(args.config))
+            config = OrchestratorConfig.from_path(Path(args.config))
             repo_path = config.repo_path
         else:
             repo_path = Path.cwd()
@@ -336,41 +581,47 @@ def cmd_status(args):
     config_path = Path(args.config)
 
     try:
-        config = OrchestratorConfig(config_path)
-
-        print("\n" + "═" * 60)
-        print("  STATUT DU PROJET")
-        print("═" * 60)
-
-        print(f"\n  📁 Projet : {config.project_name}")
-        print(f"  📂 Repo   : {config.repo_path}")
-        print(f"  🌿 Branche: {config.base_branch}")
-
-        # Statistiques features
-        total = len(config.features)
-        print(f"\n  📊 Features: {total}")
+        config = OrchestratorConfig.from_path(config_path)
+
+        # Accumuler les lignes puis écrire en une fois
+        lines = [
+            "",
+            "═" * 60,
+            "  STATUT DU PROJET",
+            "═" * 60,
+            "",
+            f"  📁 Projet : {config.project_name}",
+            f"  📂 Repo   : {config.repo_path}",
+            f"  🌿 Branche: {config.base_branch}",
+            "",
+            # Statistiques features
+            f"  📊 Features: {len(config.features)}",
+            "",
+        ]
 
         # Lister les worktrees actifs
         worktree_mgr = WorktreeManager(config.repo_path)
-        active = worktree_mgr.list_active()
+        active = worktree_mgr.scan_active()
 
         if active:
-            print(f"\n  🔧 Worktrees actifs: {len(active)}")
-            for fid, info in active.items():
-                print(f"    • {fid} → {info.branch_name}")
+            lines.append(f"  🔧 Worktrees actifs: {len(active)}")
+            lines.extend(f"    • {fid} → {info.branch_name}" for fid, info in active.items())
         else:
-            print("\n  ℹ️  Aucun worktree actif")
+            lines.append("  ℹ️  Aucun worktree actif")
 
         # Vérifier Claude CLI
+        from core.runner import ClaudeRunner
+
         runner = ClaudeRunner()
-        claude_available = runner.check_claude_available()
-        version = runner.get_claude_version()
+        claude_available, version = runner.probe()
 
-        print(f"\n  🤖 Claude CLI: {'✅ disponible' if claude_available else '❌ non disponible'}")
+        lines.append("")
+        lines.append(f"  🤖 Claude CLI: {'✅ disponible' if claude_available else '❌ non disponible'}")
         if version:
-            print(f"     Version: {version}")
+            lines.append(f"     Version: {version}")
 
-        print("\n" + "═" * 60 + "\n")
+        lines.extend(("", "═" * 60, "", ""))
+        sys.stdout.write("\n".join(lines))
         return 0
 
     except Exception as e:
@@ -378,8 +629,58 @@ def cmd_status(args):
         return 1
 
 
-def main():
-    """Point d'entrée principal."""
+# Grammaire de la CLI : options à valeur (avec défaut) et drapeaux booléens
+# (option -> attribut) de chaque commande
+_CLI_SPEC = {
+    "plan": ({"--config": "config/feature_list.json"}, {}),
+    "run": (
+        {"--config": "config/feature_list.json"},
+        {"--yes": "yes", "-y": "yes", "--sequential": "sequential"},
+    ),
+    "cleanup": ({"--config": None}, {"--merged": "merged", "--all": "all"}),
+    "status": ({"--config": "config/feature_list.json"}, {}),
+}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Analyse la ligne de commande sans construire de parser argparse.
+
+    Ne couvre que les formes simples (`cmd --opt valeur --flag`) ; pour
+    tout le reste (aide, option inconnue, `--opt=valeur`, abréviations,
+    erreurs), retourne None et l'appelant se rabat sur argparse.
+
+    Args:
+        argv: Arguments (sans le nom du programme)
+
+    Returns:
+        Namespace équivalent à celui d'argparse, ou None
+    """
+    if not argv or argv[0] not in _CLI_SPEC:
+        return None
+
+    valued, flags = _CLI_SPEC[argv[0]]
+    values = {option[2:]: default for option, default in valued.items()}
+    values.update((dest, False) for dest in flags.values())
+
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg in flags:
+            values[flags[arg]] = True
+        elif arg in valued and i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+            i += 1
+            values[arg[2:]] = argv[i]
+        else:
+            return None
+        i += 1
+
+    return SimpleNamespace(command=argv[0], **values)
+
+
+def _build_parser():
+    """Construit le parser argparse complet (aide et cas non triviaux)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="RoRchestrator - Orchestration parallèle de Claude Code",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -457,12 +758,28 @@ Exemples:
         help="Chemin vers feature_list.json"
     )
 
-    args = parser.parse_args()
+    return parser
 
-    # Vérifier qu'une commande a été fournie
-    if not args.command:
-        parser.print_help()
-        return 1
+
+def main(argv: Optional[List[str]] = None):
+    """Point d'entrée principal.
+
+    Args:
+        argv: Arguments de la ligne de commande (défaut: sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Chemin rapide : argparse n'est importé que si nécessaire
+    args = _parse_args_fast(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+
+        # Vérifier qu'une commande a été fournie
+        if not args.command:
+            parser.print_help()
+            return 1
 
     # Router vers la bonne commande
     commands = {
@@ -1,6 +1,7 @@
 """Tests unitaires pour le DAG Resolver."""
 
 import unittest
+from unittest.mock import patch
 from core.dag import DAGResolver
 
 
@@ -84,6 +85,18 @@ class TestDAGResolver(unittest.TestCase):
         errors = dag.validate()
         self.assertEqual(len(errors), 2)
 
+    def test_validate_cached(self):
+        """Test que validate() retourne une copie du résultat mémorisé."""
+        features = [
+            {"id": "A", "depends_on": ["missing"]},
+        ]
+        dag = DAGResolver(features)
+
+        errors = dag.validate()
+        errors.clear()
+
+        self.assertEqual(len(dag.validate()), 1)
+
     def test_cycle_detection_simple(self):
         """Test la détection d'un cycle simple: A → B → A"""
         features = [
@@ -125,6 +138,117 @@ class TestDAGResolver(unittest.TestCase):
         self.assertEqual(len(waves), 1)
         self.assertEqual(set(waves[0]), {"A", "B", "C"})
 
+    def test_waves_follow_declaration_order(self):
+        """Test que chaque vague respecte l'ordre de déclaration des features."""
+        features = [
+            {"id": "zeta", "depends_on": []},
+            {"id": "alpha", "depends_on": []},
+            {"id": "mid", "depends_on": ["zeta", "alpha"]},
+        ]
+        dag = DAGResolver(features)
+
+        waves = dag.get_execution_waves()
+        self.assertEqual(waves, [["zeta", "alpha"], ["mid"]])
+
+    def test_execution_waves_cached(self):
+        """Test que les vagues sont calculées une fois et copiées à chaque appel."""
+        features = [
+            {"id": "A", "depends_on": []},
+            {"id": "B", "depends_on": ["A"]},
+        ]
+        dag = DAGResolver(features)
+
+        self.assertEqual(dag.validate(), [])
+        waves = dag.get_execution_waves()
+        waves[0].append("X")
+
+        self.assertEqual(dag.get_execution_waves(), [["A"], ["B"]])
+
+    def test_total_estimated_tokens(self):
+        """Test le total des tokens estimés (0 si absent)."""
+        dag = DAGResolver([
+            {"id": "A", "estimated_tokens": 1000},
+            {"id": "B", "depends_on": ["A"], "estimated_tokens": 500},
+            {"id": "C"},
+        ])
+
+        self.assertEqual(dag.total_estimated_tokens, 1500)
+
+    def test_plan_shared_between_resolvers(self):
+        """Test que deux resolvers sur les mêmes features partagent le tri."""
+        features = [
+            {"id": "A", "depends_on": []},
+            {"id": "B", "depends_on": ["A"]},
+        ]
+        first = DAGResolver(features)
+        self.assertEqual(first.waves, (("A",), ("B",)))
+
+        second = DAGResolver([dict(f) for f in features])
+        self.assertEqual(second.signature, first.signature)
+        with patch("core.dag.TopologicalSorter") as sorter:
+            self.assertIs(second.waves, first.waves)
+        sorter.assert_not_called()
+
+    def test_shared_plan_is_isolated_between_resolvers(self):
+        """Test que les resolvers partagent un plan immuable, pas un état modifiable."""
+        features = [
+            {"id": "A", "depends_on": []},
+            {"id": "B", "depends_on": ["A", "ghost"]},
+        ]
+        first = DAGResolver(features)
+        waves = first.get_execution_waves()
+        waves[0].append("intrus")
+        waves.clear()
+        errors = first.validate()
+        errors.append("intrus")
+
+        second = DAGResolver(features)
+
+        self.assertEqual(second.get_execution_waves(), [["A", "ghost"], ["B"]])
+        self.assertEqual(len(second.validate()), 1)
+        self.assertIsInstance(second.waves, tuple)
+        self.assertIsInstance(second.errors, tuple)
+
+    def test_errors_property(self):
+        """Test l'accès en lecture seule aux erreurs de validation."""
+        dag = DAGResolver([{"id": "A", "depends_on": ["missing"]}])
+
+        self.assertEqual(len(dag.errors), 1)
+        self.assertIs(dag.errors, dag.errors)
+        self.assertEqual(list(dag.errors), dag.validate())
+
+    def test_execution_waves_with_cycle_raises(self):
+        """Test que get_execution_waves lève CycleError sur un cycle."""
+        from graphlib import CycleError
+
+        features = [
+            {"id": "A", "depends_on": ["B"]},
+            {"id": "B", "depends_on": ["A"]},
+        ]
+        dag = DAGResolver(features)
+
+        self.assertEqual(len(dag.validate()), 1)
+        with self.assertRaises(CycleError):
+            dag.get_execution_waves()
+
+    def test_cycle_error_is_raised_fresh_each_time(self):
+        """Test que chaque resolver lève sa propre instance de CycleError."""
+        from graphlib import CycleError
+
+        features = [
+            {"id": "A", "depends_on": ["B"]},
+            {"id": "B", "depends_on": ["A"]},
+        ]
+        raised = []
+        for _ in range(3):
+            with self.assertRaises(CycleError) as ctx:
+                DAGResolver(features).get_execution_waves()
+            raised.append(ctx.exception)
+
+        self.assertIsNot(raised[0], raised[1])
+        self.assertEqual(raised[0].args, raised[2].args)
+        self.assertIsNone(raised[2].__context__)
+
     def test_get_feature(self):
         """Test la récupération d'une feature par ID."""
         features = [
@@ -140,6 +264,19 @@ class TestDAGResolver(unittest.TestCase):
         feature_none = dag.get_feature("nonexistent")
         self.assertIsNone(feature_none)
 
+    def test_feature_view(self):
+        """Test les vues précalculées pour l'affichage."""
+        features = [
+            {"id": "A", "name": "Feature A", "depends_on": [], "estimated_tokens": 1000},
+            {"id": "B", "depends_on": ["A"]},
+        ]
+        dag = DAGResolver(features)
+
+        self.assertEqual(dag.feature_view["A"], ("Feature A", (), 1000))
+        self.assertEqual(dag.feature_view["B"].name, "B")
+        self.assertEqual(dag.feature_view["B"].depends_on, ("A",))
+        self.assertEqual(dag.feature_view["B"].estimated_tokens, 0)
+
     def test_get_dependencies(self):
         """Test la récupération des dépendances directes."""
         features = [
@@ -158,6 +295,20 @@ class TestDAGResolver(unittest.TestCase):
         deps_c = dag.get_dependencies("C")
         self.assertEqual(deps_c, {"A", "B"})
 
+    def test_identical_dependency_sets_are_shared(self):
+        """Test que les ensembles de dépendances identiques sont internés."""
+        features = [
+            {"id": "A", "depends_on": []},
+            {"id": "B", "depends_on": []},
+            {"id": "C", "depends_on": ["A", "B"]},
+            {"id": "D", "depends_on": ["B", "A"]},
+        ]
+        dag = DAGResolver(features)
+
+        self.assertIs(dag.get_dependencies("A"), dag.get_dependencies("B"))
+        self.assertIs(dag.get_dependencies("C"), dag.get_dependencies("D"))
+        self.assertIsInstance(dag.get_dependencies("C"), frozenset)
+
     def test_get_dependents(self):
         """Test la récupération des features dépendantes."""
         features = [
@@ -216,6 +367,71 @@ class TestDAGResolver(unittest.TestCase):
         all_deps_d = dag.get_all_dependencies("D")
         self.assertEqual(all_deps_d, {"A", "B", "C"})
 
+    def test_get_all_dependencies_returns_copy(self):
+        """Test que la fermeture mémorisée n'est pas modifiable par l'appelant."""
+        features = [
+            {"id": "A", "depends_on": []},
+            {"id": "B", "depends_on": ["A"]},
+            {"id": "C", "depends_on": ["B"]},
+        ]
+        dag = DAGResolver(features)
+
+        # B est calculé en premier puis réutilisé pour C
+        all_deps_b = dag.get_all_dependencies("B")
+        all_deps_b.add("X")
+
+        self.assertEqual(dag.get_all_dependencies("B"), {"A"})
+        self.assertEqual(dag.get_all_dependencies("C"), {"A", "B"})
+
+    def test_compute_all_closures(self):
+        """Test le calcul de toutes les fermetures transitives en un passage."""
+        features = [
+            {"id": "A", "depends_on": []},
+            {"id": "B", "depends_on": ["A"]},
+            {"id": "C", "depends_on": ["A"]},
+            {"id": "D", "depends_on": ["B", "C"]},
+        ]
+        dag = DAGResolver(features)
+
+        closures = dag.compute_all_closures()
+        self.assertEqual(closures, {
+            "A": frozenset(),
+            "B": {"A"},
+            "C": {"A"},
+            "D": {"A", "B", "C"},
+        })
+
+    def test_compute_all_closures_ignores_unknown_ids(self):
+        """Test que ni un ID interrogé ni une dépendance inexistante n'apparaît."""
+        dag = DAGResolver([{"id": "x", "depends_on": ["ghost"]}])
+
+        self.assertEqual(dag.get_all_dependencies("nope"), set())
+        self.assertEqual(dag.get_all_dependencies("ghost"), set())
+        closures = dag.compute_all_closures()
+        self.assertEqual(closures, {"x": {"ghost"}})
+
+    def test_compute_all_closures_with_unknown_dependency(self):
+        """Test les fermetures quand une dépendance n'est pas déclarée."""
+        dag = DAGResolver([
+            {"id": "a", "depends_on": ["ghost"]},
+            {"id": "b", "depends_on": ["a"]},
+        ])
+
+        self.assertEqual(dag.compute_all_closures(), {
+            "a": {"ghost"},
+            "b": {"a", "ghost"},
+        })
+
+    def test_get_all_dependencies_with_cycle(self):
+        """Test que get_all_dependencies termine sur un graphe cyclique."""
+        features = [
+            {"id": "A", "depends_on": ["B"]},
+            {"id": "B", "depends_on": ["A"]},
+        ]
+        dag = DAGResolver(features)
+
+        self.assertEqual(dag.get_all_dependencies("A"), {"A", "B"})
+
     def test_empty_features_list(self):
         """Test avec une liste vide de features."""
         dag = DAGResolver([])
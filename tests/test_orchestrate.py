@@ -0,0 +1,372 @@
+"""Tests unitaires pour la CLI orchestrate.py."""
+
+import asyncio
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import orchestrate
+from orchestrate import OrchestratorConfig
+from core.runner import ClaudeResult
+from core.worktree import WorktreeError
+
+
+class TestOrchestratorConfig(unittest.TestCase):
+    """Tests pour le chargement de la configuration."""
+
+    def setUp(self):
+        """Crée un fichier de config temporaire."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.test_dir / "config" / "feature_list.json"
+        self.config_path.parent.mkdir()
+        self.write_config({
+            "project": {"name": "TestProject", "max_parallel": 2},
+            "features": [
+                {"id": "auth", "name": "Auth", "depends_on": []},
+                {"id": "api", "name": "API", "depends_on": ["auth"]},
+            ]
+        })
+        orchestrate._CONFIG_CACHE.clear()
+
+    def tearDown(self):
+        """Nettoie les fichiers temporaires."""
+        shutil.rmtree(self.test_dir)
+
+    def write_config(self, data: dict, mtime_ns: int = None):
+        """Écrit la config (avec un mtime explicite si fourni)."""
+        self.config_path.write_text(json.dumps(data))
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_load_config(self):
+        """Test le chargement des paramètres et des features."""
+        config = OrchestratorConfig.from_path(self.config_path)
+
+        self.assertEqual(config.project_name, "TestProject")
+        self.assertEqual(config.max_parallel, 2)
+        self.assertEqual(config.base_branch, "main")
+        self.assertEqual([f["id"] for f in config.features], ["auth", "api"])
+        self.assertEqual(config.prompts_dir, self.test_dir / "prompts")
+
+    def test_prompt_paths_resolved_at_load(self):
+        """Test que les chemins des prompts sont calculés au chargement."""
+        self.write_config({
+            "features": [
+                {"id": "auth", "prompt_file": "auth.md"},
+                {"id": "api"},
+            ]
+        })
+        config = OrchestratorConfig.from_path(self.config_path)
+
+        self.assertEqual(config.prompt_paths, {"auth": str(self.test_dir / "prompts" / "auth.md")})
+
+    def test_config_is_frozen(self):
+        """Test que la configuration est immuable et sans __dict__."""
+        config = OrchestratorConfig.from_path(self.config_path)
+
+        with self.assertRaises(AttributeError):
+            config.max_parallel = 10
+        self.assertFalse(hasattr(config, "__dict__"))
+
+    def test_config_parse_is_cached(self):
+        """Test que la config n'est construite qu'une fois tant que le fichier ne change pas."""
+        first = OrchestratorConfig.from_path(self.config_path)
+        with patch.object(Path, "read_bytes") as read_bytes:
+            second = OrchestratorConfig.from_path(self.config_path)
+
+        read_bytes.assert_not_called()
+        self.assertIs(first, second)
+        self.assertEqual(len(orchestrate._CONFIG_CACHE), 1)
+
+    def test_cached_config_is_read_only(self):
+        """Test que le contenu d'une config mise en cache ne peut pas être modifié."""
+        config = OrchestratorConfig.from_path(self.config_path)
+
+        with self.assertRaises(AttributeError):
+            config.features.append({"id": "intrus"})
+        with self.assertRaises(TypeError):
+            config.features[0]["name"] = "Intrus"
+        with self.assertRaises(AttributeError):
+            config.features[1]["depends_on"].append("intrus")
+        with self.assertRaises(TypeError):
+            config.prompt_paths["intrus"] = "intrus.md"
+
+    def test_config_cache_invalidated_on_change(self):
+        """Test qu'une modification du fichier force un nouveau parsing."""
+        first = OrchestratorConfig.from_path(self.config_path)
+
+        self.write_config(
+            {"project": {"name": "Renamed"}, "features": [{"id": "solo"}]},
+            mtime_ns=self.config_path.stat().st_mtime_ns + 1_000_000_000
+        )
+        second = OrchestratorConfig.from_path(self.config_path)
+
+        self.assertEqual(first.project_name, "TestProject")
+        self.assertEqual(second.project_name, "Renamed")
+        self.assertEqual(len(orchestrate._CONFIG_CACHE), 1)
+
+    def test_missing_config(self):
+        """Test l'erreur sur un fichier de config absent."""
+        with self.assertRaises(FileNotFoundError):
+            OrchestratorConfig.from_path(self.test_dir / "missing.json")
+
+    def test_invalid_json(self):
+        """Test l'erreur sur un JSON invalide."""
+        self.config_path.write_text("{not json")
+
+        with self.assertRaises(ValueError) as ctx:
+            OrchestratorConfig.from_path(self.config_path)
+
+        self.assertIn("Invalid JSON", str(ctx.exception))
+
+
+class TestRunAsync(unittest.TestCase):
+    """Tests pour la boucle asyncio partagée."""
+
+    def test_event_loop_is_reused(self):
+        """Test que les appels successifs partagent la même boucle."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = orchestrate._run_async(current_loop())
+        second = orchestrate._run_async(current_loop())
+
+        self.assertIs(first, second)
+        self.assertFalse(first.is_running())
+
+    def test_close_joins_default_executor(self):
+        """Test que la fermeture attend les threads de asyncio.to_thread."""
+        async def use_thread():
+            return await asyncio.to_thread(threading.current_thread)
+
+        worker = orchestrate._run_async(use_thread())
+        loop = orchestrate._EVENT_LOOP
+
+        orchestrate._close_event_loop()
+
+        self.assertTrue(loop.is_closed())
+        self.assertIsNot(worker, threading.current_thread())
+        self.assertFalse(worker.is_alive())
+
+    def test_recreated_loop_is_not_installed(self):
+        """Test qu'une boucle recréée ne devient pas la boucle du thread."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = orchestrate._run_async(current_loop())
+        first.close()
+        with patch.object(orchestrate.atexit, "register") as register, \
+                patch("asyncio.set_event_loop") as set_event_loop:
+            second = orchestrate._run_async(current_loop())
+
+        self.assertIsNot(first, second)
+        register.assert_not_called()
+        set_event_loop.assert_not_called()
+
+
+class TestArgParsing(unittest.TestCase):
+    """Tests pour l'analyse rapide de la ligne de commande."""
+
+    def test_fast_parser_matches_argparse(self):
+        """Test que le parser rapide produit les mêmes attributs qu'argparse."""
+        parser = orchestrate._build_parser()
+        for argv in (
+            ["plan"],
+            ["plan", "--config", "other.json"],
+            ["run", "-y", "--sequential"],
+            ["run", "--config", "c.json", "--yes"],
+            ["cleanup", "--merged"],
+            ["cleanup", "--all", "--config", "c.json"],
+            ["status"],
+        ):
+            with self.subTest(argv=argv):
+                fast = orchestrate._parse_args_fast(argv)
+                self.assertEqual(vars(fast), vars(parser.parse_args(argv)))
+
+    def test_fast_parser_defers_non_trivial_cases(self):
+        """Test le repli sur argparse (aide, option inconnue, --opt=valeur)."""
+        for argv in ([], ["--help"], ["plan", "-h"], ["run", "--unknown"],
+                     ["plan", "--config=c.json"], ["plan", "--config"], ["bogus"]):
+            with self.subTest(argv=argv):
+                self.assertIsNone(orchestrate._parse_args_fast(argv))
+
+
+class TestCommands(unittest.TestCase):
+    """Tests pour les commandes CLI."""
+
+    def setUp(self):
+        """Crée une config minimale pointant sur un faux repo Git."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        repo_path = self.test_dir / "repo"
+        (repo_path / ".git").mkdir(parents=True)
+        self.config_path = self.test_dir / "config" / "feature_list.json"
+        self.config_path.parent.mkdir()
+        self.config_path.write_text(json.dumps({
+            "project": {"name": "TestProject", "repo_path": str(repo_path)},
+            "features": [{"id": "auth", "depends_on": []}]
+        }))
+
+    def tearDown(self):
+        """Nettoie les fichiers temporaires."""
+        shutil.rmtree(self.test_dir)
+
+    def test_cmd_status_writes_once(self):
+        """Test que le statut est émis en une seule écriture."""
+        out = io.StringIO()
+        args = type("Args", (), {"config": str(self.config_path)})()
+
+        with patch("core.runner.ClaudeRunner.probe", return_value=(True, "1.0.0")), \
+                patch.object(out, "write", wraps=out.write) as write, \
+                redirect_stdout(out):
+            self.assertEqual(orchestrate.cmd_status(args), 0)
+
+        write.assert_called_once()
+        self.assertIn("STATUT DU PROJET", out.getvalue())
+        self.assertIn("Version: 1.0.0", out.getvalue())
+
+
+class TestOrchestrator(unittest.TestCase):
+    """Tests pour la classe Orchestrator."""
+
+    def setUp(self):
+        """Crée un projet temporaire (config, prompts, faux repo Git)."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        repo_path = self.test_dir / "repo"
+        (repo_path / ".git").mkdir(parents=True)
+
+        config_path = self.test_dir / "config" / "feature_list.json"
+        config_path.parent.mkdir()
+        config_path.write_text(json.dumps({
+            "project": {"name": "TestProject", "repo_path": str(repo_path)},
+            "features": [
+                {"id": "auth", "prompt_file": "auth.md", "depends_on": []},
+                {"id": "api", "prompt_file": "missing.md", "depends_on": ["auth"]},
+                {"id": "ui", "prompt_file": "ui.md", "depends_on": []},
+            ]
+        }))
+
+        self.prompts_dir = self.test_dir / "prompts"
+        self.prompts_dir.mkdir()
+        (self.prompts_dir / "auth.md").write_text("Implement auth")
+        (self.prompts_dir / "ui.md").write_text("Implement UI")
+
+        self.orchestrator = orchestrate.Orchestrator(OrchestratorConfig.from_path(config_path))
+
+    def tearDown(self):
+        """Nettoie les fichiers temporaires."""
+        self.orchestrator.worktree_mgr.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_validate_result_is_memoized(self):
+        """Test que la validation n'est calculée qu'une fois par instance."""
+        with patch.object(type(self.orchestrator.dag), "errors", new_callable=PropertyMock,
+                          return_value=()) as errors:
+            self.assertTrue(self.orchestrator.validate())
+            self.assertTrue(self.orchestrator.validate())
+
+        self.assertEqual(self.orchestrator.validate_result, (True, ()))
+        errors.assert_called_once()
+
+    def test_load_prompt_is_cached(self):
+        """Test que chaque fichier prompt n'est lu qu'une fois."""
+        self.assertEqual(self.orchestrator.load_prompt("auth"), "Implement auth")
+
+        (self.prompts_dir / "auth.md").write_text("Changed")
+        self.assertEqual(self.orchestrator.load_prompt("auth"), "Implement auth")
+
+    def test_load_prompt_errors(self):
+        """Test les erreurs : prompt absent, feature inconnue."""
+        with self.assertRaisesRegex(FileNotFoundError, "Prompt file not found"):
+            self.orchestrator.load_prompt("api")
+        with self.assertRaisesRegex(ValueError, "not found"):
+            self.orchestrator.load_prompt("unknown")
+
+    def test_load_prompts_returns_errors_in_place(self):
+        """Test le chargement groupé : les erreurs restent à leur position."""
+        prompts = asyncio.run(self.orchestrator.load_prompts(["auth", "api"]))
+
+        self.assertEqual(prompts[0], "Implement auth")
+        self.assertIsInstance(prompts[1], FileNotFoundError)
+
+    def test_load_prompts_skips_threads_when_cached(self):
+        """Test que les prompts en cache sont résolus sans thread."""
+        self.orchestrator.load_prompt("auth")
+
+        with patch("asyncio.to_thread") as to_thread:
+            prompts = asyncio.run(self.orchestrator.load_prompts(["auth"]))
+
+        self.assertEqual(prompts, ["Implement auth"])
+        to_thread.assert_not_called()
+
+    def test_execute_waves_without_features(self):
+        """Test qu'un plan vide réussit sans charger de prompt."""
+        with patch.object(self.orchestrator, "load_prompts") as load_prompts:
+            self.assertTrue(asyncio.run(self.orchestrator.execute_waves([])))
+            self.assertTrue(asyncio.run(self.orchestrator.execute_waves([[]])))
+
+        load_prompts.assert_not_called()
+
+    def test_execute_waves_skips_features_that_fail_preparation(self):
+        """Test qu'une feature dont la préparation échoue n'est pas lancée."""
+        (self.prompts_dir / "missing.md").write_text("Implement API")
+        wt = self.test_dir / "worktrees"
+
+        def fake_create(feature_id, base_branch, force, concurrent):
+            self.assertTrue(concurrent)
+            if feature_id == "api":
+                raise WorktreeError("boom")
+            return wt / feature_id
+
+        run_one = AsyncMock(return_value=ClaudeResult("auth", True, "Done", 0.0, 0, ""))
+
+        with patch.object(self.orchestrator.worktree_mgr, "create", side_effect=fake_create), \
+                patch.object(self.orchestrator.runner, "run_one", run_one), \
+                redirect_stdout(io.StringIO()):
+            success = asyncio.run(self.orchestrator.execute_waves([["auth", "api"]]))
+
+        self.assertFalse(success)
+        run_one.assert_called_once()
+        self.assertEqual(run_one.call_args.args, (wt / "auth", "Implement auth", "auth"))
+
+    def test_execute_waves_starts_feature_when_its_deps_are_done(self):
+        """Test qu'une feature n'attend que ses dépendances, pas toute la vague."""
+        (self.prompts_dir / "missing.md").write_text("Implement API")
+        wt = self.test_dir / "worktrees"
+
+        async def scenario():
+            api_started = asyncio.Event()
+
+            async def fake_run_one(worktree_path, prompt, feature_id, on_progress=None):
+                if feature_id == "api":
+                    api_started.set()
+                elif feature_id == "ui":
+                    # Bloquerait indéfiniment avec une barrière par vague
+                    await api_started.wait()
+                return ClaudeResult(feature_id, True, "Done", 0.0, 0, "")
+
+            with patch.object(self.orchestrator.worktree_mgr, "create",
+                              side_effect=lambda fid, **kw: wt / fid), \
+                    patch.object(self.orchestrator.runner, "run_one", fake_run_one):
+                return await asyncio.wait_for(
+                    self.orchestrator.execute_waves([["auth", "ui"], ["api"]]),
+                    timeout=5
+                )
+
+        with redirect_stdout(io.StringIO()):
+            success = asyncio.run(scenario())
+
+        self.assertTrue(success)
+        self.assertEqual(
+            [r.feature_id for r in self.orchestrator.reporter.results],
+            ["auth", "ui", "api"]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
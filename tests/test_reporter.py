@@ -3,11 +3,13 @@
 import unittest
 import json
 import tempfile
+from contextlib import redirect_stdout
 from pathlib import Path
 from datetime import datetime
-from io import StringIO
-import sys
+from io import BytesIO, StringIO
+from unittest.mock import patch
 
+from core.dag import DAGResolver
 from core.reporter import Reporter, ExecutionReport
 from core.runner import ClaudeResult
 
@@ -90,6 +92,55 @@ class TestReporter(unittest.TestCase):
         self.assertIn("feature/feature-2", report.branches_created)
         self.assertEqual(len(report.errors), 1)
         self.assertEqual(report.errors[0]["feature_id"], "feature-3")
+        self.assertEqual(report.waves[0]["duration_ms"], 1000)
+        self.assertEqual(report.waves[1]["duration_ms"], 800)
+
+    def test_display_report_speedup_uses_critical_path(self):
+        """Test que le speedup est calculé sur le chemin critique."""
+        reporter = Reporter()
+        started = datetime(2026, 1, 2, 10, 0, 0)
+        finished = datetime(2026, 1, 2, 10, 1, 0)
+
+        reporter.add_results([
+            ClaudeResult("a", True, "Done", 0.1, 1000, "s1",
+                         started_at=started, finished_at=finished),
+            ClaudeResult("b", True, "Done", 0.1, 3000, "s2",
+                         started_at=started, finished_at=finished),
+            ClaudeResult("c", True, "Done", 0.1, 1000, "s3",
+                         started_at=started, finished_at=finished),
+        ])
+        report = reporter.generate_report("TestProject", [["a", "b", "c"]])
+
+        captured_output = StringIO()
+        with redirect_stdout(captured_output):
+            reporter.display_report(report)
+
+        # 5000 ms au total / 3000 ms pour la vague la plus lente
+        self.assertIn("Speedup théorique: 1.7x", captured_output.getvalue())
+
+    def test_generate_report_uses_monotonic_timestamps(self):
+        """Test que les bornes du rapport viennent de l'horloge monotone."""
+        reporter = Reporter()
+
+        reporter.add_results([
+            ClaudeResult(
+                "late-start", True, "Done", 0.1, 100, "s1",
+                started_at=datetime(2026, 1, 2, 10, 5, 0),
+                finished_at=datetime(2026, 1, 2, 10, 6, 0),
+                started_ns=5_000, finished_ns=6_000
+            ),
+            ClaudeResult(
+                "early-start", True, "Done", 0.1, 100, "s2",
+                started_at=datetime(2026, 1, 2, 10, 0, 0),
+                finished_at=datetime(2026, 1, 2, 10, 1, 0),
+                started_ns=1_000, finished_ns=2_000
+            ),
+        ])
+
+        report = reporter.generate_report("TestProject", [["late-start", "early-start"]])
+
+        self.assertEqual(report.started_at, datetime(2026, 1, 2, 10, 0, 0))
+        self.assertEqual(report.finished_at, datetime(2026, 1, 2, 10, 6, 0))
 
     def test_generate_report_no_results(self):
         """Test la génération de rapport sans résultats."""
@@ -111,28 +162,15 @@ class TestReporter(unittest.TestCase):
 
         report = reporter.generate_report("TestProject", [["f1"]])
 
-        # Sauvegarder dans un fichier temporaire
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            temp_path = Path(f.name)
-
-        try:
-            reporter.save_report(report, temp_path)
-
-            # Vérifier que le fichier a été créé
-            self.assertTrue(temp_path.exists())
+        # Sauvegarder en mémoire (flux binaire)
+        buf = BytesIO()
+        reporter.save_report(report, buf)
+        data = json.loads(buf.getvalue())
 
-            # Vérifier le contenu
-            with open(temp_path) as f:
-                data = json.load(f)
-
-            self.assertEqual(data["project_name"], "TestProject")
-            self.assertEqual(data["successful"], 1)
-            self.assertEqual(data["failed"], 0)
-
-        finally:
-            # Cleanup
-            if temp_path.exists():
-                temp_path.unlink()
+        self.assertEqual(data["project_name"], "TestProject")
+        self.assertEqual(data["successful"], 1)
+        self.assertEqual(data["failed"], 0)
+        self.assertEqual(data["started_at"], "2026-01-02T10:00:00")
 
     def test_save_results(self):
         """Test la sauvegarde des résultats bruts."""
@@ -144,46 +182,71 @@ class TestReporter(unittest.TestCase):
         ]
         reporter.add_results(results)
 
-        # Sauvegarder dans un fichier temporaire
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            temp_path = Path(f.name)
+        # Sauvegarder en mémoire (flux binaire)
+        buf = BytesIO()
+        reporter.save_results(buf)
+        data = json.loads(buf.getvalue())
 
-        try:
-            reporter.save_results(temp_path)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["feature_id"], "f1")
+        self.assertTrue(data[0]["success"])
+        self.assertEqual(data[1]["feature_id"], "f2")
+        self.assertFalse(data[1]["success"])
+
+    def test_save_results_without_orjson(self):
+        """Test la sauvegarde avec le repli sur json (stdlib)."""
+        reporter = Reporter()
+        reporter.add_result(ClaudeResult("f1", True, "Terminé ✅", 0.5, 1000, "s1"))
 
-            # Vérifier le contenu
-            with open(temp_path) as f:
-                data = json.load(f)
+        with tempfile.TemporaryDirectory() as tmp:
+            temp_path = Path(tmp) / "results.json"
 
-            self.assertEqual(len(data), 2)
-            self.assertEqual(data[0]["feature_id"], "f1")
-            self.assertTrue(data[0]["success"])
-            self.assertEqual(data[1]["feature_id"], "f2")
-            self.assertFalse(data[1]["success"])
+            with patch("core.reporter.orjson", None):
+                reporter.save_results(temp_path)
 
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+            data = json.loads(temp_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(data[0]["result"], "Terminé ✅")
+
+    def test_saved_dates_identical_with_and_without_orjson(self):
+        """Test que les datetime sont encodés comme isoformat() par les deux backends."""
+        reporter = Reporter()
+        reporter.add_result(ClaudeResult(
+            "f1", True, "Done", 0.5, 1000, "s1",
+            started_at=datetime(2026, 1, 2, 10, 0, 0, 123456),
+            finished_at=datetime(2026, 1, 2, 10, 1, 0)
+        ))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            fast_path = Path(tmp) / "fast.json"
+            stdlib_path = Path(tmp) / "stdlib.json"
+
+            reporter.save_results(fast_path)
+            with patch("core.reporter.orjson", None):
+                reporter.save_results(stdlib_path)
+
+            fast = json.loads(fast_path.read_text(encoding="utf-8"))
+            stdlib = json.loads(stdlib_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(fast, stdlib)
+        self.assertEqual(fast, [reporter.results[0].to_dict()])
 
     def test_display_dag(self):
         """Test l'affichage du DAG."""
         reporter = Reporter()
 
         waves = [["auth"], ["api", "batch"], ["dashboard"]]
-        features = {
-            "auth": {"id": "auth", "name": "Auth", "depends_on": []},
-            "api": {"id": "api", "name": "API", "depends_on": ["auth"], "estimated_tokens": 30000},
-            "batch": {"id": "batch", "name": "Batch", "depends_on": ["auth"]},
-            "dashboard": {"id": "dashboard", "name": "Dashboard", "depends_on": ["api", "batch"]},
-        }
+        features = DAGResolver([
+            {"id": "auth", "name": "Auth", "depends_on": []},
+            {"id": "api", "name": "API", "depends_on": ["auth"], "estimated_tokens": 30000},
+            {"id": "batch", "name": "Batch", "depends_on": ["auth"]},
+            {"id": "dashboard", "name": "Dashboard", "depends_on": ["api", "batch"]},
+        ]).feature_view
 
         # Capturer stdout
         captured_output = StringIO()
-        sys.stdout = captured_output
-
-        reporter.display_dag(waves, features)
-
-        sys.stdout = sys.__stdout__
+        with redirect_stdout(captured_output):
+            reporter.display_dag(waves, features)
         output = captured_output.getvalue()
 
         # Vérifier le contenu
@@ -193,6 +256,7 @@ class TestReporter(unittest.TestCase):
         self.assertIn("PARALLÈLE", output)
         self.assertIn("auth", output)
         self.assertIn("30,000 tokens", output)
+        self.assertIn("← attend ['api', 'batch']", output)
 
     def test_display_progress(self):
         """Test l'affichage de la progression."""
@@ -200,13 +264,10 @@ class TestReporter(unittest.TestCase):
 
         # Capturer stdout
         captured_output = StringIO()
-        sys.stdout = captured_output
-
-        reporter.display_progress("test-feature", "started")
-        reporter.display_progress("test-feature", "completed")
-        reporter.display_progress("test-feature", "failed")
-
-        sys.stdout = sys.__stdout__
+        with redirect_stdout(captured_output):
+            reporter.display_progress("test-feature", "started")
+            reporter.display_progress("test-feature", "completed")
+            reporter.display_progress("test-feature", "failed")
         output = captured_output.getvalue()
 
         self.assertIn("🚀", output)
@@ -214,6 +275,31 @@ class TestReporter(unittest.TestCase):
         self.assertIn("❌", output)
         self.assertIn("test-feature", output)
 
+    def test_display_progress_format(self):
+        """Test le format exact d'une ligne de progression."""
+        reporter = Reporter(verbose=False)
+
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            reporter.display_progress("f1", "started")  # masqué hors verbose
+            reporter.display_progress("f1", "completed")
+            reporter.display_progress("f1", "waiting")
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertRegex(lines[0], r"^  \[\d\d:\d\d:\d\d\] ✅ f1: completed$")
+        self.assertRegex(lines[1], r"^  \[\d\d:\d\d:\d\d\] ⏳ f1: waiting$")
+
+    def test_display_progress_status_with_braces(self):
+        """Test qu'un statut contenant des accolades est affiché tel quel."""
+        reporter = Reporter(verbose=False)
+
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            reporter.display_progress("f1", "error: {x}")
+
+        self.assertRegex(
+            out.getvalue(), r"^  \[\d\d:\d\d:\d\d\] ⏳ f1: error: \{x\}\n$"
+        )
+
 
 class TestExecutionReport(unittest.TestCase):
     """Tests pour ExecutionReport."""
@@ -240,6 +326,14 @@ class TestExecutionReport(unittest.TestCase):
         self.assertEqual(data["total_features"], 5)
         self.assertEqual(data["started_at"], "2026-01-02T10:00:00")
         self.assertEqual(data["finished_at"], "2026-01-02T11:00:00")
+        self.assertEqual(
+            report.to_dict(iso_dates=False)["finished_at"], datetime(2026, 1, 2, 11, 0, 0)
+        )
+
+        # Immuable et sans __dict__
+        with self.assertRaises(AttributeError):
+            report.successful = 5
+        self.assertFalse(hasattr(report, "__dict__"))
 
 
 if __name__ == "__main__":
@@ -2,17 +2,71 @@
 
 import unittest
 import asyncio
+import dataclasses
+import inspect
 import json
+import subprocess
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, Mock
 from core.runner import ClaudeRunner, ClaudeResult
 
 
+# Sortie JSON d'une exécution Claude réussie
+_SUCCESS_OUTPUT = json.dumps({
+    "type": "result",
+    "subtype": "success",
+    "total_cost_usd": 0.001,
+    "duration_ms": 500,
+    "result": "Done",
+    "session_id": "session-123"
+}).encode()
+
+
+def _make_stream(data: bytes) -> asyncio.StreamReader:
+    """Crée un flux asyncio pré-rempli (stdout/stderr simulé)."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+def _async_return(value):
+    """Crée une fonction async qui retourne value."""
+    async def _f(*args, **kwargs):
+        return value
+    return _f
+
+
+def _async_raise(exc: BaseException):
+    """Crée une fonction async qui lève exc."""
+    async def _f(*args, **kwargs):
+        raise exc
+    return _f
+
+
+def _mock_process(returncode: int = 0, stdout: bytes = b"", stderr: bytes = b""):
+    """Crée un processus simulé dont stdout/stderr sont des flux réels.
+
+    Simple Mock restreint à l'interface de Process (plus léger qu'un
+    AsyncMock) ; seul wait() est une coroutine.
+    """
+    mock_process = Mock(spec=asyncio.subprocess.Process)
+    mock_process.returncode = returncode
+    mock_process.wait = _async_return(returncode)
+    mock_process.stdout = _make_stream(stdout)
+    mock_process.stderr = _make_stream(stderr)
+    return mock_process
+
+
 class TestClaudeRunner(unittest.TestCase):
     """Tests pour la classe ClaudeRunner."""
 
+    def setUp(self):
+        """Vide le cache de `claude --version` (partagé par le processus)."""
+        ClaudeRunner.clear_probe_cache()
+
     def test_init_default_parameters(self):
         """Test l'initialisation avec paramètres par défaut."""
         runner = ClaudeRunner()
@@ -40,6 +94,11 @@ class TestClaudeRunner(unittest.TestCase):
         self.assertEqual(runner.timeout_seconds, 3600)
         self.assertEqual(runner.claude_binary, "/custom/path/claude")
 
+    def test_init_rejects_unknown_output_format(self):
+        """Test le refus d'un format de sortie inconnu."""
+        with self.assertRaises(ValueError):
+            ClaudeRunner(output_format="xml")
+
     def test_check_claude_available_when_present(self):
         """Test la vérification de disponibilité de Claude (présent)."""
         runner = ClaudeRunner(claude_binary="echo")  # echo existe toujours
@@ -55,6 +114,66 @@ class TestClaudeRunner(unittest.TestCase):
         available = runner.check_claude_available()
         self.assertFalse(available)
 
+    def test_is_installed_does_not_spawn(self):
+        """Test la recherche du binaire dans le PATH, sans processus."""
+        with patch("subprocess.run") as mock_run:
+            self.assertTrue(ClaudeRunner(claude_binary="echo").is_installed())
+            self.assertFalse(
+                ClaudeRunner(claude_binary="nonexistent_binary_xyz").is_installed()
+            )
+
+        mock_run.assert_not_called()
+
+    def test_check_claude_available_is_cached(self):
+        """Test que la disponibilité n'est vérifiée qu'une fois."""
+        runner = ClaudeRunner(claude_binary="echo")
+
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            self.assertTrue(runner.check_claude_available())
+            self.assertTrue(runner.check_claude_available())
+            self.assertEqual(mock_run.call_count, 1)
+
+            ClaudeRunner.clear_probe_cache()
+            self.assertTrue(runner.check_claude_available())
+            self.assertEqual(mock_run.call_count, 2)
+
+    def test_probe_cache_shared_between_instances(self):
+        """Test que le cache de probe est partagé par binaire entre instances."""
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            self.assertTrue(ClaudeRunner(claude_binary="echo").check_claude_available())
+            self.assertTrue(ClaudeRunner(claude_binary="echo").check_claude_available())
+            self.assertFalse(
+                ClaudeRunner(claude_binary="nonexistent_binary_xyz").check_claude_available()
+            )
+
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_failed_probe_is_not_cached(self):
+        """Test qu'un échec passager (timeout) n'est pas mémorisé."""
+        runner = ClaudeRunner(claude_binary="echo")
+        timeout = subprocess.TimeoutExpired(["echo", "--version"], 5)
+
+        with patch("subprocess.run", side_effect=timeout):
+            self.assertFalse(runner.check_claude_available())
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            self.assertTrue(ClaudeRunner(claude_binary="echo").check_claude_available())
+            self.assertTrue(runner.check_claude_available())
+
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_probe_single_subprocess(self):
+        """Test que disponibilité et version viennent d'un seul appel."""
+        runner = ClaudeRunner(claude_binary="echo")
+
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            available, version = runner.probe()
+            self.assertTrue(runner.check_claude_available())
+            self.assertEqual(runner.get_claude_version(), version)
+            self.assertEqual(mock_run.call_count, 1)
+
+        self.assertTrue(available)
+        self.assertIsNotNone(version)
+
     def test_get_claude_version(self):
         """Test la récupération de la version Claude."""
         # Utiliser 'echo' pour simuler (retourne une chaîne)
@@ -73,7 +192,25 @@ class TestClaudeRunner(unittest.TestCase):
 
 
 class TestClaudeRunnerAsync(unittest.IsolatedAsyncioTestCase):
-    """Tests asynchrones pour ClaudeRunner."""
+    """Tests asynchrones pour ClaudeRunner.
+
+    asyncio.create_subprocess_exec est patché une fois par test dans
+    asyncSetUp ; chaque test ne configure que le processus simulé renvoyé.
+    """
+
+    async def asyncSetUp(self):
+        """Patche le lancement des processus Claude."""
+        patcher = patch("asyncio.create_subprocess_exec")
+        self.mock_exec = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _mock_claude_success(self) -> Mock:
+        """Crée un processus Claude simulé qui réussit (sortie encodée une fois).
+
+        Un nouveau processus est nécessaire à chaque appel : ses flux sont
+        consommés par la lecture.
+        """
+        return _mock_process(0, _SUCCESS_OUTPUT)
 
     async def test_run_single_success(self):
         """Test une exécution réussie."""
@@ -90,101 +227,162 @@ class TestClaudeRunnerAsync(unittest.IsolatedAsyncioTestCase):
             "session_id": "test-session-123"
         }
 
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            # Configurer le mock
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(
-                return_value=(
-                    json.dumps(mock_json).encode(),
-                    b""
-                )
-            )
-            mock_exec.return_value = mock_process
+        # Configurer le mock
+        mock_process = _mock_process(0, json.dumps(mock_json).encode())
+        self.mock_exec.return_value = mock_process
 
-            # Exécuter
-            result = await runner.run_single(
-                worktree_path=Path("/tmp/test"),
-                prompt="Test prompt",
-                feature_id="test-feature"
-            )
+        # Exécuter
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
+
+        # Vérifier
+        self.assertTrue(result.success)
+        self.assertEqual(result.feature_id, "test-feature")
+        self.assertEqual(result.cost_usd, 0.003)
+        self.assertEqual(result.duration_ms, 1234)
+        self.assertEqual(result.session_id, "test-session-123")
+        self.assertEqual(result.num_turns, 5)
+        self.assertIsNone(result.error)
 
-            # Vérifier
-            self.assertTrue(result.success)
-            self.assertEqual(result.feature_id, "test-feature")
-            self.assertEqual(result.cost_usd, 0.003)
-            self.assertEqual(result.duration_ms, 1234)
-            self.assertEqual(result.session_id, "test-session-123")
-            self.assertEqual(result.num_turns, 5)
-            self.assertIsNone(result.error)
+    async def test_run_single_command_line(self):
+        """Test la ligne de commande passée au binaire Claude."""
+        runner = ClaudeRunner(allowed_tools=["Read", "Write"])
+
+        self.mock_exec.return_value = _mock_process(0, b"{}")
+
+        await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature",
+            session_id="abc"
+        )
+
+        self.assertEqual(self.mock_exec.call_args.args, (
+            "claude", "-p", "Test prompt",
+            "--output-format", "json",
+            "--permission-mode", "acceptEdits",
+            "--allowedTools", "Read,Write",
+            "--resume", "abc"
+        ))
 
     async def test_run_single_process_error(self):
         """Test une exécution avec erreur de processus."""
         runner = ClaudeRunner()
 
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_process.communicate = AsyncMock(
-                return_value=(b"", b"Error: something went wrong")
-            )
-            mock_exec.return_value = mock_process
+        mock_process = _mock_process(1, stderr=b"Error: something went wrong")
+        self.mock_exec.return_value = mock_process
 
-            result = await runner.run_single(
-                worktree_path=Path("/tmp/test"),
-                prompt="Test prompt",
-                feature_id="test-feature"
-            )
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
 
-            self.assertFalse(result.success)
-            self.assertIn("something went wrong", result.error)
+        self.assertFalse(result.success)
+        self.assertIn("something went wrong", result.error)
 
     async def test_run_single_timeout(self):
         """Test une exécution qui timeout."""
         runner = ClaudeRunner(timeout_seconds=1)
 
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            # Simuler un processus qui ne termine jamais
-            mock_process = AsyncMock()
-            mock_process.communicate = AsyncMock(
-                side_effect=asyncio.TimeoutError()
-            )
-            mock_exec.return_value = mock_process
+        # Simuler un processus qui ne termine jamais
+        mock_process = _mock_process()
+        mock_process.stdout.read = _async_raise(asyncio.TimeoutError())
+        self.mock_exec.return_value = mock_process
 
-            result = await runner.run_single(
-                worktree_path=Path("/tmp/test"),
-                prompt="Test prompt",
-                feature_id="test-feature"
-            )
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
 
-            self.assertFalse(result.success)
-            self.assertIn("Timeout", result.error)
-            self.assertIn("1s", result.error)
+        self.assertFalse(result.success)
+        self.assertIn("Timeout", result.error)
+        self.assertIn("1s", result.error)
 
     async def test_run_single_json_parse_error(self):
         """Test une exécution avec JSON invalide."""
         runner = ClaudeRunner()
 
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(
-                return_value=(b"not valid json", b"")
-            )
-            mock_exec.return_value = mock_process
+        mock_process = _mock_process(0, b"not valid json")
+        self.mock_exec.return_value = mock_process
+
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("JSON parse error", result.error)
+
+    async def test_run_single_json_parse_error_without_orjson(self):
+        """Test le JSON invalide avec le repli sur json (stdlib)."""
+        runner = ClaudeRunner()
+
+        self.mock_exec.return_value = _mock_process(0, b"not valid json")
 
+        with patch("core.runner._json_loads", json.loads):
             result = await runner.run_single(
                 worktree_path=Path("/tmp/test"),
                 prompt="Test prompt",
                 feature_id="test-feature"
             )
 
-            self.assertFalse(result.success)
-            self.assertIn("JSON parse error", result.error)
+        self.assertFalse(result.success)
+        self.assertIn("JSON parse error", result.error)
+        self.assertEqual(result.result, "not valid json")
+
+    async def test_run_single_stream_json(self):
+        """Test le parsing ligne par ligne de la sortie stream-json."""
+        runner = ClaudeRunner(output_format="stream-json")
+
+        events = [
+            {"type": "system", "subtype": "init", "session_id": "s1"},
+            {"type": "assistant", "message": {"content": "x" * 200_000}},
+            {"type": "result", "subtype": "success", "total_cost_usd": 0.002,
+             "duration_ms": 42, "num_turns": 2, "result": "Done", "session_id": "s1"},
+        ]
+        stdout = b"".join(json.dumps(e).encode() + b"\n" for e in events)
+        self.mock_exec.return_value = _mock_process(0, stdout)
+
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.result, "Done")
+        self.assertEqual(result.duration_ms, 42)
+        self.assertEqual(result.num_turns, 2)
+        self.assertEqual(
+            self.mock_exec.call_args.args[3:6],
+            ("--output-format", "stream-json", "--verbose")
+        )
+
+    async def test_run_single_stream_json_without_result(self):
+        """Test une sortie stream-json sans événement result."""
+        runner = ClaudeRunner(output_format="stream-json")
+        self.mock_exec.return_value = _mock_process(0, b'{"type": "system"}\nnot json')
+
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("no result event", result.error)
+        self.assertTrue(result.result.startswith('{"type": "system"}'))
 
     async def test_run_single_file_not_found(self):
         """Test l'exécution avec binaire Claude introuvable."""
         runner = ClaudeRunner(claude_binary="nonexistent_binary_xyz")
+        self.mock_exec.side_effect = FileNotFoundError("nonexistent_binary_xyz")
 
         result = await runner.run_single(
             worktree_path=Path("/tmp/test"),
@@ -195,82 +393,155 @@ class TestClaudeRunnerAsync(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(result.success)
         self.assertIn("not found", result.error)
 
+    async def test_run_single_stderr_is_bounded(self):
+        """Test que stderr est tronqué à STDERR_LIMIT octets."""
+        from core.runner import STDERR_LIMIT
+
+        runner = ClaudeRunner()
+
+        self.mock_exec.return_value = _mock_process(
+            1, stderr=b"E" * (STDERR_LIMIT * 3)
+        )
+
+        result = await runner.run_single(
+            worktree_path=Path("/tmp/test"),
+            prompt="Test prompt",
+            feature_id="test-feature"
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.error), STDERR_LIMIT)
+
     async def test_run_wave_parallel(self):
         """Test l'exécution parallèle d'une vague."""
         runner = ClaudeRunner(max_parallel=2)
 
-        mock_json = {
-            "type": "result",
-            "subtype": "success",
-            "total_cost_usd": 0.001,
-            "duration_ms": 500,
-            "result": "Done",
-            "session_id": "session-123"
-        }
+        self.mock_exec.side_effect = lambda *args, **kwargs: self._mock_claude_success()
 
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(
-                return_value=(json.dumps(mock_json).encode(), b"")
-            )
-            mock_exec.return_value = mock_process
+        # Créer 3 tasks
+        tasks = [
+            (Path("/tmp/wt1"), "Prompt 1", "feature-1"),
+            (Path("/tmp/wt2"), "Prompt 2", "feature-2"),
+            (Path("/tmp/wt3"), "Prompt 3", "feature-3"),
+        ]
 
-            # Créer 3 tasks
-            tasks = [
-                (Path("/tmp/wt1"), "Prompt 1", "feature-1"),
-                (Path("/tmp/wt2"), "Prompt 2", "feature-2"),
-                (Path("/tmp/wt3"), "Prompt 3", "feature-3"),
-            ]
+        # Callback pour suivre la progression
+        progress_log = []
 
-            # Callback pour suivre la progression
-            progress_log = []
+        def on_progress(feature_id, status):
+            progress_log.append((feature_id, status))
 
-            def on_progress(feature_id, status):
-                progress_log.append((feature_id, status))
+        results = await runner.run_wave(tasks, on_progress=on_progress)
 
-            results = await runner.run_wave(tasks, on_progress=on_progress)
+        # Vérifier les résultats
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(results[0].feature_id, "feature-1")
+        self.assertEqual(results[1].feature_id, "feature-2")
+        self.assertEqual(results[2].feature_id, "feature-3")
 
-            # Vérifier les résultats
-            self.assertEqual(len(results), 3)
-            self.assertTrue(all(r.success for r in results))
-            self.assertEqual(results[0].feature_id, "feature-1")
-            self.assertEqual(results[1].feature_id, "feature-2")
-            self.assertEqual(results[2].feature_id, "feature-3")
+        # Vérifier que les callbacks ont été appelés
+        self.assertEqual(len(progress_log), 6)  # 3 started + 3 completed
 
-            # Vérifier que les callbacks ont été appelés
-            self.assertEqual(len(progress_log), 6)  # 3 started + 3 completed
+    async def test_run_wave_uses_bounded_worker_pool(self):
+        """Test qu'une grande vague ne crée que max_parallel tasks asyncio."""
+        runner = ClaudeRunner(max_parallel=2)
+        task_counts = []
+
+        async def fake_run_single(worktree_path, prompt, feature_id):
+            task_counts.append(len(asyncio.all_tasks()))
+            await asyncio.sleep(0)
+            return ClaudeResult(feature_id, True, "Done", 0.0, 0, "")
+
+        tasks = [(Path(f"/tmp/wt{i}"), f"Prompt {i}", f"feature-{i}") for i in range(20)]
+
+        with patch.object(runner, "run_single", side_effect=fake_run_single):
+            results = await runner.run_wave(tasks)
+
+        self.assertEqual([r.feature_id for r in results], [t[2] for t in tasks])
+        # Task du test + 2 workers
+        self.assertLessEqual(max(task_counts), 3)
+
+    async def test_run_wave_iter_yields_in_completion_order(self):
+        """Test que run_wave_iter produit les résultats dès qu'ils sont prêts."""
+        runner = ClaudeRunner(max_parallel=2)
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def fake_run_single(worktree_path, prompt, feature_id):
+            await asyncio.sleep(delays[feature_id])
+            return ClaudeResult(feature_id, True, "Done", 0.0, 0, "")
+
+        tasks = [
+            (Path("/tmp/wt1"), "Prompt 1", "slow"),
+            (Path("/tmp/wt2"), "Prompt 2", "fast"),
+        ]
+
+        with patch.object(runner, "run_single", side_effect=fake_run_single):
+            streamed = [r.feature_id async for r in runner.run_wave_iter(tasks)]
+            collected = [r.feature_id for r in await runner.run_wave(tasks)]
+
+        self.assertEqual(streamed, ["fast", "slow"])
+        self.assertEqual(collected, ["slow", "fast"])
+
+    async def test_run_wave_fail_fast_cancels_peers(self):
+        """Test que fail_fast annule les features restantes après un échec."""
+        runner = ClaudeRunner(max_parallel=3, fail_fast=True)
+
+        async def fake_run_single(worktree_path, prompt, feature_id):
+            if feature_id == "broken":
+                return ClaudeResult(feature_id, False, "", 0.0, 0, "", error="boom")
+            await asyncio.sleep(10)
+            return ClaudeResult(feature_id, True, "Done", 0.0, 0, "")
+
+        tasks = [
+            (Path("/tmp/wt1"), "Prompt 1", "slow"),
+            (Path("/tmp/wt2"), "Prompt 2", "broken"),
+        ]
+
+        with patch.object(runner, "run_single", side_effect=fake_run_single):
+            results = await asyncio.wait_for(runner.run_wave(tasks), timeout=5)
+
+        self.assertEqual([r.feature_id for r in results], ["slow", "broken"])
+        self.assertFalse(results[0].success)
+        self.assertIn("Annulé", results[0].error)
+        self.assertEqual(results[1].error, "boom")
+
+    async def test_run_one_reports_progress(self):
+        """Test l'exécution unitaire avec semaphore et progression."""
+        runner = ClaudeRunner(max_parallel=1)
+        progress_log = []
+
+        async def fake_run_single(worktree_path, prompt, feature_id):
+            self.assertTrue(runner.semaphore.locked())
+            return ClaudeResult(feature_id, False, "", 0.0, 0, "", error="boom")
+
+        with patch.object(runner, "run_single", side_effect=fake_run_single):
+            result = await runner.run_one(
+                Path("/tmp/wt1"), "Prompt", "feature-1",
+                on_progress=lambda fid, status: progress_log.append((fid, status))
+            )
+
+        self.assertFalse(result.success)
+        self.assertFalse(runner.semaphore.locked())
+        self.assertEqual(
+            progress_log, [("feature-1", "started"), ("feature-1", "failed")]
+        )
 
     async def test_run_sequential(self):
         """Test l'exécution séquentielle."""
         runner = ClaudeRunner()
 
-        mock_json = {
-            "type": "result",
-            "subtype": "success",
-            "total_cost_usd": 0.001,
-            "duration_ms": 500,
-            "result": "Done",
-            "session_id": "session-123"
-        }
-
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(
-                return_value=(json.dumps(mock_json).encode(), b"")
-            )
-            mock_exec.return_value = mock_process
+        self.mock_exec.side_effect = lambda *args, **kwargs: self._mock_claude_success()
 
-            tasks = [
-                (Path("/tmp/wt1"), "Prompt 1", "feature-1"),
-                (Path("/tmp/wt2"), "Prompt 2", "feature-2"),
-            ]
+        tasks = [
+            (Path("/tmp/wt1"), "Prompt 1", "feature-1"),
+            (Path("/tmp/wt2"), "Prompt 2", "feature-2"),
+        ]
 
-            results = await runner.run_sequential(tasks)
+        results = await runner.run_sequential(tasks)
 
-            self.assertEqual(len(results), 2)
-            self.assertTrue(all(r.success for r in results))
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(r.success for r in results))
 
 
 class TestClaudeResult(unittest.TestCase):
@@ -298,6 +569,55 @@ class TestClaudeResult(unittest.TestCase):
         self.assertEqual(data["started_at"], "2026-01-02T10:00:00")
         self.assertEqual(data["finished_at"], "2026-01-02T10:01:00")
 
+        # Datetime bruts pour un sérialiseur natif (orjson)
+        raw = result.to_dict(iso_dates=False)
+        self.assertEqual(raw["started_at"], datetime(2026, 1, 2, 10, 0, 0))
+        self.assertEqual({**raw, "started_at": None, "finished_at": None},
+                         {**data, "started_at": None, "finished_at": None})
+
+    def test_result_is_immutable(self):
+        """Test que ClaudeResult est immuable et sans __dict__."""
+        result = ClaudeResult("test", True, "Done", 0.5, 1000, "abc123")
+
+        with self.assertRaises(AttributeError):
+            result.success = False
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertIsNone(result.error)
+        self.assertEqual(result.num_turns, 0)
+        self.assertEqual(result, ClaudeResult("test", True, "Done", 0.5, 1000,
+                                              "abc123", started_ns=1))
+
+    def test_result_slots_match_init(self):
+        """Test que __slots__, les champs et __init__ restent synchronisés."""
+        field_names = [f.name for f in dataclasses.fields(ClaudeResult)]
+        init_params = list(inspect.signature(ClaudeResult.__init__).parameters)[1:]
+
+        self.assertEqual(list(ClaudeResult.__slots__), init_params)
+        self.assertEqual(init_params, field_names + ["started_ns", "finished_ns"])
+
+    def test_replace_drops_monotonic_timestamps(self):
+        """Test que replace() conserve les champs mais pas les horodatages monotones."""
+        result = ClaudeResult("test", True, "Done", 0.5, 1000, "abc123",
+                              num_turns=3, started_ns=1, finished_ns=2)
+
+        copy = dataclasses.replace(result, error="Failed")
+
+        self.assertEqual(copy.error, "Failed")
+        self.assertEqual(copy.num_turns, 3)
+        self.assertIsNone(copy.started_ns)
+        self.assertIsNone(copy.finished_ns)
+
+    def test_to_dict_without_timestamps(self):
+        """Test la conversion quand les horodatages sont absents."""
+        result = ClaudeResult("test", False, "", 0.0, 0, "", error="Failed")
+
+        data = result.to_dict()
+
+        self.assertIsNone(data["started_at"])
+        self.assertIsNone(data["finished_at"])
+        self.assertEqual(data["error"], "Failed")
+        self.assertEqual(data["num_turns"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,90 +1,231 @@
 """Tests unitaires pour le Worktree Manager."""
 
 import unittest
+import asyncio
+import os
+import re
 import tempfile
 import shutil
-import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
+from subprocess import DEVNULL, PIPE, Popen, check_output, run as _run
+from typing import Optional, Set
+from unittest.mock import patch
 from core.worktree import WorktreeManager, WorktreeError
 
 
-class TestWorktreeManager(unittest.TestCase):
-    """Tests pour la classe WorktreeManager."""
-
-    def setUp(self):
-        """Crée un repo Git temporaire pour les tests."""
-        # Créer un répertoire temporaire
-        self.test_dir = Path(tempfile.mkdtemp())
-        self.repo_path = self.test_dir / "test_repo"
-        self.repo_path.mkdir()
-
-        # Initialiser un repo Git
-        subprocess.run(
-            ["git", "init"],
-            cwd=self.repo_path,
-            capture_output=True,
-            check=True
-        )
-
-        # Configurer Git pour les tests
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=self.repo_path,
-            capture_output=True,
-            check=True
+# Préfixe des répertoires temporaires : identifie le worker quand la suite
+# est répartie sur plusieurs processus (pytest -n)
+_TMP_PREFIX = f"rorch-{os.getpid()}-"
+
+# Racine des répertoires temporaires : /dev/shm (tmpfs) si disponible, pour
+# que les écritures de git ne touchent pas le disque ; sinon le défaut
+_TMP_ROOT = (
+    "/dev/shm"
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else None
+)
+
+# git résolu une seule fois ; les tests le lancent sans config globale ni
+# système (ni redirection xcrun sur macOS) et sans invite interactive
+_GIT = shutil.which("git") or "git"
+_GIT_ENV = {
+    "PATH": os.environ.get("PATH", os.defpath),
+    "GIT_EXEC_PATH": check_output([_GIT, "--exec-path"], text=True).strip(),
+    "HOME": tempfile.gettempdir(),
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+# Version de git (majeure, mineure), lue une seule fois à l'import
+_GIT_VERSION = tuple(
+    int(part) for part in re.match(
+        r"git version (\d+)\.(\d+)",
+        check_output([_GIT, "--version"], env=_GIT_ENV, text=True)
+    ).groups()
+)
+
+# Nombre de copies du repo modèle préparées d'avance
+_RESERVE_SIZE = 2
+
+# Construction du repo modèle : un seul commit (README.md et CLAUDE.md)
+# directement sur main, sans fsync (réglage ignoré avant git 2.36). Objets
+# et refs sont regroupés dans un packfile et packed-refs : chaque test ne
+# copie qu'une dizaine de fichiers (pas de hooks d'exemple), sans git.
+_TEMPLATE_SCRIPT = """
+set -e
+git -c init.defaultBranch=main init -q --template=
+git config user.email test@example.com
+git config user.name "Test User"
+git config core.fsync none
+printf '# Test Repo\\n' > README.md
+printf '# Project Instructions\\n\\nTest content.' > CLAUDE.md
+git update-index --add README.md CLAUDE.md
+git commit -q -m "Initial commit"
+git repack -adq
+git pack-refs --all
+"""
+
+
+# `rm -rf` parcourt l'arbre hors de l'interpréteur : le thread de
+# suppression ne dispute pas le GIL au test en cours
+_RM = shutil.which("rm")
+
+
+def _remove_tree(path: Path):
+    """Supprime un répertoire et son contenu, erreurs ignorées.
+
+    Args:
+        path: Répertoire à supprimer
+    """
+    if _RM:
+        _run(
+            [_RM, "-rf", str(path)],
+            stdout=DEVNULL,
+            stderr=DEVNULL
         )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=self.repo_path,
-            capture_output=True,
+    else:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _live_features(manager: WorktreeManager) -> Set[str]:
+    """Noms des worktrees présents sur disque, en un seul os.scandir.
+
+    Args:
+        manager: Manager dont on lit le répertoire worktrees_base
+
+    Returns:
+        Ensemble des noms de répertoires de worktrees_base
+    """
+    with os.scandir(manager.worktrees_base) as entries:
+        return {entry.name for entry in entries if entry.is_dir()}
+
+
+def _commit_file(repo: Path, name: str, content: str, message: str):
+    """Écrit un fichier et le commite dans repo.
+
+    `git update-index --add` indexe ce seul chemin, sans le parcours de
+    pathspec ni le rafraîchissement de l'index que fait `git add`.
+
+    Args:
+        repo: Repo ou worktree où commiter
+        name: Chemin du fichier, relatif à repo
+        content: Contenu du fichier
+        message: Message de commit
+    """
+    (repo / name).write_text(content)
+    for args in (["update-index", "--add", "--", name], ["commit", "-q", "-m", message]):
+        _run(
+            [_GIT, *args],
+            cwd=repo,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
             check=True
         )
 
-        # Créer un commit initial sur main
-        readme = self.repo_path / "README.md"
-        readme.write_text("# Test Repo\n")
 
-        subprocess.run(
-            ["git", "add", "README.md"],
-            cwd=self.repo_path,
-            capture_output=True,
-            check=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=self.repo_path,
-            capture_output=True,
-            check=True
-        )
+class _RevResolver:
+    """Résout des révisions via un processus `git cat-file --batch-check` persistant.
 
-        # Créer un CLAUDE.md pour tester la copie
-        claude_md = self.repo_path / "CLAUDE.md"
-        claude_md.write_text("# Project Instructions\n\nTest content.")
+    Chaque résolution n'est qu'un aller-retour sur un pipe : un test qui
+    interroge plusieurs fois le repo ne relance pas git à chaque fois.
+    """
 
-        subprocess.run(
-            ["git", "add", "CLAUDE.md"],
-            cwd=self.repo_path,
-            capture_output=True,
-            check=True
+    def __init__(self, repo: Path):
+        self._proc = Popen(
+            [_GIT, "cat-file", "--batch-check"],
+            cwd=repo,
+            env=_GIT_ENV,
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=DEVNULL,
+            text=True
         )
-        subprocess.run(
-            ["git", "commit", "-m", "Add CLAUDE.md"],
-            cwd=self.repo_path,
-            capture_output=True,
+
+    def __call__(self, rev: str) -> Optional[str]:
+        """Retourne le SHA de rev, ou None si elle est introuvable."""
+        self._proc.stdin.write(f"{rev}\n")
+        self._proc.stdin.flush()
+        # "<oid> <type> <taille>" si trouvé, "<rev> missing" sinon
+        parts = self._proc.stdout.readline().split()
+        return parts[0] if len(parts) == 3 else None
+
+    def close(self):
+        """Arrête le processus git."""
+        self._proc.stdin.close()
+        self._proc.wait()
+        self._proc.stdout.close()
+
+
+class TestWorktreeManager(unittest.TestCase):
+    """Tests pour la classe WorktreeManager."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Construit une seule fois le repo Git modèle copié par chaque test."""
+        # Tout ce qui est créé ici est libéré par une seule pile, même si
+        # setUpClass échoue en cours de route
+        cls._stack = ExitStack()
+        cls.addClassCleanup(cls._stack.close)
+        cls._template_root = Path(cls._stack.enter_context(
+            tempfile.TemporaryDirectory(prefix=_TMP_PREFIX, dir=_TMP_ROOT)
+        ))
+        cls._template_dir = cls._template_root / "template"
+        cls._template_dir.mkdir()
+
+        # Init, config et commits initiaux en un seul processus shell
+        _run(
+            ["sh", "-c", _TEMPLATE_SCRIPT],
+            cwd=cls._template_dir,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
             check=True
         )
 
-        # S'assurer qu'on est sur main
-        subprocess.run(
-            ["git", "checkout", "-b", "main"],
-            cwd=self.repo_path,
-            capture_output=True
+        # Les répertoires des tests terminés y sont renommés puis supprimés
+        # en arrière-plan (même système de fichiers : rename immédiat)
+        cls._graveyard = cls._template_root / "graveyard"
+        cls._graveyard.mkdir()
+        cls._reaper = cls._stack.enter_context(ThreadPoolExecutor(max_workers=2))
+
+        # Réserve de copies du modèle préparées en arrière-plan : chaque
+        # test en prend une prête et lance la copie du suivant
+        cls._builder = ThreadPoolExecutor(max_workers=1)
+        cls._stack.callback(cls._builder.shutdown, wait=True, cancel_futures=True)
+        cls._reserve = deque(
+            cls._builder.submit(cls._prepare_test_dir) for _ in range(_RESERVE_SIZE)
         )
 
-    def tearDown(self):
-        """Nettoie les fichiers temporaires."""
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
+    @classmethod
+    def _prepare_test_dir(cls) -> Path:
+        """Copie le repo modèle dans un nouveau répertoire de test.
+
+        Returns:
+            Répertoire de test contenant la copie (sous-dossier test_repo)
+        """
+        test_dir = Path(tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=cls._template_root))
+        shutil.copytree(cls._template_dir, test_dir / "test_repo")
+        return test_dir
+
+    def setUp(self):
+        """Prend une copie du repo modèle dans la réserve."""
+        self.test_dir = self._reserve.popleft().result()
+        self.addCleanup(self._bury, self.test_dir)
+        self._reserve.append(self._builder.submit(self._prepare_test_dir))
+        self.repo_path = self.test_dir / "test_repo"
+
+    def _bury(self, test_dir: Path):
+        """Écarte un répertoire de test ; la suppression se fait en arrière-plan."""
+        target = self._graveyard / test_dir.name
+        os.rename(test_dir, target)
+        self._reaper.submit(_remove_tree, target)
 
     def test_init_with_valid_repo(self):
         """Test l'initialisation avec un repo Git valide."""
@@ -109,18 +250,204 @@ class TestWorktreeManager(unittest.TestCase):
         self.assertEqual(manager.worktrees_base, custom_base)
         self.assertTrue(custom_base.exists())
 
+    def test_init_with_invalid_checkout_strategy(self):
+        """Test le rejet d'une stratégie de checkout inconnue."""
+        with self.assertRaises(ValueError):
+            WorktreeManager(self.repo_path, checkout_strategy="hardlink")
+
+    def test_create_worktree_parallel_checkout(self):
+        """Test la création d'un worktree avec checkout parallèle."""
+        manager = WorktreeManager(self.repo_path, checkout_strategy="parallel")
+        worktree_path = manager.create("test-feature", base_branch="main")
+
+        self.assertTrue((worktree_path / "README.md").exists())
+        self.assertIn("test-feature", manager.active_worktrees)
+
+    def test_create_runs_a_single_worktree_add(self):
+        """Test que create() peuple le worktree via un seul `git worktree add`."""
+        manager = WorktreeManager(self.repo_path)
+
+        with patch.object(manager, "_run_git", wraps=manager._run_git) as run_git:
+            worktree_path = manager.create("test-feature", base_branch="main")
+
+        commands = [call.args[0] for call in run_git.call_args_list]
+        self.assertEqual(len(commands), 1)
+        self.assertEqual(commands[0][:3], ["worktree", "add", "-b"])
+        self.assertTrue((worktree_path / "README.md").exists())
+
+    def test_create_many_serializes_registrations(self):
+        """Test que create_many enregistre un worktree à la fois puis checkout en parallèle."""
+        manager = WorktreeManager(self.repo_path)
+        run_git = manager._run_git
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+        checkouts = []
+
+        def tracking_run_git(args, capture=False):
+            if "reset" in args:
+                checkouts.append(args[1])
+            if args[:2] != ["worktree", "add"]:
+                return run_git(args, capture)
+            with lock:
+                overlaps.append(bool(running))
+                running.append(args)
+            try:
+                return run_git(args, capture)
+            finally:
+                with lock:
+                    running.remove(args)
+
+        # Plusieurs workers même sur une machine mono-cœur
+        with patch("core.worktree.os.cpu_count", return_value=4), \
+                patch.object(manager, "_run_git", side_effect=tracking_run_git):
+            paths = manager.create_many(
+                ["feature-a", "feature-b", "feature-c", "feature-d"], base_branch="main"
+            )
+
+        self.assertEqual(overlaps, [False] * 4)
+        self.assertEqual(sorted(checkouts), sorted(str(p) for p in paths))
+        for path in paths:
+            self.assertTrue((path / "README.md").exists())
+
+    def test_forced_recreate_is_serialized_with_registrations(self):
+        """Test que la suppression forcée ne chevauche pas les enregistrements."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create("feature-a", base_branch="main")
+        run_git = manager._run_git
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+
+        def tracking_run_git(args, capture=False):
+            if args[:2] not in (["worktree", "add"], ["worktree", "remove"],
+                                ["branch", "-D"]):
+                return run_git(args, capture)
+            with lock:
+                overlaps.append(bool(running))
+                running.append(args)
+            try:
+                time.sleep(0.01)  # élargit la fenêtre de chevauchement
+                return run_git(args, capture)
+            finally:
+                with lock:
+                    running.remove(args)
+
+        with patch("core.worktree.os.cpu_count", return_value=4), \
+                patch.object(manager, "_run_git", side_effect=tracking_run_git):
+            paths = manager.create_many(
+                ["feature-a", "feature-b", "feature-c"], base_branch="main", force=True
+            )
+
+        self.assertEqual(len(overlaps), 5)
+        self.assertNotIn(True, overlaps)
+        for path in paths:
+            self.assertTrue((path / "README.md").exists())
+
+    def test_failed_checkout_rolls_back_worktree(self):
+        """Test qu'un checkout en échec ne laisse ni worktree ni branche."""
+        manager = WorktreeManager(self.repo_path)
+        checkout_args = manager._checkout_args
+
+        def failing_checkout_args(worktree_path):
+            # `reset --hard` vers une révision inexistante : échec garanti
+            return [*checkout_args(worktree_path), "nonexistent"]
+
+        with patch.object(manager, "_checkout_args", side_effect=failing_checkout_args):
+            with self.assertRaises(WorktreeError):
+                manager.create_many(["feature-a"], base_branch="main")
+            with self.assertRaises(WorktreeError):
+                asyncio.run(manager.create_async("feature-b", base_branch="main"))
+
+        for fid in ("feature-a", "feature-b"):
+            with self.subTest(fid):
+                self.assertFalse((manager.worktrees_base / fid).exists())
+                self.assertFalse((self.repo_path / ".git" / "worktrees" / fid).exists())
+                self.assertFalse(manager._object_exists(f"feature/{fid}"))
+                self.assertNotIn(fid, manager.active_worktrees)
+
+        # La feature peut être recréée normalement
+        manager.create("feature-a", base_branch="main")
+
+    def test_cancelled_create_async_releases_registration_lock(self):
+        """Test qu'une création annulée en attente du verrou ne le garde pas."""
+        manager = WorktreeManager(self.repo_path)
+
+        async def scenario():
+            manager._add_lock.acquire()
+            task = asyncio.ensure_future(
+                manager.create_async("feature-a", base_branch="main")
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            manager._add_lock.release()
+            # Le thread d'attente obtient le verrou puis le relâche
+            await asyncio.sleep(0.2)
+
+        asyncio.run(scenario())
+
+        self.assertTrue(manager._add_lock.acquire(blocking=False))
+        manager._add_lock.release()
+        self.assertNotIn("feature-a", manager.active_worktrees)
+
+    def test_concurrent_registrations_are_serialized(self):
+        """Test que les `git worktree add` simultanés passent un par un."""
+        manager = WorktreeManager(self.repo_path)
+        run_git_async = manager._run_git_async
+        running = []
+        overlaps = []
+
+        async def tracking_run_git_async(args):
+            if args[:2] != ["worktree", "add"]:
+                return await run_git_async(args)
+            overlaps.append(bool(running))
+            running.append(args)
+            try:
+                return await run_git_async(args)
+            finally:
+                running.remove(args)
+
+        async def create_wave():
+            return await asyncio.gather(*(
+                manager.create_async(fid, base_branch="main")
+                for fid in ("feature-a", "feature-b", "feature-c")
+            ))
+
+        with patch.object(manager, "_run_git_async", side_effect=tracking_run_git_async):
+            paths = asyncio.run(create_wave())
+
+        self.assertEqual(overlaps, [False] * 3)
+        for path in paths:
+            self.assertTrue((path / "README.md").exists())
+
     def test_create_worktree(self):
-        """Test la création d'un worktree."""
+        """Test la création d'un worktree et sa consultation (exists, get_path)."""
         manager = WorktreeManager(self.repo_path)
+
+        # Worktree inexistant
+        self.assertFalse(manager.exists("test-feature"))
+        self.assertIsNone(manager.get_path("test-feature"))
+
         worktree_path = manager.create("test-feature", base_branch="main")
 
-        # Vérifier que le worktree existe
-        self.assertTrue(worktree_path.exists())
-        self.assertTrue((worktree_path / "README.md").exists())
+        with self.subTest("worktree"):
+            self.assertTrue(worktree_path.exists())
+            self.assertTrue((worktree_path / "README.md").exists())
 
-        # Vérifier qu'il est enregistré
-        self.assertIn("test-feature", manager.active_worktrees)
-        self.assertEqual(manager.active_worktrees["test-feature"].path, worktree_path)
+        with self.subTest("active_worktrees"):
+            self.assertIn("test-feature", manager.active_worktrees)
+            self.assertEqual(manager.active_worktrees["test-feature"].path, worktree_path)
+
+        with self.subTest("exists"):
+            self.assertTrue(manager.exists("test-feature"))
+
+        with self.subTest("get_path"):
+            self.assertEqual(manager.get_path("test-feature"), worktree_path)
+
+        manager.remove("test-feature", force=True)
+        self.assertFalse(manager.exists("test-feature"))
 
     def test_create_worktree_copies_claude_md(self):
         """Test que CLAUDE.md est copié dans le worktree."""
@@ -135,6 +462,88 @@ class TestWorktreeManager(unittest.TestCase):
         self.assertIn("Current Feature (Worktree)", content)
         self.assertIn("test-feature", content)
 
+    def test_claude_md_rendered_from_template(self):
+        """Test le rendu du template CLAUDE.md du worktree."""
+        manager = WorktreeManager(self.repo_path)
+        worktree_path = manager.create("test-feature", base_branch="main")
+
+        content = (worktree_path / "CLAUDE.md").read_text()
+        self.assertIn("**Feature ID:** test-feature", content)
+        self.assertIn("**Branch:** feature/test-feature", content)
+        self.assertIn(f"**Worktree:** {worktree_path}", content)
+
+    def test_create_many(self):
+        """Test la création parallèle de plusieurs worktrees."""
+        manager = WorktreeManager(self.repo_path)
+        paths = manager.create_many(
+            ["feature-a", "feature-b", "feature-c"], base_branch="main"
+        )
+
+        self.assertEqual(
+            [p.name for p in paths], ["feature-a", "feature-b", "feature-c"]
+        )
+        for path in paths:
+            self.assertTrue((path / "README.md").exists())
+        self.assertEqual(len(manager.active_worktrees), 3)
+
+    def test_create_many_invalid_base_branch(self):
+        """Test que create_many échoue avant toute création si la base est introuvable."""
+        manager = WorktreeManager(self.repo_path)
+
+        with self.assertRaises(WorktreeError):
+            manager.create_many(["feature-a"], base_branch="nonexistent")
+
+        self.assertEqual(len(manager.active_worktrees), 0)
+
+    def test_create_from_commit(self):
+        """Test la création d'un worktree à partir d'un commit."""
+        # Avancer main pour que le commit de départ ne soit pas sa tête
+        _commit_file(self.repo_path, "NOTES.md", "notes", "Second commit")
+        resolve = _RevResolver(self.repo_path)
+        self.addCleanup(resolve.close)
+        first_commit = resolve("HEAD~1")
+
+        manager = WorktreeManager(self.repo_path)
+        worktree_path = manager.create_from_commit("test-feature", first_commit)
+
+        self.assertTrue((worktree_path / "README.md").exists())
+        # HEAD du worktree, lu depuis le repo principal par le même processus
+        self.assertEqual(resolve("worktrees/test-feature/HEAD"), first_commit)
+
+    def test_create_from_unknown_commit(self):
+        """Test la création à partir d'un commit inexistant."""
+        manager = WorktreeManager(self.repo_path)
+
+        with self.assertRaises(WorktreeError):
+            manager.create_from_commit("test-feature", "0" * 40)
+
+        self.assertNotIn("test-feature", manager.active_worktrees)
+
+    def test_create_async(self):
+        """Test la création asynchrone de worktrees."""
+        manager = WorktreeManager(self.repo_path)
+
+        async def create_wave():
+            return await asyncio.gather(
+                manager.create_async("feature-a", base_branch="main"),
+                manager.create_async("feature-b", base_branch="main"),
+            )
+
+        paths = asyncio.run(create_wave())
+
+        self.assertEqual([p.name for p in paths], ["feature-a", "feature-b"])
+        self.assertTrue((paths[0] / "CLAUDE.md").exists())
+        self.assertEqual(
+            manager.active_worktrees["feature-b"].branch_name, "feature/feature-b"
+        )
+
+    def test_create_async_invalid_base_branch(self):
+        """Test la création asynchrone avec une branche de base inexistante."""
+        manager = WorktreeManager(self.repo_path)
+
+        with self.assertRaises(WorktreeError):
+            asyncio.run(manager.create_async("feature-a", base_branch="nonexistent"))
+
     def test_create_worktree_already_exists(self):
         """Test la création d'un worktree qui existe déjà."""
         manager = WorktreeManager(self.repo_path)
@@ -160,6 +569,20 @@ class TestWorktreeManager(unittest.TestCase):
         self.assertEqual(path1, path2)
         self.assertFalse((path2 / "test.txt").exists())
 
+    def test_force_recreate_many(self):
+        """Test la recréation complète d'une vague de worktrees."""
+        manager = WorktreeManager(self.repo_path)
+        paths = manager.create_many(["feature-a", "feature-b"], base_branch="main")
+        (paths[0] / "test.txt").write_text("modified")
+
+        recreated = manager.force_recreate_many(
+            ["feature-a", "feature-b", "feature-c"], base_branch="main"
+        )
+
+        self.assertEqual(recreated[:2], paths)
+        self.assertFalse((recreated[0] / "test.txt").exists())
+        self.assertEqual(len(manager.active_worktrees), 3)
+
     def test_create_worktree_invalid_base_branch(self):
         """Test la création avec une branche de base inexistante."""
         manager = WorktreeManager(self.repo_path)
@@ -169,6 +592,42 @@ class TestWorktreeManager(unittest.TestCase):
 
         self.assertIn("introuvable", str(ctx.exception))
 
+    def test_base_branch_verified_once(self):
+        """Test que la branche de base n'est vérifiée qu'une fois."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create("feature-a", base_branch="main")
+
+        with patch.object(manager, "_object_exists") as object_exists:
+            manager.create("feature-b", base_branch="main")
+
+        object_exists.assert_not_called()
+
+    def test_base_branch_check_reuses_catfile_process(self):
+        """Test que les vérifications partagent un seul processus git cat-file."""
+        manager = WorktreeManager(self.repo_path)
+
+        self.assertTrue(manager._object_exists("main"))
+        proc = manager._catfile_proc
+        self.assertFalse(manager._object_exists("nonexistent"))
+        self.assertIs(manager._catfile_proc, proc)
+
+        manager.close()
+        self.assertIsNone(manager._catfile_proc)
+        self.assertIsNotNone(proc.returncode)
+
+    def test_invalidate_branch_cache(self):
+        """Test l'invalidation du cache des branches vérifiées."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create("feature-a", base_branch="main")
+        self.assertIn("main", manager._verified_branches)
+
+        manager.invalidate_branch_cache("main")
+        self.assertNotIn("main", manager._verified_branches)
+
+        manager.create("feature-b", base_branch="main")
+        manager.invalidate_branch_cache()
+        self.assertEqual(len(manager._verified_branches), 0)
+
     def test_remove_worktree(self):
         """Test la suppression d'un worktree."""
         manager = WorktreeManager(self.repo_path)
@@ -205,30 +664,41 @@ class TestWorktreeManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertFalse(worktree_path.exists())
 
-    def test_exists(self):
-        """Test la vérification de l'existence d'un worktree."""
+    def test_run_git_decodes_stderr_on_failure(self):
+        """Test que stderr n'est décodé qu'en cas d'échec sans capture."""
         manager = WorktreeManager(self.repo_path)
 
-        self.assertFalse(manager.exists("test-feature"))
-
-        manager.create("test-feature", base_branch="main")
-        self.assertTrue(manager.exists("test-feature"))
+        ok = manager._run_git(["rev-parse", "--verify", "main"])
+        self.assertEqual(ok.returncode, 0)
+        self.assertIsNone(ok.stdout)
 
-        manager.remove("test-feature", force=True)
-        self.assertFalse(manager.exists("test-feature"))
+        failed = manager._run_git(["rev-parse", "--verify", "nonexistent"])
+        self.assertNotEqual(failed.returncode, 0)
+        self.assertIsInstance(failed.stderr, str)
 
-    def test_get_path(self):
-        """Test la récupération du chemin d'un worktree."""
+    def test_remove_fast(self):
+        """Test la suppression d'un worktree sans passer par git."""
         manager = WorktreeManager(self.repo_path)
+        worktree_path = manager.create("test-feature", base_branch="main")
+        (worktree_path / "test.txt").write_text("uncommitted")
 
-        # Worktree inexistant
-        path = manager.get_path("test-feature")
-        self.assertIsNone(path)
+        result = manager.remove_fast("test-feature")
+
+        self.assertTrue(result)
+        self.assertFalse(worktree_path.exists())
+        self.assertNotIn("test-feature", manager.active_worktrees)
+        self.assertFalse((self.repo_path / ".git" / "worktrees" / "test-feature").exists())
+        self.assertFalse(manager.remove_fast("test-feature"))
 
-        # Worktree existant
-        created_path = manager.create("test-feature", base_branch="main")
-        path = manager.get_path("test-feature")
-        self.assertEqual(path, created_path)
+        # Git ne voit plus le worktree : la branche peut être supprimée
+        _run(
+            [_GIT, "branch", "-D", "feature/test-feature"],
+            cwd=self.repo_path,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            check=True
+        )
 
     def test_list_active(self):
         """Test la liste des worktrees actifs."""
@@ -238,19 +708,29 @@ class TestWorktreeManager(unittest.TestCase):
         active = manager.list_active()
         self.assertEqual(len(active), 0)
 
-        # Créer plusieurs worktrees
-        manager.create("feature-a", base_branch="main")
-        manager.create("feature-b", base_branch="main")
+        # Créer plusieurs worktrees (en parallèle)
+        manager.create_many(["feature-a", "feature-b"], base_branch="main")
 
         active = manager.list_active()
         self.assertEqual(len(active), 2)
         self.assertIn("feature-a", active)
         self.assertIn("feature-b", active)
+        self.assertEqual(_live_features(manager), {"feature-a", "feature-b"})
 
         # Les infos sont correctes
         self.assertEqual(active["feature-a"].feature_id, "feature-a")
         self.assertEqual(active["feature-a"].branch_name, "feature/feature-a")
 
+    def test_worktree_info_is_immutable(self):
+        """Test que WorktreeInfo est immuable et hashable."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create("feature-a", base_branch="main")
+        info = manager.list_active()["feature-a"]
+
+        with self.assertRaises(AttributeError):
+            info.branch_name = "other"
+        self.assertIn(info, {info})
+
     def test_list_all_worktrees(self):
         """Test la liste de tous les worktrees Git."""
         manager = WorktreeManager(self.repo_path)
@@ -268,14 +748,55 @@ class TestWorktreeManager(unittest.TestCase):
         )
         self.assertIsNotNone(feature_wt)
 
+    def test_list_all_worktrees_fields(self):
+        """Test le parsing incrémental des champs du format porcelain."""
+        manager = WorktreeManager(self.repo_path)
+        path = manager.create("feature-a", base_branch="main")
+
+        by_branch = {wt.get("branch"): wt for wt in manager.list_all_worktrees()}
+        feature_wt = by_branch["refs/heads/feature/feature-a"]
+
+        self.assertEqual(Path(feature_wt["path"]).resolve(), path.resolve())
+        self.assertEqual(len(feature_wt["head"]), 40)
+
+    def test_list_all_worktrees_reports_git_error(self):
+        """Test que l'erreur de git (lue après stdout) est remontée."""
+        manager = WorktreeManager(self.repo_path)
+        shutil.rmtree(self.repo_path / ".git")
+
+        with self.assertRaisesRegex(WorktreeError, "not a git repository"):
+            manager.list_all_worktrees()
+
+    def test_list_by_prefix(self):
+        """Test le filtrage des worktrees par préfixe de répertoire."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create_many(["demo-a", "demo-b", "other"], base_branch="main")
+
+        names = sorted(Path(wt["path"]).name for wt in manager.list_by_prefix("demo-"))
+
+        self.assertEqual(names, ["demo-a", "demo-b"])
+        self.assertEqual(manager.list_by_prefix("missing-"), [])
+
+    def test_scan_active_sees_worktrees_from_another_manager(self):
+        """Test que scan_active retrouve les worktrees créés par un autre processus."""
+        WorktreeManager(self.repo_path).create_many(["scan-a", "scan-b"], base_branch="main")
+        # Répertoire sans worktree git associé : ignoré
+        (self.repo_path.parent / "worktrees" / "stray").mkdir()
+
+        manager = WorktreeManager(self.repo_path)
+        active = manager.scan_active()
+
+        self.assertEqual(sorted(active), ["scan-a", "scan-b"])
+        self.assertEqual(active["scan-a"].branch_name, "feature/scan-a")
+        self.assertEqual(active["scan-a"].path, manager.worktrees_base / "scan-a")
+        self.assertEqual(manager.list_active(), {})
+
     def test_cleanup_all(self):
         """Test la suppression de tous les worktrees."""
         manager = WorktreeManager(self.repo_path)
 
-        # Créer plusieurs worktrees
-        manager.create("feature-a", base_branch="main")
-        manager.create("feature-b", base_branch="main")
-        manager.create("feature-c", base_branch="main")
+        # Créer plusieurs worktrees (en parallèle)
+        manager.create_many(["feature-a", "feature-b", "feature-c"], base_branch="main")
 
         self.assertEqual(len(manager.active_worktrees), 3)
 
@@ -283,10 +804,72 @@ class TestWorktreeManager(unittest.TestCase):
         manager.cleanup_all()
 
         self.assertEqual(len(manager.active_worktrees), 0)
-        self.assertFalse(manager.exists("feature-a"))
-        self.assertFalse(manager.exists("feature-b"))
-        self.assertFalse(manager.exists("feature-c"))
+        self.assertEqual(_live_features(manager), set())
+
+    def test_cleanup_all_keeps_locked_worktrees(self):
+        """Test que cleanup_all respecte les verrous `git worktree lock`."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create_many(["feature-a", "feature-b"], base_branch="main")
+        locked_path = manager.worktrees_base / "feature-a"
+        manager._run_git(["worktree", "lock", str(locked_path)])
+
+        manager.cleanup_all()
+
+        self.assertTrue(locked_path.exists())
+        self.assertEqual(_live_features(manager), {"feature-a"})
+        self.assertFalse((manager.worktrees_base / "feature-b").exists())
+
+    def test_git_removals_are_serialized(self):
+        """Test que les `git worktree remove` simultanés passent un par un."""
+        manager = WorktreeManager(self.repo_path)
+        feature_ids = ["feature-a", "feature-b", "feature-c"]
+        manager.create_many(feature_ids, base_branch="main")
+        run_git = manager._run_git
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+
+        def tracking_run_git(args, capture=False):
+            if args[:2] != ["worktree", "remove"]:
+                return run_git(args, capture)
+            with lock:
+                overlaps.append(bool(running))
+                running.append(args)
+            try:
+                time.sleep(0.01)  # élargit la fenêtre de chevauchement
+                return run_git(args, capture)
+            finally:
+                with lock:
+                    running.remove(args)
+
+        with patch.object(manager, "_run_git", side_effect=tracking_run_git), \
+                ThreadPoolExecutor(max_workers=3) as executor:
+            removed = list(executor.map(
+                lambda fid: manager.remove(fid, force=True), feature_ids
+            ))
+
+        self.assertEqual(removed, [True] * 3)
+        self.assertEqual(overlaps, [False] * 3)
+        self.assertEqual(_live_features(manager), set())
+
+    def test_branch_index_follows_active_worktrees(self):
+        """Test que l'index branche -> feature suit les créations/suppressions."""
+        manager = WorktreeManager(self.repo_path)
+        manager.create("feature-a", base_branch="main")
+        manager.create("feature-b", base_branch="main")
+
+        self.assertEqual(
+            manager._branch_to_fid,
+            {"feature/feature-a": "feature-a", "feature/feature-b": "feature-b"}
+        )
 
+        manager.remove("feature-a", force=True)
+        self.assertEqual(manager._branch_to_fid, {"feature/feature-b": "feature-b"})
+
+    @unittest.skipIf(
+        _GIT_VERSION < (2, 30),
+        "détection des branches mergées peu fiable avant git 2.30"
+    )
     def test_cleanup_merged(self):
         """Test la suppression des worktrees mergés."""
         manager = WorktreeManager(self.repo_path)
@@ -296,33 +879,23 @@ class TestWorktreeManager(unittest.TestCase):
         manager.create("unmerged-feature", base_branch="main")
 
         # Créer un commit dans le premier worktree
-        test_file = worktree_path / "test.txt"
-        test_file.write_text("test")
-
-        subprocess.run(
-            ["git", "add", "test.txt"],
-            cwd=worktree_path,
-            capture_output=True,
-            check=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Test commit"],
-            cwd=worktree_path,
-            capture_output=True,
-            check=True
-        )
+        _commit_file(worktree_path, "test.txt", "test", "Test commit")
 
         # Revenir sur main et merger avec --no-ff pour créer un merge commit
-        subprocess.run(
-            ["git", "checkout", "main"],
+        _run(
+            [_GIT, "checkout", "main"],
             cwd=self.repo_path,
-            capture_output=True,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
             check=True
         )
-        subprocess.run(
-            ["git", "merge", "--no-ff", "-m", "Merge merged-feature", "feature/merged-feature"],
+        _run(
+            [_GIT, "merge", "--no-ff", "-m", "Merge merged-feature", "feature/merged-feature"],
             cwd=self.repo_path,
-            capture_output=True,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
             check=True
         )
 
@@ -339,6 +912,36 @@ class TestWorktreeManager(unittest.TestCase):
         if "merged-feature" in cleaned:
             self.assertFalse(manager.exists("merged-feature"))
 
+    def test_cleanup_merged_checked_out_branch(self):
+        """Test qu'une branche mergée encore checkoutée dans son worktree est nettoyée."""
+        manager = WorktreeManager(self.repo_path)
+        worktree_path = manager.create("merged-feature", base_branch="main")
+
+        # Commiter CLAUDE.md pour que le worktree soit propre
+        _run(
+            [_GIT, "commit", "-am", "Feature commit"],
+            cwd=worktree_path,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            check=True
+        )
+        _run(
+            [_GIT, "merge", "--no-ff", "-m", "Merge", "feature/merged-feature"],
+            cwd=self.repo_path,
+            env=_GIT_ENV,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            check=True
+        )
+
+        cleaned = manager.cleanup_merged("main")
+
+        self.assertEqual(cleaned, ["merged-feature"])
+        self.assertFalse(manager.exists("merged-feature"))
+        # La branche est supprimée avec le worktree
+        self.assertFalse(manager._object_exists("feature/merged-feature"))
+
 
 if __name__ == "__main__":
     unittest.main()